@@ -0,0 +1,79 @@
+"""
+Бенчмарк накладных расходов фреймворка на один запрос: шаги клиентов и шаги проверок Allure.
+
+Запросы уходят в httpx.MockTransport, поэтому сеть и сервер в замер не попадают. Логирование и запись
+покрытия отключены: они одинаковы в обоих режимах и только зашумляют результат.
+
+Запуск:
+    python -m benchmarks.allure_overhead --requests 5000
+"""
+import argparse
+import logging
+import time
+from http import HTTPStatus
+
+from httpx import Client, MockTransport, Request, Response
+
+from clients.courses.courses_client import CoursesClient
+from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from config import settings
+from tools.allure.steps import configure_allure_mode
+from tools.assertions.base import assert_status_code, assert_equal
+
+
+COURSE_ID = "7f2b4c1e-0000-4000-8000-000000000000"
+
+
+def handle_request(request: Request) -> Response:
+    return Response(HTTPStatus.OK, json={"course": {"id": COURSE_ID}})
+
+
+def build_courses_client() -> CoursesClient:
+    return CoursesClient(client=Client(
+        base_url="http://benchmark.local",
+        transport=MockTransport(handle_request),
+        event_hooks={
+            "request": [curl_event_hook, log_request_event_hook],
+            "response": [log_response_event_hook]
+        }
+    ))
+
+
+def run(courses_client: CoursesClient, requests: int) -> float:
+    """
+    :return: Среднее время одной итерации (запрос + две проверки) в микросекундах.
+    """
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        response = courses_client.get_course_api(COURSE_ID)
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_equal(response.json()["course"]["id"], COURSE_ID, name="id")
+
+    return (time.perf_counter() - started_at) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Накладные расходы Allure на один запрос")
+    parser.add_argument("--requests", type=int, default=2000, help="Количество запросов в каждом режиме")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    settings.coverage.enabled = False
+
+    courses_client = build_courses_client()
+    results: dict[str, float] = {}
+    for name, fast_mode in (("allure", False), ("fast", True)):
+        settings.allure_fast_mode = fast_mode
+        configure_allure_mode()
+        run(courses_client, min(200, args.requests))  # прогрев
+        results[name] = run(courses_client, args.requests)
+
+    print(f"Запросов в каждом режиме: {args.requests}")
+    print(f"С шагами Allure:  {results['allure']:.1f} мкс/запрос")
+    print(f"Быстрый режим:    {results['fast']:.1f} мкс/запрос")
+    print(f"Экономия:         {results['allure'] - results['fast']:.1f} мкс/запрос "
+          f"({(1 - results['fast'] / results['allure']) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
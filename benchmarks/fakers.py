@@ -0,0 +1,54 @@
+"""
+Бенчмарк построения моделей запросов со случайными данными: генерация по одному значению через Faker
+против пулов tools/fakers.Fake (FAKERS.POOL_SIZE).
+
+Замеряется полное построение CreateUserRequestSchema, CreateCourseRequestSchema и CreateExerciseRequestSchema
+с default_factory из fake. Время наполнения пулов входит в замер.
+
+Запуск:
+    python -m benchmarks.fakers --models 20000 --pool-size 1024
+"""
+import argparse
+import time
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fakers import fake
+
+
+SCHEMAS = (CreateUserRequestSchema, CreateCourseRequestSchema, CreateExerciseRequestSchema)
+
+
+def run(schema: type, models: int) -> float:
+    """
+    :return: Количество построенных моделей в секунду.
+    """
+    started_at = time.perf_counter()
+    for _ in range(models):
+        schema()
+
+    return models / (time.perf_counter() - started_at)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Скорость построения моделей запросов с пулами Faker и без")
+    parser.add_argument("--models", type=int, default=5000, help="Количество моделей каждой схемы в каждом режиме")
+    parser.add_argument("--pool-size", type=int, default=1024, help="Размер пачки пула")
+    args = parser.parse_args()
+
+    print(f"Моделей каждой схемы в каждом режиме: {args.models}")
+    for schema in SCHEMAS:
+        results: dict[str, float] = {}
+        for name, pool_size in (("faker", 0), ("pool", args.pool_size)):
+            fake.pool_size = pool_size
+            fake.pools.clear()
+            run(schema, min(200, args.models))  # прогрев
+            results[name] = run(schema, args.models)
+
+        print(f"{schema.__name__:<30} Faker: {results['faker']:>9.0f} моделей/с   "
+              f"пулы: {results['pool']:>9.0f} моделей/с   x{results['pool'] / results['faker']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Бенчмарк загрузки файлов: размер файла x количество одновременных загрузок через FilesClient.create_file_api.
+
+Для каждой комбинации замеряются задержки запросов (p50/p90/p99), запросов и байт в секунду и доля ошибок.
+Файлы генерируются детерминированно (tools/generated_files.py), поэтому при том же сиде прогоны сравнимы.
+
+Загрузки идут от имени нового пользователя. По умолчанию — в локальный stand-in сервер (tools/stand_in), который
+не хранит содержимое файлов: бенчмарк работает без сети и сервиса и измеряет накладные расходы клиента и loopback.
+С --target server загрузки идут в settings.http_client.url.
+
+Запуск:
+    python -m benchmarks.uploads --sizes small,medium,large --concurrency 1,4,16 --requests 20
+    python -m benchmarks.uploads --target server --allure
+"""
+import argparse
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from allure_commons.model2 import Status
+from allure_commons.types import AttachmentType
+from pydantic import BaseModel, HttpUrl
+
+from clients.files.files_client import FilesClient, get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from tools.allure.features import AllureFeature
+from tools.allure.results import write_allure_result
+from tools.allure.steps import configure_allure_mode
+from tools.generated_files import FileSizeClass, GeneratedFileKind, get_generated_file
+from tools.stand_in.app import StandInApp
+from tools.stand_in.server import StandInHTTPServer
+
+
+class UploadBenchmarkCellSchema(BaseModel):
+    """
+    Результат одной комбинации размер файла x количество одновременных загрузок.
+    """
+    size: int  # размер файла в байтах
+    concurrency: int  # количество одновременных загрузок
+    requests: int  # количество запросов
+    errors: dict[str, int] = {}  # количество ошибок по статус-коду или типу исключения
+    elapsed: float  # время всех запросов в секундах
+    latency_min: float  # задержки запросов в миллисекундах
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+    latency_max: float
+
+    @property
+    def successful(self) -> int:
+        return self.requests - sum(self.errors.values())
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.successful / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.successful * self.size / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.size:>11} Б x {self.concurrency:>3}: {self.requests_per_second:>8.1f} запросов/с, "
+            f"{self.bytes_per_second / 1024 / 1024:>8.1f} МБ/с, p50 {self.latency_p50:>8.1f} мс, "
+            f"p99 {self.latency_p99:>8.1f} мс, ошибок {self.error_rate:.1%}"
+        )
+
+
+class UploadBenchmarkReportSchema(BaseModel):
+    target: str  # stand-in или URL сервиса
+    kind: GeneratedFileKind
+    seed: int
+    requests: int  # запросов в каждой комбинации
+    cells: list[UploadBenchmarkCellSchema] = []
+
+    def to_json(self) -> str:
+        """
+        :return: отчет в JSON, включая вычисляемые метрики комбинаций
+        """
+        report = self.model_dump(mode="json")
+        for cell, dumped in zip(self.cells, report["cells"]):
+            dumped.update(
+                requests_per_second=cell.requests_per_second,
+                bytes_per_second=cell.bytes_per_second,
+                error_rate=cell.error_rate
+            )
+
+        return json.dumps(report, indent=2, ensure_ascii=False)
+
+
+def run_cell(files_client: FilesClient, file: Path, concurrency: int, requests: int) -> UploadBenchmarkCellSchema:
+    latencies: list[float] = []
+    errors: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def upload(_: int):
+        request = CreateFileRequestSchema(upload_file=file)
+        started_at = time.perf_counter()
+        try:
+            response = files_client.create_file_api(request)
+            error = None if response.is_success else str(response.status_code)
+        except Exception as exception:
+            error = type(exception).__name__
+        latency = (time.perf_counter() - started_at) * 1000
+
+        with lock:
+            latencies.append(latency)
+            if error:
+                errors[error] += 1
+
+    upload(0)  # прогрев: соединение и кэш загружаемого файла
+    latencies.clear()
+    errors.clear()
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upload-benchmark") as executor:
+        list(executor.map(upload, range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    # quantiles[49] — p50, quantiles[89] — p90, quantiles[98] — p99
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return UploadBenchmarkCellSchema(
+        size=file.stat().st_size,
+        concurrency=concurrency,
+        requests=requests,
+        errors=dict(errors),
+        elapsed=elapsed,
+        latency_min=min(latencies),
+        latency_p50=quantiles[49],
+        latency_p90=quantiles[89],
+        latency_p99=quantiles[98],
+        latency_max=max(latencies)
+    )
+
+
+def build_server_files_client() -> FilesClient:
+    # Вне pytest созданные пользователь и файлы не удаляются
+    request = CreateUserRequestSchema()
+    get_public_users_client().create_user(request)
+    return get_files_client(AuthenticationUserSchema(email=request.email, password=request.password))
+
+
+def run(
+        sizes: list[int],
+        concurrency_levels: list[int],
+        requests: int,
+        kind: GeneratedFileKind,
+        seed: int,
+        files_client: FilesClient,
+        target: str
+) -> UploadBenchmarkReportSchema:
+    report = UploadBenchmarkReportSchema(target=target, kind=kind, seed=seed, requests=requests)
+    for size in sizes:
+        file = get_generated_file(size, kind, seed)
+        for concurrency in concurrency_levels:
+            cell = run_cell(files_client, file, concurrency, requests)
+            report.cells.append(cell)
+            print(cell)
+
+    return report
+
+
+def parse_size(value: str) -> int:
+    """
+    :param value: класс размера (small, medium, large, huge) или размер в байтах
+    """
+    try:
+        return FileSizeClass(value).size
+    except ValueError:
+        return int(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пропускная способность загрузки файлов по размерам и конкурентности")
+    parser.add_argument("--sizes", default="small,medium,large", help="Классы размеров (small, medium, large, huge) или размеры в байтах через запятую")
+    parser.add_argument("--concurrency", default="1,4,16", help="Количества одновременных загрузок через запятую")
+    parser.add_argument("--requests", type=int, default=20, help="Количество запросов в каждой комбинации")
+    parser.add_argument("--kind", type=GeneratedFileKind, default=GeneratedFileKind.PNG, help="Тип файлов: png, sparse_png, random")
+    parser.add_argument("--seed", type=int, default=settings.test_data.generated_files_seed, help="Сид содержимого файлов")
+    parser.add_argument("--target", choices=("stand-in", "server"), default="stand-in", help="Куда загружать файлы")
+    parser.add_argument("--output", type=Path, default=Path("./upload-benchmark.json"), help="Куда сохранить отчет")
+    parser.add_argument("--allure", action="store_true", help="Сохранить отчет вложением в settings.allure_results_dir")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    concurrency_levels = [int(concurrency) for concurrency in args.concurrency.split(",")]
+
+    logging.disable(logging.CRITICAL)
+    settings.coverage.enabled = False
+    settings.allure_fast_mode = True
+    configure_allure_mode()
+
+    server: StandInHTTPServer | None = None
+    if args.target == "stand-in":
+        server = StandInHTTPServer(StandInApp(keep_file_content=False)).start()
+        settings.http_client.url = HttpUrl(server.url)
+
+    target = settings.http_client.client_url
+    files_client = build_server_files_client()
+
+    started_at = time.time()
+    try:
+        report = run(sizes, concurrency_levels, args.requests, args.kind, args.seed, files_client, target)
+    finally:
+        files_client.client.close()
+        if server:
+            server.stop()
+
+    report_json = report.to_json()
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(report_json, encoding="utf-8")
+    print(f"Отчет сохранен в {args.output}")
+
+    if args.allure:
+        write_allure_result(
+            name="Бенчмарк загрузки файлов",
+            attachments={"upload-benchmark.json": (report_json, AttachmentType.JSON)},
+            feature=AllureFeature.FILES,
+            parameters={"target": target, "sizes": args.sizes, "concurrency": args.concurrency, "requests": str(args.requests)},
+            status=Status.FAILED if any(cell.errors for cell in report.cells) else Status.PASSED,
+            started_at=started_at
+        )
+        print(f"Результат Allure сохранен в {settings.allure_results_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
-from httpx import Client, URL, QueryParams, Response
+from httpx import Client, AsyncClient, URL, QueryParams
 from typing import Any
 
-from httpx._types import RequestData, RequestFiles
-import allure
+from httpx._types import RequestContent, RequestData, RequestFiles, HeaderTypes
+
+from clients.api_response import APIResponse
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from tools.allure.steps import step, async_step
 
 
 class APIClient:
@@ -14,26 +17,35 @@ class APIClient:
         """
         self.client = client # сохраняем переданный клиент в атрибуте класса для дальнейшего использования в методах класса и его потомках
 
+    @property
+    def user(self) -> AuthenticationUserSchema | None:
+        """
+        :return: Пользователь, от имени которого работает клиент (None для публичного клиента).
+        """
+        return getattr(self.client.auth, "user", None)
+
 
-    @allure.step("Делаем GET запрос к {url}")
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response: # метод get принимает URL-адрес эндпоинта и параметры запроса и возвращает объект Response с данными ответа
+    @step("Делаем GET запрос к {url}")
+    def get(self, url: URL | str, params: QueryParams | None = None) -> APIResponse: # метод get принимает URL-адрес эндпоинта и параметры запроса и возвращает объект Response с данными ответа
         """
         Выполняет GET-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param params: GET-параметры запроса (например, ?key=value).
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.get(url, params=params)
+        return APIResponse(self.client.get(url, params=params))
 
 
-    @allure.step("Делаем POST запрос к {url}")
+    @step("Делаем POST запрос к {url}")
     def post(
             self, url: URL | str,
             json: Any | None = None,
             data: RequestData | None = None,
-            files: RequestFiles | None = None
-    ) -> Response:
+            files: RequestFiles | None = None,
+            content: RequestContent | None = None,
+            headers: HeaderTypes | None = None
+    ) -> APIResponse:
         """
         Выполняет POST-запрос.
 
@@ -41,29 +53,106 @@ class APIClient:
         :param json: Данные в формате JSON.
         :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
         :param files: Файлы для загрузки на сервер.
-        :return: Объект Response с данными ответа.
+        :param content: Готовое тело запроса (байты или поток, например MultipartFileBody.stream()).
+        :param headers: Дополнительные заголовки запроса.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        return APIResponse(self.client.post(url, json=json, data=data, files=files, content=content, headers=headers))
 
 
-    @allure.step("Делаем PATCH запрос к {url}")
-    def patch(self, url: URL | str, json: Any | None = None) -> Response:
+    @step("Делаем PATCH запрос к {url}")
+    def patch(self, url: URL | str, json: Any | None = None) -> APIResponse:
         """
         Выполняет PATCH-запрос (частичное обновление данных).
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные для обновления в формате JSON.
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.patch(url, json=json)
+        return APIResponse(self.client.patch(url, json=json))
 
 
-    @allure.step("Делаем DELETE запрос к {url}")
-    def delete(self, url: URL | str) -> Response:
+    @step("Делаем DELETE запрос к {url}")
+    def delete(self, url: URL | str) -> APIResponse:
         """
         Выполняет DELETE-запрос (удаление данных).
 
         :param url: URL-адрес эндпоинта.
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
+        """
+        return APIResponse(self.client.delete(url))
+
+
+class AsyncAPIClient:
+    def __init__(self, client: AsyncClient): # асинхронный двойник APIClient, принимает экземпляр httpx.AsyncClient
+        """
+        Базовый асинхронный API клиент, принимающий объект httpx.AsyncClient.
+
+        :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+        """
+        self.client = client
+
+    @property
+    def user(self) -> AuthenticationUserSchema | None:
+        """
+        :return: Пользователь, от имени которого работает клиент (None для публичного клиента).
+        """
+        return getattr(self.client.auth, "user", None)
+
+
+    @async_step("Делаем GET запрос к {url}")
+    async def get(self, url: URL | str, params: QueryParams | None = None) -> APIResponse:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект APIResponse с данными ответа.
+        """
+        return APIResponse(await self.client.get(url, params=params))
+
+
+    @async_step("Делаем POST запрос к {url}")
+    async def post(
+            self, url: URL | str,
+            json: Any | None = None,
+            data: RequestData | None = None,
+            files: RequestFiles | None = None,
+            content: RequestContent | None = None,
+            headers: HeaderTypes | None = None
+    ) -> APIResponse:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
+        :param files: Файлы для загрузки на сервер.
+        :param content: Готовое тело запроса (байты или поток, например MultipartFileBody.stream()).
+        :param headers: Дополнительные заголовки запроса.
+        :return: Объект APIResponse с данными ответа.
+        """
+        return APIResponse(await self.client.post(url, json=json, data=data, files=files, content=content, headers=headers))
+
+
+    @async_step("Делаем PATCH запрос к {url}")
+    async def patch(self, url: URL | str, json: Any | None = None) -> APIResponse:
+        """
+        Выполняет асинхронный PATCH-запрос (частичное обновление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для обновления в формате JSON.
+        :return: Объект APIResponse с данными ответа.
+        """
+        return APIResponse(await self.client.patch(url, json=json))
+
+
+    @async_step("Делаем DELETE запрос к {url}")
+    async def delete(self, url: URL | str) -> APIResponse:
+        """
+        Выполняет асинхронный DELETE-запрос (удаление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.delete(url)
+        return APIResponse(await self.client.delete(url))
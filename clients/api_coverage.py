@@ -1,6 +1,162 @@
+import functools
+import inspect
+import re
+import threading
+from typing import Any, Awaitable, Callable
+
+from httpx import Request, RequestNotRead, Response
 from swagger_coverage_tool import SwaggerCoverageTracker
+from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+from config import settings
+
+
+
+
+UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+
+
+class RouteTemplates:
+    """
+    Шаблоны эндпоинтов, для которых собирается покрытие (например, /api/v1/courses/{course_id}).
+
+    Переводят путь запроса обратно в шаблон, чтобы метрики запросов группировались по маршрутам, а не по ID.
+    """
+
+    def __init__(self):
+        self.patterns: list[tuple[re.Pattern, str]] = []
+        self._lock = threading.Lock()
+
+    def add(self, template: str):
+        with self._lock:
+            if any(known == template for _, known in self.patterns):
+                return
+
+            pattern = re.compile("^" + re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template)) + "/?$")
+            # Шаблоны без параметров проверяются первыми: /api/v1/users/me не должен стать /api/v1/users/{user_id}
+            self.patterns = sorted([*self.patterns, (pattern, template)], key=lambda item: item[1].count("{"))
+
+    def match(self, path: str) -> str:
+        """
+        :param path: путь запроса
+        :return: шаблон эндпоинта или путь, в котором UUID заменены на {uuid}, если шаблон не найден
+        """
+        for pattern, template in self.patterns:
+            if pattern.match(path):
+                return template
+
+        return UUID_PATTERN.sub("{uuid}", path)
+
+
+route_templates = RouteTemplates()
+
+
+class RoutesCoverageTracker(SwaggerCoverageTracker):
+    """
+    Трекер покрытия, запоминающий шаблоны эндпоинтов своих декораторов в route_templates.
+    """
+
+    def track_coverage_httpx(self, endpoint: str):
+        route_templates.add(endpoint)
+        return super().track_coverage_httpx(endpoint)
+
+    def build_endpoint_coverage_for_httpx(self, endpoint: str, response: Response) -> EndpointCoverage | None:
+        if not settings.coverage.enabled:
+            return None  # нечего сохранять: декораторы трекера пропускают запрос
+
+        return super().build_endpoint_coverage_for_httpx(endpoint, response)
+
+
+tracker = RoutesCoverageTracker(service="api-course") # передаем ключ сервиса
+
+
+class CoverageRequestView:
+    """
+    Запрос для трекера покрытия: трекеру нужен только признак наличия тела (bool(request.read())).
+
+    Потоковое тело (например, загрузка файла) повторно не читается: признак берется из заголовков.
+    """
+
+    def __init__(self, request: Request):
+        self.request = request
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.request, name)
+
+    def read(self) -> bytes:
+        try:
+            return self.request.content
+        except RequestNotRead:
+            has_body = self.request.headers.get("content-length", "0") != "0" or "transfer-encoding" in self.request.headers
+            return b"<stream>" if has_body else b""
+
+
+class CoverageResponseView:
+    def __init__(self, response: Response):
+        self.response = response
+        self.request = CoverageRequestView(response.request)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.response, name)
+
+
+def save_coverage(endpoint: str, response: Response):
+    """
+    Сохраняет покрытие эндпоинта по ответу, не читая потоковое тело запроса.
+
+    :param endpoint: Шаблон эндпоинта, например /api/v1/courses/{course_id}.
+    :param response: Ответ (httpx.Response или APIResponse).
+    """
+    if coverage := tracker.build_endpoint_coverage_for_httpx(endpoint, CoverageResponseView(response)):
+        tracker.storage.save(coverage)
+
+
+def track_coverage_httpx(endpoint: str):
+    """
+    Аналог tracker.track_coverage_httpx для запросов с потоковым телом.
+
+    Декоратор трекера вызывает request.read(), что для потокового тела означает повторное чтение
+    (и загрузку в память) всего файла уже после отправки.
+
+    :param endpoint: Шаблон эндпоинта, например /api/v1/files.
+    :return: Декоратор для метода клиента.
+    """
+    route_templates.add(endpoint)
+
+    def wrapper(func: Callable[..., Response]):
+        @functools.wraps(func)
+        def inner(*args, **kwargs) -> Response:
+            response = func(*args, **kwargs)
+            save_coverage(endpoint, response)
+            return response
+
+        return inner
+
+    return wrapper
+
+
+def track_coverage_httpx_async(endpoint: str):
+    """
+    Асинхронный аналог tracker.track_coverage_httpx.
+
+    Декоратор трекера вызывает функцию синхронно и получает корутину вместо httpx.Response,
+    поэтому для async-методов покрытие собирается после await.
+
+    :param endpoint: Шаблон эндпоинта, например /api/v1/courses/{course_id}.
+    :return: Декоратор для асинхронного метода клиента.
+    """
+    route_templates.add(endpoint)
 
+    def wrapper(func: Callable[..., Awaitable[Response]]):
+        signature = inspect.signature(func)
 
+        @functools.wraps(func)
+        async def inner(*args, **kwargs) -> Response:
+            response = await func(*args, **kwargs)
+            save_coverage(endpoint, response)
+            return response
 
+        inner.__signature__ = signature
+        return inner
 
-tracker = SwaggerCoverageTracker(service="api-course") # передаем ключ сервиса
\ No newline at end of file
+    return wrapper
@@ -0,0 +1,74 @@
+import json
+from typing import Any, TypeVar
+
+from httpx import Response
+from pydantic import BaseModel
+
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+_NOT_PARSED = object()  # маркер: тело ответа еще не разбиралось
+
+
+class APIResponse:
+    """
+    Обертка над httpx.Response, которая разбирает тело ответа не более одного раза.
+
+    Все атрибуты httpx.Response (status_code, headers, request, text и т.д.) доступны напрямую,
+    а json() и model() кэшируют результат, поэтому типизированная модель и валидация
+    JSON схемы используют один и тот же разобранный JSON.
+    """
+
+    __slots__ = ("response", "_json", "_models")
+
+    def __init__(self, response: Response):
+        """
+        :param response: исходный объект httpx.Response
+        """
+        self.response = response
+        self._json: Any = _NOT_PARSED
+        self._models: dict[type[BaseModel], BaseModel] = {}
+
+
+    def __getattr__(self, name: str) -> Any:
+        # Все, что не переопределено в обертке, берем из httpx.Response
+        return getattr(self.response, name)
+
+
+    def __repr__(self) -> str:
+        return f"<APIResponse [{self.response.status_code}]>"
+
+
+    @property
+    def content(self) -> bytes:
+        """
+        :return: Тело ответа в виде байтов (без декодирования в строку).
+        """
+        return self.response.content
+
+
+    def json(self) -> Any:
+        """
+        Разбирает тело ответа как JSON один раз и кэширует результат.
+
+        :return: Разобранный JSON (dict, list и т.д.).
+        """
+        if self._json is _NOT_PARSED:
+            # json.loads принимает bytes и сам определяет кодировку UTF-8/16/32, без промежуточного response.text
+            self._json = json.loads(self.response.content)
+
+        return self._json
+
+
+    def model(self, schema: type[SchemaT]) -> SchemaT:
+        """
+        Возвращает тело ответа в виде Pydantic модели. Модель строится из кэшированного JSON один раз на схему.
+
+        :param schema: Класс Pydantic модели ответа.
+        :return: Экземпляр модели schema.
+        """
+        if (model := self._models.get(schema)) is None:
+            model = self._models[schema] = schema.model_validate(self.json())
+
+        return model
@@ -1,11 +1,11 @@
-from clients.api_client import APIClient   #  импортируем базовый класс ApiClient для выполнения HTTP-запросов
-from httpx import Response  # импортируем класс Response из библиотеки httpx для работы с ответами на HTTP-запросы
-from clients.public_http_builder import get_public_http_client
+from clients.api_client import APIClient, AsyncAPIClient   #  импортируем базовый класс ApiClient для выполнения HTTP-запросов
+from clients.api_response import APIResponse  # импортируем обертку над httpx.Response, которая разбирает тело ответа один раз
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
 from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema,  RefreshRequestSchema  # импортируем схемы для валидации данных запросов и ответов из authentication_shema.py
-import allure
 
 from tools.routes import APIRoutes
-from clients.api_coverage import tracker
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from tools.allure.steps import step, async_step
 
 
 class AuthenticationClient(APIClient): # создаем класс AuthenticationClient, который наследуется от ApiClient для выполнения запросов к API авторизации
@@ -13,25 +13,25 @@ class AuthenticationClient(APIClient): # создаем класс Authenticatio
     Клиент для работы с /api/v1/authentication
     """
 
-    @allure.step('Аутентификация пользователя')
+    @step('Аутентификация пользователя')
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
-    def login_api(self, request: LoginRequestSchema) -> Response: # создаем метод для отправки запроса на авторизацию
+    def login_api(self, request: LoginRequestSchema) -> APIResponse: # создаем метод для отправки запроса на авторизацию
         """
         Метод выполняет аутентификацию пользователя.
 
         :param request: Словарь с email и password.
-        :return: Ответ от сервера в виде объекта httpx.Response.
+        :return: Ответ от сервера в виде объекта APIResponse.
         """
         return self.post(f"{APIRoutes.AUTHENTICATION}/login", json = request.model_dump(by_alias=True)) # отправляем POST-запрос на URL /api/v1/authentication/login с данными запроса в формате JSON. Используем метод model_dump из Pydantic для преобразования схемы запроса в словарь с учетом псевдонимов полей (by_alias=True).
 
-    @allure.step('Обновление токена аутентификации')
+    @step('Обновление токена аутентификации')
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
-    def refresh_api(self, request: RefreshRequestSchema) -> Response: # создаем метод для отправки запроса на обновление токена
+    def refresh_api(self, request: RefreshRequestSchema) -> APIResponse: # создаем метод для отправки запроса на обновление токена
         """
         Метод обновляет токен авторизации.
 
         :param request: Словарь с refreshToken.
-        :return: Ответ от сервера в виде объекта httpx.Response.
+        :return: Ответ от сервера в виде объекта APIResponse.
         """
         return self.post(f"{APIRoutes.AUTHENTICATION}/refresh", json = request.model_dump(by_alias=True)) # отправляем POST-запрос на URL /api/v1/authentication/refresh с данными запроса в формате JSON. Используем метод model_dump из Pydantic для преобразования схемы запроса в словарь с учетом псевдонимов полей (by_alias=True).
 
@@ -41,7 +41,7 @@ class AuthenticationClient(APIClient): # создаем класс Authenticatio
         Метод выполняет аутентификацию пользователя и возвращает токен авторизации.
         """
         response = self.login_api(request) # вызываем метод для отправки запросана авторизацию и получаем ответ
-        return LoginResponseSchema.model_validate_json(response.text) # преобразуем ответ в объект LoginResponseSchema с помощью метода model_validate_json из Pydantic
+        return response.model(LoginResponseSchema)  # Тело ответа разбирается один раз и кэшируется в APIResponse
 
 
 # Добавляем builder для AuthenticationClient
@@ -52,3 +52,49 @@ def get_authentication_client() -> AuthenticationClient:
     :return: AuthenticationClient.
     """
     return AuthenticationClient(client = get_public_http_client())  # Настройка клиента с базовым URL и таймаутом
+
+
+class AsyncAuthenticationClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/authentication
+    """
+
+    @async_step('Аутентификация пользователя')
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/login")
+    async def login_api(self, request: LoginRequestSchema) -> APIResponse:
+        """
+        Метод выполняет аутентификацию пользователя.
+
+        :param request: Словарь с email и password.
+        :return: Ответ от сервера в виде объекта APIResponse.
+        """
+        return await self.post(f"{APIRoutes.AUTHENTICATION}/login", json=request.model_dump(by_alias=True))
+
+    @async_step('Обновление токена аутентификации')
+    @track_coverage_httpx_async(f"{APIRoutes.AUTHENTICATION}/refresh")
+    async def refresh_api(self, request: RefreshRequestSchema) -> APIResponse:
+        """
+        Метод обновляет токен авторизации.
+
+        :param request: Словарь с refreshToken.
+        :return: Ответ от сервера в виде объекта APIResponse.
+        """
+        return await self.post(f"{APIRoutes.AUTHENTICATION}/refresh", json=request.model_dump(by_alias=True))
+
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        """
+        Метод выполняет аутентификацию пользователя и возвращает токен авторизации.
+        """
+        response = await self.login_api(request)
+        return response.model(LoginResponseSchema)
+
+
+# Добавляем builder для AsyncAuthenticationClient
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создает экземпляр AsyncAuthenticationClient с уже настроенным HTTP-клиентом.
+
+    :return: AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from tools.fakers import fake
 
 class TokenSchema(BaseModel): # создаем модель данных для токена авторизации, наследуясь от BaseModel Pydantic
@@ -29,4 +29,14 @@ class RefreshRequestSchema(BaseModel): # создаем словарь с фик
     """
     Описание структуры запроса для обновления токена.
     """
-    refresh_token: str = Field(alias="refreshToken", default_factory=fake.sentence()) # ключ refreshToken должен быть строкой, по умолчанию используется функция fake.sentence() для генерации случайной строки
+    model_config = ConfigDict(populate_by_name=True)  # Настройка Pydantic для использования имен полей как по алиасу так и по имени
+
+    refresh_token: str = Field(alias="refreshToken", default_factory=fake.sentence) # ключ refreshToken должен быть строкой, по умолчанию используется функция fake.sentence() для генерации случайной строки
+
+
+class AuthenticationUserSchema(BaseModel, frozen=True):  # Используем frozen=True для создания неизменяемого объекта, что позволяет использовать его в качестве ключа реестра клиентов
+    """
+    Описание пользователя, от имени которого работают приватные клиенты.
+    """
+    email: str
+    password: str
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+from http import HTTPStatus
+from typing import AsyncGenerator, Generator
+
+from httpx import Auth, Request, Response
+from pydantic import ValidationError
+
+from clients.authentication.authentication_schema import AuthenticationUserSchema
+from clients.authentication.tokens_storage import StoredTokenSchema
+from clients.authentication.user_tokens import refresh_user_token, async_refresh_user_token
+from config import settings
+
+
+class BearerAuth(Auth):
+    """
+    Авторизация по токену, которая передается в каждом запросе, а не в заголовках клиента.
+
+    Благодаря этому клиенты разных пользователей могут работать поверх одного пула соединений.
+    Токен обновляется через /api/v1/authentication/refresh заранее, за refresh_ahead секунд до истечения,
+    а запрос, получивший 401, повторяется один раз с обновленным токеном.
+    Параллельные запросы одного пользователя выполняют обновление один раз: остальные ждут блокировку
+    и видят, что токен уже сменился.
+    """
+
+    def __init__(self, user: AuthenticationUserSchema, token: StoredTokenSchema):
+        """
+        :param user: Пользователь, от имени которого выполняются запросы (нужен для логина, если refresh не удался).
+        :param token: Текущие токены пользователя.
+        """
+        self.user = user
+        self.token = token
+        self._lock = threading.Lock()
+        self._async_lock: asyncio.Lock | None = None
+
+    def _set_authorization(self, request: Request, token: StoredTokenSchema):
+        request.headers["Authorization"] = f"Bearer {token.access_token}"
+
+    def _is_refresh_needed(self, token: StoredTokenSchema) -> bool:
+        return token.is_access_token_expired(settings.tokens_storage.refresh_ahead)
+
+    def _refresh(self, stale: StoredTokenSchema) -> StoredTokenSchema:
+        with self._lock:
+            if self.token.access_token == stale.access_token:  # токен еще не обновили в другом потоке
+                self.token = refresh_user_token(self.user, stale)
+
+            return self.token
+
+    async def _async_refresh(self, stale: StoredTokenSchema) -> StoredTokenSchema:
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            if self.token.access_token == stale.access_token:  # токен еще не обновила другая корутина
+                self.token = await async_refresh_user_token(self.user, stale)
+
+            return self.token
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        token = self.token
+        if self._is_refresh_needed(token):
+            token = self._refresh(token)
+
+        self._set_authorization(request, token)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            try:
+                token = self._refresh(token)
+            except ValidationError:  # логин тоже отклонен (например, пользователь удален) — отдаем исходный 401
+                return
+
+            self._set_authorization(request, token)
+            yield request
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        token = self.token
+        if self._is_refresh_needed(token):
+            token = await self._async_refresh(token)
+
+        self._set_authorization(request, token)
+        response = yield request
+
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            try:
+                token = await self._async_refresh(token)
+            except ValidationError:  # логин тоже отклонен (например, пользователь удален) — отдаем исходный 401
+                return
+
+            self._set_authorization(request, token)
+            yield request
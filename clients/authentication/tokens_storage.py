@@ -0,0 +1,154 @@
+import base64
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from clients.authentication.authentication_schema import TokenSchema
+from config import settings
+
+
+def get_token_expires_at(token: str, default_ttl: float) -> float:
+    """
+    Определяет момент истечения JWT токена по claim 'exp' (подпись не проверяется).
+
+    :param token: JWT токен.
+    :param default_ttl: Время жизни в секундах, если claim 'exp' прочитать не удалось.
+    :return: Unix-время истечения токена.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + default_ttl
+
+
+class StoredTokenSchema(BaseModel):
+    """
+    Описание структуры токенов пользователя в хранилище.
+    """
+    access_token: str
+    refresh_token: str
+    access_expires_at: float  # unix-время истечения access токена
+    refresh_expires_at: float  # unix-время истечения refresh токена
+
+    @classmethod
+    def from_token(cls, token: TokenSchema) -> "StoredTokenSchema":
+        """
+        Создает запись хранилища из токенов, полученных от API.
+
+        :param token: Токены из ответа login/refresh.
+        :return: Экземпляр StoredTokenSchema.
+        """
+        return cls(
+            access_token=token.access_token,
+            refresh_token=token.refresh_token,
+            access_expires_at=get_token_expires_at(token.access_token, settings.tokens_storage.access_token_ttl),
+            refresh_expires_at=get_token_expires_at(token.refresh_token, settings.tokens_storage.refresh_token_ttl)
+        )
+
+    def is_access_token_expired(self, margin: float = 0) -> bool:
+        """
+        :param margin: Запас в секундах: токен считается истекшим заранее.
+        :return: True, если access токен истек (или истечет в пределах margin).
+        """
+        return self.access_expires_at - margin <= time.time()
+
+
+class TokensStorage:
+    """
+    Хранилище токенов в SQLite, общее для всех воркеров xdist и для повторных запусков.
+
+    Ключ записи — sha256 от email и пароля пользователя, пароль в хранилище не попадает.
+    SQLite сам блокирует файл при записи, поэтому дополнительных межпроцессных блокировок не нужно.
+    """
+
+    def __init__(self, file: Path):
+        """
+        :param file: Путь к файлу базы SQLite.
+        """
+        self.file = file
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(email: str, password: str) -> str:
+        return hashlib.sha256(f"{email}:{password}".encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.file, timeout=30)
+
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")  # читатели не блокируют писателей из других воркеров
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS tokens ("
+                        "key TEXT PRIMARY KEY, access_token TEXT NOT NULL, refresh_token TEXT NOT NULL, "
+                        "access_expires_at REAL NOT NULL, refresh_expires_at REAL NOT NULL)"
+                    )
+                    # Записи с истекшим refresh токеном уже бесполезны
+                    connection.execute("DELETE FROM tokens WHERE refresh_expires_at <= ?", (time.time(),))
+                    connection.commit()
+                    self._initialized = True
+
+        return connection
+
+    def get(self, email: str, password: str) -> StoredTokenSchema | None:
+        """
+        Возвращает токены пользователя, если в хранилище есть запись с неистекшим refresh токеном.
+
+        :param email: Email пользователя.
+        :param password: Пароль пользователя.
+        :return: StoredTokenSchema или None.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT access_token, refresh_token, access_expires_at, refresh_expires_at FROM tokens "
+                "WHERE key = ? AND refresh_expires_at > ?",
+                (self.build_key(email, password), time.time())
+            ).fetchone()
+        connection.close()
+
+        if row is None:
+            return None
+
+        access_token, refresh_token, access_expires_at, refresh_expires_at = row
+        return StoredTokenSchema(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            access_expires_at=access_expires_at,
+            refresh_expires_at=refresh_expires_at
+        )
+
+    def save(self, email: str, password: str, token: StoredTokenSchema):
+        """
+        Сохраняет (или заменяет) токены пользователя.
+
+        :param email: Email пользователя.
+        :param password: Пароль пользователя.
+        :param token: Токены пользователя.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.build_key(email, password),
+                    token.access_token,
+                    token.refresh_token,
+                    token.access_expires_at,
+                    token.refresh_expires_at
+                )
+            )
+        connection.close()
+
+
+tokens_storage = TokensStorage(settings.tokens_storage.file)
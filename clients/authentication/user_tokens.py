@@ -0,0 +1,157 @@
+from http import HTTPStatus
+
+from clients.api_response import APIResponse
+
+from clients.authentication.authentication_client import get_authentication_client, get_async_authentication_client
+from clients.authentication.authentication_schema import AuthenticationUserSchema, LoginRequestSchema, \
+    LoginResponseSchema, RefreshRequestSchema
+from clients.authentication.tokens_storage import tokens_storage, StoredTokenSchema
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger("USER_TOKENS")
+
+
+def get_stored_user_token(user: AuthenticationUserSchema) -> StoredTokenSchema | None:
+    """
+    Функция возвращает токены пользователя из хранилища, если оно включено.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :return: StoredTokenSchema (access токен может быть уже истекшим) или None
+    """
+    if not settings.tokens_storage.enabled:
+        return None
+
+    return tokens_storage.get(user.email, user.password)
+
+
+def save_user_token(user: AuthenticationUserSchema, login_response: LoginResponseSchema) -> StoredTokenSchema:
+    """
+    Функция сохраняет токены из ответа login/refresh в хранилище, если оно включено.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :param login_response: ответ на login или refresh
+    :return: StoredTokenSchema
+    """
+    token = StoredTokenSchema.from_token(login_response.token)
+    if settings.tokens_storage.enabled:
+        tokens_storage.save(user.email, user.password, token)
+
+    return token
+
+
+def get_fresher_stored_token(user: AuthenticationUserSchema, stale: StoredTokenSchema) -> StoredTokenSchema | None:
+    """
+    Функция проверяет, не обновил ли токены другой воркер, пока текущий ждал обновления.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :param stale: устаревшие токены текущего клиента
+    :return: более свежие неистекшие токены из хранилища или None
+    """
+    token = get_stored_user_token(user)
+    margin = settings.tokens_storage.refresh_ahead
+
+    if token and token.access_token != stale.access_token and not token.is_access_token_expired(margin):
+        return token
+
+    return None
+
+
+def parse_refresh_response(response: APIResponse) -> LoginResponseSchema | None:
+    """
+    :param response: ответ на /api/v1/authentication/refresh
+    :return: LoginResponseSchema или None, если refresh токен отклонен
+    """
+    if response.status_code != HTTPStatus.OK:
+        logger.warning(f"Не удалось обновить токен: {response.status_code} {response.reason_phrase}, выполняем логин")
+        return None
+
+    return response.model(LoginResponseSchema)
+
+
+def refresh_user_token(user: AuthenticationUserSchema, token: StoredTokenSchema) -> StoredTokenSchema:
+    """
+    Функция обновляет токены через refresh_api, а если refresh токен отклонен — через логин.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :param token: текущие (устаревшие) токены
+    :return: StoredTokenSchema с новыми токенами
+    """
+    if fresher := get_fresher_stored_token(user, token):
+        return fresher
+
+    authentication_client = get_authentication_client()
+
+    response = authentication_client.refresh_api(RefreshRequestSchema(refresh_token=token.refresh_token))
+    if (login_response := parse_refresh_response(response)) is None:
+        login_response = authentication_client.login(LoginRequestSchema(email=user.email, password=user.password))
+
+    return save_user_token(user, login_response)
+
+
+async def async_refresh_user_token(user: AuthenticationUserSchema, token: StoredTokenSchema) -> StoredTokenSchema:
+    """
+    Асинхронная версия refresh_user_token.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :param token: текущие (устаревшие) токены
+    :return: StoredTokenSchema с новыми токенами
+    """
+    if fresher := get_fresher_stored_token(user, token):
+        return fresher
+
+    authentication_client = get_async_authentication_client()
+
+    async with authentication_client.client:
+        response = await authentication_client.refresh_api(RefreshRequestSchema(refresh_token=token.refresh_token))
+        if (login_response := parse_refresh_response(response)) is None:
+            login_response = await authentication_client.login(
+                LoginRequestSchema(email=user.email, password=user.password)
+            )
+
+    return save_user_token(user, login_response)
+
+
+def get_user_token(user: AuthenticationUserSchema) -> StoredTokenSchema:
+    """
+    Функция возвращает токены пользователя: из хранилища, через refresh, если access токен истек,
+    и только при отсутствии записи — через логин.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :return: StoredTokenSchema
+    """
+    if token := get_stored_user_token(user):
+        if token.is_access_token_expired(settings.tokens_storage.refresh_ahead):
+            return refresh_user_token(user, token)
+
+        return token
+
+    authentication_client = get_authentication_client()
+
+    login_request = LoginRequestSchema(email=user.email, password=user.password)
+    login_response = authentication_client.login(login_request)
+
+    return save_user_token(user, login_response)
+
+
+async def get_async_user_token(user: AuthenticationUserSchema) -> StoredTokenSchema:
+    """
+    Асинхронная версия get_user_token.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :return: StoredTokenSchema
+    """
+    if token := get_stored_user_token(user):
+        if token.is_access_token_expired(settings.tokens_storage.refresh_ahead):
+            return await async_refresh_user_token(user, token)
+
+        return token
+
+    authentication_client = get_async_authentication_client()
+
+    login_request = LoginRequestSchema(email=user.email, password=user.password)
+    async with authentication_client.client:  # публичный клиент нужен только для логина, поэтому сразу закрываем его
+        login_response = await authentication_client.login(login_request)
+
+    return save_user_token(user, login_response)
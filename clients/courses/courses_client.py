@@ -1,11 +1,13 @@
-from httpx import Response
-from clients.api_client import APIClient
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
-from clients.courses.courses_schema import GetCoursesQuerySchema, CreateCourseRequestSchema, CreateCourseResponseSchema, UpdateCourseRequestSchema
-import allure
+from clients.api_response import APIResponse
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, get_async_private_http_client
+from clients.courses.courses_schema import GetCoursesQuerySchema, CreateCourseRequestSchema, CreateCourseResponseSchema, UpdateCourseRequestSchema, \
+    GetCoursesResponseSchema
 
 from tools.routes import APIRoutes
-from clients.api_coverage import tracker
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.resources_registry import resources_registry, ResourceKind
+from tools.allure.steps import step, async_step
 
 
 class CoursesClient(APIClient):
@@ -13,71 +15,74 @@ class CoursesClient(APIClient):
     Клиент для работы с /api/v1/courses
     """
 
-    @allure.step("Получение списка курсов")
+    @step("Получение списка курсов")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)  # Отслеживаем покрытие для маршрута получения списка курсов
-    def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+    def get_courses_api(self, query: GetCoursesQuerySchema) -> APIResponse:
         """
         Метод получения списка курсов.
 
         :param query: Словарь с userId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True)) # Используем by_alias для использования алиасов ключей
 
 
-    @allure.step("Получение курса по идентификатору {course_id}")
+    @step("Получение курса по идентификатору {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")  # /{{course_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def get_course_api(self, course_id: str) -> Response:
+    def get_course_api(self, course_id: str) -> APIResponse:
         """
         Метод получения курса по идентификатору.
 
         :param course_id: Идентификатор курса.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.COURSES}/{course_id}")
 
 
-    @allure.step("Создание курса")
+    @step("Создание курса")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)  # Отслеживаем покрытие для маршрута создания курса
-    def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+    def create_course_api(self, request: CreateCourseRequestSchema) -> APIResponse:
         """
         Метод создания курса.
 
         :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
         previewFileId, createdByUserId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True)) # Отправляем POST-запрос на создание курса с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса CreateCourseRequestSchema
+        response = self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True)) # Отправляем POST-запрос на создание курса с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса CreateCourseRequestSchema
+        if user := self.user:  # запоминаем курс, чтобы удалить его в конце скоупа фикстуры или теста
+            resources_registry.track(ResourceKind.COURSE, response, "course", lambda course_id: get_courses_client(user).delete_course_api(course_id))
+        return response
 
 
-    @allure.step("Обновление курса по идентификатору {course_id}")
+    @step("Обновление курса по идентификатору {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")  # /{{course_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
+    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> APIResponse:
         """
         Метод обновления курса.
 
         :param course_id: Идентификатор курса.
         :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(f"{APIRoutes.COURSES}/{course_id}", json=request.model_dump(by_alias=True)) # Отправляем PATCH-запрос на обновление курса с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса UpdateCourseRequestSchema
 
 
-    @allure.step("Удаление курса по идентификатору {course_id}")
+    @step("Удаление курса по идентификатору {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")  # /{{course_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def delete_course_api(self, course_id: str) -> Response:
+    def delete_course_api(self, course_id: str) -> APIResponse:
         """
         Метод удаления курса.
 
         :param course_id: Идентификатор курса.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.COURSES}/{course_id}")
 
 
     def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
         response = self.create_course_api(request) # Вызываем метод create_course_api для отправки запроса на создание курса и получения ответа от сервера
-        return CreateCourseResponseSchema.model_validate_json(response.text)  # Преобразуем ответ в словарь с данными курса с помощью метода model_validate_json класса CreateCourseResponseSchema
+        return response.model(CreateCourseResponseSchema)  # Тело ответа разбирается один раз и кэшируется в APIResponse
 
 
 # Добавляем builder для CoursesClient
@@ -88,4 +93,95 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     :param user: Словарь с email и password для аутентификации.
     :return: Готовый к использованию CoursesClient.
     """
-    return CoursesClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
\ No newline at end of file
+    return CoursesClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
+
+
+class AsyncCoursesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/courses
+    """
+
+    @async_step("Получение списка курсов")
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def get_courses_api(self, query: GetCoursesQuerySchema) -> APIResponse:
+        """
+        Метод получения списка курсов.
+
+        :param query: Словарь с userId.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
+
+
+    @async_step("Получение курса по идентификатору {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def get_course_api(self, course_id: str) -> APIResponse:
+        """
+        Метод получения курса по идентификатору.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(f"{APIRoutes.COURSES}/{course_id}")
+
+
+    @async_step("Создание курса")
+    @track_coverage_httpx_async(APIRoutes.COURSES)
+    async def create_course_api(self, request: CreateCourseRequestSchema) -> APIResponse:
+        """
+        Метод создания курса.
+
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
+        previewFileId, createdByUserId.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        response = await self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True))
+        if user := self.user:  # удаление в конце скоупа выполняет синхронный клиент: teardown реестра синхронный
+            resources_registry.track(ResourceKind.COURSE, response, "course", lambda course_id: get_courses_client(user).delete_course_api(course_id))
+        return response
+
+
+    @async_step("Обновление курса по идентификатору {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> APIResponse:
+        """
+        Метод обновления курса.
+
+        :param course_id: Идентификатор курса.
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.patch(f"{APIRoutes.COURSES}/{course_id}", json=request.model_dump(by_alias=True))
+
+
+    @async_step("Удаление курса по идентификатору {course_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def delete_course_api(self, course_id: str) -> APIResponse:
+        """
+        Метод удаления курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.delete(f"{APIRoutes.COURSES}/{course_id}")
+
+
+    async def get_courses(self, query: GetCoursesQuerySchema) -> GetCoursesResponseSchema:
+        response = await self.get_courses_api(query)
+        return response.model(GetCoursesResponseSchema)
+
+
+    async def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
+        response = await self.create_course_api(request)
+        return response.model(CreateCourseResponseSchema)
+
+
+# Добавляем builder для AsyncCoursesClient
+async def get_async_courses_client(user: AuthenticationUserSchema) -> AsyncCoursesClient:
+    """
+    Функция создает экземпляр AsyncCoursesClient с уже настроенным HTTP-клиентом.
+
+    :param user: Словарь с email и password для аутентификации.
+    :return: Готовый к использованию AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
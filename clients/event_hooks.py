@@ -1,7 +1,11 @@
-import allure
 from httpx import Request, Response
 
-from tools.http.curl import make_curl_from_request
+from clients.api_coverage import route_templates
+from config import settings
+from tools.assertions.performance import sla_violations
+from tools.http.latency import latency_collector
+from tools.http.requests_buffer import requests_buffer
+from tools.http.timings import RequestTimings, AsyncRequestTimings, get_request_timings
 from tools.logger import get_logger
 
 
@@ -13,13 +17,13 @@ logger = get_logger("HTTP_LOGGER")
 
 def curl_event_hook(request: Request):
     """
-    Event hook для автоматического прикрепления cURL команды к отчету Allure.
+    Event hook, который запоминает запрос в кольцевом буфере текущего теста.
+
+    cURL команды строятся и прикрепляются к отчету Allure только при падении теста (см. fixtures/allure.py).
 
     :param request: HTTP-запрос, переданный в 'httpx' клиент.
     """
-    curl_command = make_curl_from_request(request)
-
-    allure.attach(curl_command, name="cURL command", attachment_type=allure.attachment_type.TEXT)
+    requests_buffer.append(request)
 
 
 def log_request_event_hook(request: Request):
@@ -28,7 +32,7 @@ def log_request_event_hook(request: Request):
 
     :param request: HTTP-запрос, переданный в 'httpx' клиент.
     """
-    logger.info(f"Выполняем {request.method} запрос к {request.url}")
+    logger.info("Выполняем %s запрос к %s", request.method, request.url)  # сообщение форматируется в потоке логирования
 
 
 def log_response_event_hook(response: Response):
@@ -37,4 +41,79 @@ def log_response_event_hook(response: Response):
 
     :param response: HTTP-ответ.
     """
-    logger.info(f"Получен ответ {response.status_code} {response.reason_phrase} от {response.url}")
\ No newline at end of file
+    logger.info("Получен ответ %s %s от %s", response.status_code, response.reason_phrase, response.url)
+
+
+def metrics_request_event_hook(request: Request, timings_class: type[RequestTimings] = RequestTimings):
+    """
+    Event hook, который запоминает момент отправки запроса и подключает к нему расширение "trace" httpcore
+    для разбивки времени по этапам. Стоит последним среди хуков запроса, чтобы логирование и cURL не попадали в задержку.
+
+    :param request: HTTP-запрос, переданный в 'httpx' клиент.
+    :param timings_class: RequestTimings для синхронных клиентов, AsyncRequestTimings для асинхронных.
+    """
+    if settings.metrics.enabled or settings.sla.enabled:
+        request.extensions["trace"] = request.extensions["timings"] = timings_class()
+
+
+def metrics_response_event_hook(response: Response):
+    """
+    Event hook, который записывает задержку (до получения заголовков ответа) в гистограмму маршрута
+    и проверяет SLA маршрута из settings.sla.
+
+    :param response: HTTP-ответ.
+    """
+    if (timings := get_request_timings(response.request)) is None:
+        return
+
+    timings.finish()
+    route = route_templates.match(response.request.url.path)
+    if settings.metrics.enabled:
+        latency_collector.record(response.request.method, route, timings.elapsed / 1000, response.status_code)
+    if settings.sla.enabled:
+        sla_violations.check(response, route)
+
+# httpx.AsyncClient ожидает, что event hooks будут корутинами, поэтому для асинхронных клиентов используем обертки
+async def async_curl_event_hook(request: Request):
+    """
+    Асинхронный event hook, который запоминает запрос в кольцевом буфере текущего теста.
+
+    :param request: HTTP-запрос, переданный в 'httpx' клиент.
+    """
+    curl_event_hook(request)
+
+
+async def async_log_request_event_hook(request: Request):
+    """
+    Асинхронный event hook для логирования HTTP-запросов.
+
+    :param request: HTTP-запрос, переданный в 'httpx' клиент.
+    """
+    log_request_event_hook(request)
+
+
+async def async_log_response_event_hook(response: Response):
+    """
+    Асинхронный event hook для логирования HTTP-ответов.
+
+    :param response: HTTP-ответ.
+    """
+    log_response_event_hook(response)
+
+
+async def async_metrics_request_event_hook(request: Request):
+    """
+    Асинхронный event hook, который запоминает момент отправки запроса.
+
+    :param request: HTTP-запрос, переданный в 'httpx' клиент.
+    """
+    metrics_request_event_hook(request, AsyncRequestTimings)
+
+
+async def async_metrics_response_event_hook(response: Response):
+    """
+    Асинхронный event hook, который записывает задержку в гистограмму маршрута и проверяет SLA.
+
+    :param response: HTTP-ответ.
+    """
+    metrics_response_event_hook(response)
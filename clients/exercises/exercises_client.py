@@ -1,77 +1,81 @@
-from httpx import Response
-from clients.api_client import APIClient
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.api_response import APIResponse
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.private_http_builder import get_private_http_client, get_async_private_http_client, AuthenticationUserSchema
 from clients.exercises.exercises_schema import ExerciseResponseSchema, CreateExerciseRequestSchema, \
     UpdateExerciseRequestSchema, GetExercisesQuerySchema, GetExercisesResponseSchema  # Импортируем необходимые схемы из exercises_schema.py
-import allure
 
 from tools.routes import APIRoutes
-from clients.api_coverage import tracker
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.resources_registry import resources_registry, ResourceKind
+from tools.allure.steps import step, async_step
 
 
 class ExercisesClient(APIClient):  # Клиент для работы с /api/v1/exercises
     """
     Клиент для работы с /api/v1/exercises
     """
-    @allure.step("Получение списка заданий")
+    @step("Получение списка заданий")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)  # Отслеживаем покрытие для маршрута получения списка заданий
-    def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:  #
+    def get_exercises_api(self, query: GetExercisesQuerySchema) -> APIResponse:  #
         """
         Получение списка заданий для определенного курса.
 
         :param query: Словарь с courseId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.get(APIRoutes.EXERCISES, params=query.model_dump(by_alias=True))  # Вызов метода get класса APIClient с передачей пути "/api/v1/exercises" и параметров запроса params=query. Ответ от сервера возвращается в виде объекта httpx.Response.
+        return self.get(APIRoutes.EXERCISES, params=query.model_dump(by_alias=True))  # Вызов метода get класса APIClient с передачей пути "/api/v1/exercises" и параметров запроса params=query. Ответ от сервера возвращается в виде объекта APIResponse.
 
 
-    @allure.step("Получение информации о задании по его идентификатору {exercise_id}")
+    @step("Получение информации о задании по его идентификатору {exercise_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")  # Отслеживаем покрытие для маршрута получения информации о задании/ экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def get_exercise_api(self, exercise_id: str) -> Response:
+    def get_exercise_api(self, exercise_id: str) -> APIResponse:
         """
         Получение информации о задании по exercise_id
 
         :param exercise_id: Идентификатор задания.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
 
-    @allure.step("Создание задания")
+    @step("Создание задания")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)  # Отслеживаем покрытие для  создания задания
-    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> APIResponse:
         """
         Создание задания.
 
         :param request: Словарь с данными для создания задания.
         Принимает: title, courseId, maxScore, minScore, orderIndex, description, estimatedTime).
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.post(APIRoutes.EXERCISES, request.model_dump(by_alias=True))
+        response = self.post(APIRoutes.EXERCISES, request.model_dump(by_alias=True))
+        if user := self.user:  # запоминаем задание, чтобы удалить его в конце скоупа фикстуры или теста
+            resources_registry.track(ResourceKind.EXERCISE, response, "exercise", lambda exercise_id: get_exercises_client(user).delete_exercise_api(exercise_id))
+        return response
 
 
-    @allure.step("Обновление данных задания по его идентификатору {exercise_id}")
+    @step("Обновление данных задания по его идентификатору {exercise_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")  # Отслеживаем покрытие для маршрута обновления данных задания / экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
+    def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> APIResponse:
         """
         Обновление данных задания.
 
         :param exercise_id: Идентификатор задания.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", request.model_dump(by_alias=True))
 
 
-    @allure.step("Удаление задания по его идентификатору {exercise_id}")
+    @step("Удаление задания по его идентификатору {exercise_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")  # Отслеживаем покрытие для маршрута удаления задания / экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def delete_exercise_api(self, exercise_id: str) -> Response:
+    def delete_exercise_api(self, exercise_id: str) -> APIResponse:
         """
         Удавление задания.
 
         :param exercise_id: Идентификатор задания.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}") # Вызов метода delete класса APIClient с передачей пути "/api/v1/exercises/{exercise_id}" и данных запроса request. Ответ от сервера возвращается в виде объекта httpx.Response.
+        return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}") # Вызов метода delete класса APIClient с передачей пути "/api/v1/exercises/{exercise_id}" и данных запроса request. Ответ от сервера возвращается в виде объекта APIResponse.
 
 
     # Добавляем функции для работы с данными (для более удобного использования клиента)
@@ -83,7 +87,7 @@ class ExercisesClient(APIClient):  # Клиент для работы с /api/v1
         :return: Ответ от сервера в виде словаря.
         """
         response = self.get_exercises_api(query)
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return response.model(GetExercisesResponseSchema)
 
 
     def get_exercise(self, exercise_id) -> ExerciseResponseSchema:
@@ -94,7 +98,7 @@ class ExercisesClient(APIClient):  # Клиент для работы с /api/v1
         :return: Ответ от сервера в виде словаря.
         """
         response = self.get_exercise_api(exercise_id)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
 
 
     def create_exercise(self, request: CreateExerciseRequestSchema) -> ExerciseResponseSchema:
@@ -106,7 +110,7 @@ class ExercisesClient(APIClient):  # Клиент для работы с /api/v1
         :return: Ответ от сервера в виде словаря.
         """
         response = self.create_exercise_api(request)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
 
 
     def update_exercise(self, exercise_id, request: UpdateExerciseRequestSchema) -> ExerciseResponseSchema:
@@ -119,7 +123,7 @@ class ExercisesClient(APIClient):  # Клиент для работы с /api/v1
         :return: Ответ от сервера в виде словаря.
         """
         response = self.update_exercise_api(exercise_id, request)
-        return ExerciseResponseSchema.model_validate_json(response.text)
+        return response.model(ExerciseResponseSchema)
 
 
 # Добавляем builder для ExercisesClient
@@ -130,4 +134,128 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
     :param user: Словарь с email и password для аутентификации.
     :return: Готовый к использованию ExercisesClient.
     """
-    return ExercisesClient(client=get_private_http_client(user))
\ No newline at end of file
+    return ExercisesClient(client=get_private_http_client(user))
+
+
+class AsyncExercisesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/exercises
+    """
+    @async_step("Получение списка заданий")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def get_exercises_api(self, query: GetExercisesQuerySchema) -> APIResponse:
+        """
+        Получение списка заданий для определенного курса.
+
+        :param query: Словарь с courseId.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(APIRoutes.EXERCISES, params=query.model_dump(by_alias=True))
+
+
+    @async_step("Получение информации о задании по его идентификатору {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def get_exercise_api(self, exercise_id: str) -> APIResponse:
+        """
+        Получение информации о задании по exercise_id
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+
+    @async_step("Создание задания")
+    @track_coverage_httpx_async(APIRoutes.EXERCISES)
+    async def create_exercise_api(self, request: CreateExerciseRequestSchema) -> APIResponse:
+        """
+        Создание задания.
+
+        :param request: Словарь с данными для создания задания.
+        Принимает: title, courseId, maxScore, minScore, orderIndex, description, estimatedTime).
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        response = await self.post(APIRoutes.EXERCISES, request.model_dump(by_alias=True))
+        if user := self.user:  # удаление в конце скоупа выполняет синхронный клиент: teardown реестра синхронный
+            resources_registry.track(ResourceKind.EXERCISE, response, "exercise", lambda exercise_id: get_exercises_client(user).delete_exercise_api(exercise_id))
+        return response
+
+
+    @async_step("Обновление данных задания по его идентификатору {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> APIResponse:
+        """
+        Обновление данных задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.patch(f"{APIRoutes.EXERCISES}/{exercise_id}", request.model_dump(by_alias=True))
+
+
+    @async_step("Удаление задания по его идентификатору {exercise_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def delete_exercise_api(self, exercise_id: str) -> APIResponse:
+        """
+        Удаление задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+
+    async def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
+        """
+        Получение списка заданий для определенного курса.
+
+        :param query: Словарь с courseId.
+        :return: Ответ от сервера в виде словаря.
+        """
+        response = await self.get_exercises_api(query)
+        return response.model(GetExercisesResponseSchema)
+
+
+    async def get_exercise(self, exercise_id) -> ExerciseResponseSchema:
+        """
+        Получение информации о задании по exercise_id
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде словаря.
+        """
+        response = await self.get_exercise_api(exercise_id)
+        return response.model(ExerciseResponseSchema)
+
+
+    async def create_exercise(self, request: CreateExerciseRequestSchema) -> ExerciseResponseSchema:
+        """
+        Создание задания.
+
+        :param request: Словарь с данными для создания задания.
+        :return: Ответ от сервера в виде словаря.
+        """
+        response = await self.create_exercise_api(request)
+        return response.model(ExerciseResponseSchema)
+
+
+    async def update_exercise(self, exercise_id, request: UpdateExerciseRequestSchema) -> ExerciseResponseSchema:
+        """
+        Обновление данных задания.
+
+        :param exercise_id: Идентификатор задания.
+        :param request: Словарь с данными для обновления задания.
+        :return: Ответ от сервера в виде словаря.
+        """
+        response = await self.update_exercise_api(exercise_id, request)
+        return response.model(ExerciseResponseSchema)
+
+
+# Добавляем builder для AsyncExercisesClient
+async def get_async_exercises_client(user: AuthenticationUserSchema) -> AsyncExercisesClient:
+    """
+    Функция создает экземпляр AsyncExercisesClient с уже настроенным HTTP-клиентом.
+
+    :param user: Словарь с email и password для аутентификации.
+    :return: Готовый к использованию AsyncExercisesClient.
+    """
+    return AsyncExercisesClient(client=await get_async_private_http_client(user))
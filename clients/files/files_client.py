@@ -1,11 +1,69 @@
-from httpx import Response
-from clients.api_client import APIClient
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-import allure
+import hashlib
+import time
+
+from httpx import URL, Client, AsyncClient
+from pydantic import HttpUrl
+
+from clients.api_response import APIResponse
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client, get_async_private_http_client
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, DownloadFileResultSchema
 
 from tools.routes import APIRoutes
-from clients.api_coverage import tracker
+from clients.api_coverage import tracker, track_coverage_httpx, track_coverage_httpx_async
+from clients.resources_registry import resources_registry, ResourceKind
+from tools.allure.steps import step, async_step
+from tools.http.multipart import MultipartFileBody, CHUNK_SIZE
+from tools.logger import get_logger
+
+
+
+logger = get_logger("FILES_CLIENT")
+
+
+def is_service_url(base_url: URL, url: HttpUrl | str) -> bool:
+    """
+    :param base_url: Базовый URL клиента.
+    :param url: URL файла (абсолютный или относительный base_url).
+    :return: True, если файл на хосте сервиса (та же схема, хост и порт), False — если во внешнем хранилище.
+    """
+    target = URL(str(url))
+    return not target.is_absolute_url or (target.scheme, target.host, target.port) == (base_url.scheme, base_url.host, base_url.port)
+
+
+def stream_download_file(client: Client, url: HttpUrl | str, chunk_size: int) -> DownloadFileResultSchema:
+    """
+    Потоково скачивает файл клиентом client и считает хэш содержимого на лету: тело ответа целиком в память не загружается.
+    """
+    digest, size = hashlib.sha256(), 0
+    started_at = time.perf_counter()
+    with client.stream("GET", str(url)) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes(chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+
+    result = DownloadFileResultSchema(url=str(url), size=size, sha256=digest.hexdigest(), elapsed=time.perf_counter() - started_at)
+    logger.info(f"Скачан файл {url}: {result}")
+    return result
+
+
+async def async_stream_download_file(client: AsyncClient, url: HttpUrl | str, chunk_size: int) -> DownloadFileResultSchema:
+    """
+    Асинхронный аналог stream_download_file.
+    """
+    digest, size = hashlib.sha256(), 0
+    started_at = time.perf_counter()
+    async with client.stream("GET", str(url)) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size):
+            digest.update(chunk)
+            size += len(chunk)
+
+    result = DownloadFileResultSchema(url=str(url), size=size, sha256=digest.hexdigest(), elapsed=time.perf_counter() - started_at)
+    logger.info(f"Скачан файл {url}: {result}")
+    return result
 
 
 class FilesClient(APIClient):
@@ -13,47 +71,69 @@ class FilesClient(APIClient):
     Клиент для работы с /api/v1/files
     """
 
-    @allure.step("Получение файла по id {file_id}")
+    @step("Получение файла по id {file_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.FILES}/{{file_id}}") # /{{file_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def get_file_api(self, file_id: str) -> Response:
+    def get_file_api(self, file_id: str) -> APIResponse:
         """
         Метод получения файла.
 
         :param file_id: Идентификатор файла.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.FILES}/{file_id}")
 
-    @allure.step("Создание файла")
-    @tracker.track_coverage_httpx(APIRoutes.FILES)  # /{{file_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+    @step("Создание файла")
+    @track_coverage_httpx(APIRoutes.FILES)  # потоковое тело запроса: покрытие собирается без повторного чтения файла
+    def create_file_api(self, request: CreateFileRequestSchema) -> APIResponse:
         """
         Метод создания файла.
 
         :param request: Словарь с filename, directory, upload_file.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.post(
-            APIRoutes.FILES,
-            data= request.model_dump(by_alias=True, exclude={"upload_file"}), # model_dump преобразует объект в словарь с учетом псевдонимов полей (например, filename -> name) и исключением поля upload_file, так как оно не должно быть передано в теле запроса.
-            files = {"upload_file": request.upload_file.read_bytes()}
+        # Файл не загружается в память целиком: тело multipart читается с диска кусками во время отправки
+        body = MultipartFileBody(
+            file=request.upload_file,
+            field="upload_file",
+            data=request.model_dump(by_alias=True, exclude={"upload_file"}) # model_dump преобразует объект в словарь с учетом псевдонимов полей (например, filename -> name) и исключением поля upload_file, так как оно не должно быть передано в теле запроса.
         )
+        response = self.post(APIRoutes.FILES, content=body.stream(), headers=body.headers)
+        if user := self.user:  # запоминаем файл, чтобы удалить его в конце скоупа фикстуры или теста
+            resources_registry.track(ResourceKind.FILE, response, "file", lambda file_id: get_files_client(user).delete_file_api(file_id))
+        return response
 
-    @allure.step("Удаление файла по id {file_id}")
+    @step("Удаление файла по id {file_id}")
     @tracker.track_coverage_httpx(APIRoutes.FILES)
-    def delete_file_api(self, file_id: str) -> Response:
+    def delete_file_api(self, file_id: str) -> APIResponse:
         """
         Метод удаления файла.
 
         :param file_id: Идентификатор файла.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.FILES}/{file_id}")  # удаление файла по идентификатору. Возвращает 204. Необходимо проверить, что файл действительно удален. В случае удаления возвращает пустой объект.
 
 
     def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:  # Создание файла на сервере с проверкой на ошибки сервера и получением ответа сервера
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text) # Преобразование ответа в словарь с данными файла с помощью метода model_value_json класса CreateFileResponseSchema из файлов_schema.py и запись его в переменную response.
+        return response.model(CreateFileResponseSchema)  # Тело ответа разбирается один раз и кэшируется в APIResponse
+
+    @step("Скачивание файла {url}")
+    def download_file(self, url: HttpUrl | str, chunk_size: int = CHUNK_SIZE) -> DownloadFileResultSchema:
+        """
+        Потоково скачивает файл и считает хэш содержимого на лету (см. stream_download_file).
+
+        :param url: URL файла (например, FileSchema.url). Файлы с другого хоста (статика, объектное хранилище)
+            скачиваются публичным клиентом без токена.
+        :param chunk_size: Размер куска, читаемого из ответа за раз.
+        :return: Размер, sha256 и время скачивания файла.
+        :raises httpx.HTTPStatusError: Если сервер вернул ошибку.
+        """
+        if is_service_url(self.client.base_url, url):
+            return stream_download_file(self.client, url, chunk_size)
+
+        with get_public_http_client() as client:  # внешнее хранилище: токен пользователя на чужой хост не передается
+            return stream_download_file(client, url, chunk_size)
 
 
  # Добавляем builder для FilesClient
@@ -63,4 +143,83 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
 
     :return: Готовый к использованию FilesClient.
     """
-    return FilesClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
\ No newline at end of file
+    return FilesClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
+
+
+class AsyncFilesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/files
+    """
+
+    @async_step("Получение файла по id {file_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.FILES}/{{file_id}}")
+    async def get_file_api(self, file_id: str) -> APIResponse:
+        """
+        Метод получения файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(f"{APIRoutes.FILES}/{file_id}")
+
+    @async_step("Создание файла")
+    @track_coverage_httpx_async(APIRoutes.FILES)
+    async def create_file_api(self, request: CreateFileRequestSchema) -> APIResponse:
+        """
+        Метод создания файла.
+
+        :param request: Словарь с filename, directory, upload_file.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        body = MultipartFileBody(
+            file=request.upload_file,
+            field="upload_file",
+            data=request.model_dump(by_alias=True, exclude={"upload_file"})
+        )
+        response = await self.post(APIRoutes.FILES, content=body.async_stream(), headers=body.headers)
+        if user := self.user:  # удаление в конце скоупа выполняет синхронный клиент: teardown реестра синхронный
+            resources_registry.track(ResourceKind.FILE, response, "file", lambda file_id: get_files_client(user).delete_file_api(file_id))
+        return response
+
+    @async_step("Удаление файла по id {file_id}")
+    @track_coverage_httpx_async(APIRoutes.FILES)
+    async def delete_file_api(self, file_id: str) -> APIResponse:
+        """
+        Метод удаления файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.delete(f"{APIRoutes.FILES}/{file_id}")
+
+
+    async def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
+        response = await self.create_file_api(request)
+        return response.model(CreateFileResponseSchema)
+
+    @async_step("Скачивание файла {url}")
+    async def download_file(self, url: HttpUrl | str, chunk_size: int = CHUNK_SIZE) -> DownloadFileResultSchema:
+        """
+        Асинхронный аналог FilesClient.download_file: потоковое скачивание с подсчетом хэша на лету.
+
+        :param url: URL файла (например, FileSchema.url). Файлы с другого хоста (статика, объектное хранилище)
+            скачиваются публичным клиентом без токена.
+        :param chunk_size: Размер куска, читаемого из ответа за раз.
+        :return: Размер, sha256 и время скачивания файла.
+        :raises httpx.HTTPStatusError: Если сервер вернул ошибку.
+        """
+        if is_service_url(self.client.base_url, url):
+            return await async_stream_download_file(self.client, url, chunk_size)
+
+        async with get_async_public_http_client() as client:  # внешнее хранилище: токен пользователя на чужой хост не передается
+            return await async_stream_download_file(client, url, chunk_size)
+
+
+# Добавляем builder для AsyncFilesClient
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
@@ -33,4 +33,24 @@ class GetFileResponseSchema(BaseModel):
     """
     Описание структуры ответа на запрос файла.
     """
-    file: FileSchema
\ No newline at end of file
+    file: FileSchema
+
+
+class DownloadFileResultSchema(BaseModel):
+    """
+    Описание результата потокового скачивания файла.
+    """
+    url: str
+    size: int  # сколько байт скачано
+    sha256: str  # хэш скачанного содержимого (hex), считается по мере чтения ответа
+    elapsed: float  # время в секундах от отправки запроса до последнего байта
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: скорость скачивания в байтах в секунду
+        """
+        return self.size / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.size} байт за {self.elapsed:.3f} с ({self.throughput / 1024 / 1024:.1f} МБ/с)"
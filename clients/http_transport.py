@@ -0,0 +1,95 @@
+import threading
+
+from httpx import HTTPTransport, AsyncHTTPTransport, ASGITransport, BaseTransport, AsyncBaseTransport, Request, Response
+
+from config import settings
+from tools.http.cassettes import CassetteTransport, AsyncCassetteTransport
+from tools.stand_in import get_stand_in_app
+
+
+def build_transport() -> BaseTransport:
+    """
+    :return: синхронный транспорт: пул соединений к сервису или stand-in приложение без сети (STAND_IN.MODE=asgi),
+    обернутый в запись/воспроизведение кассет, если они включены (CASSETTES.MODE)
+    """
+    if settings.stand_in.mode == "asgi":
+        transport = get_stand_in_app().transport
+    else:
+        transport = HTTPTransport(http2=settings.http_client.http2, limits=settings.http_client.client_limits)
+
+    return transport if settings.cassettes.mode == "passthrough" else CassetteTransport(transport)
+
+
+def build_async_transport() -> AsyncBaseTransport:
+    """
+    :return: асинхронный транспорт: пул соединений к сервису или ASGI stand-in приложения (STAND_IN.MODE=asgi),
+    обернутый в запись/воспроизведение кассет, если они включены (CASSETTES.MODE)
+    """
+    if settings.stand_in.mode == "asgi":
+        transport = ASGITransport(app=get_stand_in_app().asgi)
+    else:
+        transport = AsyncHTTPTransport(http2=settings.http_client.http2, limits=settings.http_client.client_limits)
+
+    return transport if settings.cassettes.mode == "passthrough" else AsyncCassetteTransport(transport)
+
+
+class SharedHTTPTransport(BaseTransport):
+    """
+    Транспорт с одним пулом соединений, который разделяют все httpx.Client проекта.
+
+    httpx.Client.close() закрывает свой транспорт, поэтому close() здесь ничего не делает:
+    клиенты можно закрывать и вытеснять из кэша, не разрывая соединения других клиентов.
+    Реальное закрытие пула выполняется через close_pool().
+    """
+
+    def __init__(self):
+        self._transport: BaseTransport | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def transport(self) -> BaseTransport:
+        """
+        Лениво создает общий транспорт (и пул соединений за ним).
+
+        :return: Экземпляр httpx.HTTPTransport (или транспорт stand-in приложения в режиме STAND_IN.MODE=asgi).
+        """
+        if self._transport is None:
+            with self._lock:
+                if self._transport is None:
+                    self._transport = build_transport()
+
+        return self._transport
+
+    @property
+    def open_sockets(self) -> int:
+        """
+        Количество открытых соединений в общем пуле.
+
+        Пул httpx.HTTPTransport (httpcore) не входит в публичный API: если его устройство изменится, счетчик вернет 0.
+
+        :return: Число незакрытых соединений.
+        """
+        transport = self._transport.transport if isinstance(self._transport, CassetteTransport) else self._transport
+        connections = getattr(getattr(transport, "_pool", None), "connections", None)
+        if not isinstance(transport, HTTPTransport) or connections is None:
+            return 0
+
+        return len([connection for connection in connections if not getattr(connection, "is_closed", lambda: False)()])
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass  # пул общий, его нельзя закрывать вместе с отдельным клиентом
+
+    def close_pool(self) -> None:
+        """
+        Закрывает общий пул соединений. При следующем запросе пул будет создан заново.
+        """
+        with self._lock:
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+
+
+shared_transport = SharedHTTPTransport()  # Единственный экземпляр транспорта на процесс (на воркер xdist)
@@ -1,37 +1,142 @@
-from httpx import Client
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from httpx import Client, AsyncClient
 from pydantic import BaseModel
-from functools import lru_cache
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
-from clients.event_hooks import curl_event_hook, log_response_event_hook, log_request_event_hook
+from clients.authentication.authentication_schema import AuthenticationUserSchema  # реэкспорт: клиенты и фикстуры импортируют схему отсюда
+from clients.authentication.bearer_auth import BearerAuth
+from clients.authentication.user_tokens import get_user_token, get_async_user_token
+from clients.event_hooks import curl_event_hook, log_response_event_hook, log_request_event_hook, \
+    async_curl_event_hook, async_log_request_event_hook, async_log_response_event_hook, metrics_request_event_hook, \
+    metrics_response_event_hook, async_metrics_request_event_hook, async_metrics_response_event_hook
+from clients.http_transport import shared_transport, build_async_transport
 from config import settings
 
 
 
 
-class AuthenticationUserSchema(BaseModel,frozen=True):  # Используем frozen=True для создания неизменяемого объекта, что позволяет использовать его в качестве ключа кэша
-    email: str
-    password: str
+class HTTPClientsStats(BaseModel):
+    """
+    Счетчики реестра приватных клиентов.
+    """
+    live_clients: int  # количество клиентов в реестре
+    open_sockets: int  # количество открытых соединений в общем пуле
 
 
-@lru_cache(maxsize=None)  # Кэширование для оптимизации повторного использования клиента для аутентификации и доступа к приватным API
-def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+class PrivateHTTPClientsRegistry:
+    """
+    Ограниченный реестр приватных httpx.Client с вытеснением по LRU.
+
+    Вытесненный клиент закрывается. Соединения при этом не рвутся: все клиенты работают поверх
+    общего shared_transport, а токен передается в каждом запросе через BearerAuth.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: Максимальное количество клиентов в реестре.
+        """
+        self.max_size = max_size
+        self._clients: OrderedDict[AuthenticationUserSchema, Client] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user: AuthenticationUserSchema, factory: Callable[[AuthenticationUserSchema], Client]) -> Client:
+        """
+        Возвращает клиент пользователя из реестра или создает его с помощью factory.
+
+        :param user: Данные пользователя, ключ реестра.
+        :param factory: Функция создания клиента (выполняет логин).
+        :return: Экземпляр httpx.Client.
+        """
+        with self._lock:
+            if (client := self._clients.get(user)) is not None:
+                self._clients.move_to_end(user)
+                return client
+
+        client = factory(user)  # логин выполняем вне блокировки, чтобы не сериализовать создание клиентов разных пользователей
+
+        with self._lock:
+            if (existing := self._clients.get(user)) is not None:  # клиент успели создать в другом потоке
+                self._clients.move_to_end(user)
+                client.close()
+                return existing
+
+            self._clients[user] = client
+            while len(self._clients) > self.max_size:
+                _, evicted = self._clients.popitem(last=False)
+                evicted.close()
+
+        return client
+
+    def close(self):
+        """
+        Закрывает все клиенты реестра и общий пул соединений.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
+
+        shared_transport.close_pool()
+
+    @property
+    def stats(self) -> HTTPClientsStats:
+        return HTTPClientsStats(live_clients=len(self._clients), open_sockets=shared_transport.open_sockets)
+
+
+private_http_clients = PrivateHTTPClientsRegistry(max_size=settings.http_client.private_clients_max_size)
+
+
+def build_private_http_client(user: AuthenticationUserSchema) -> Client:
     """
     Функция создает экземпляр httpx.Client с аутентификацией пользователя.
 
     :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
-    :return: экземпляр httpx.Client с установленным заголовком Authorization
+    :return: экземпляр httpx.Client, передающий токен в заголовке Authorization каждого запроса
     """
-    autentication_client = get_authentication_client()
-
-    login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = autentication_client.login(login_request)
+    token = get_user_token(user)
 
     return Client(base_url=settings.http_client.client_url,
-          timeout=settings.http_client.timeout,
-          headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+          timeout=settings.http_client.client_timeout,
+          auth=BearerAuth(user, token),  # Токен передается в каждом запросе, а не закрепляется за пулом соединений
+          transport=shared_transport,                           # Все приватные клиенты используют один пул соединений
           event_hooks={
-              "request": [curl_event_hook, log_request_event_hook],   # Добавляем хуки для логирования запросов и создания cURL команды
-              "response": [log_response_event_hook]                   # Добавляем хук для логирования ответов
+              "request": [curl_event_hook, log_request_event_hook, metrics_request_event_hook],   # Добавляем хуки для логирования запросов, создания cURL команды и замера задержки
+              "response": [metrics_response_event_hook, log_response_event_hook]                 # Добавляем хуки для записи задержки и логирования ответов
           }
     )
+
+
+def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Функция возвращает httpx.Client с аутентификацией пользователя из ограниченного реестра.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :return: экземпляр httpx.Client с аутентификацией пользователя
+    """
+    return private_http_clients.get(user, build_private_http_client)
+
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция создает экземпляр httpx.AsyncClient с аутентификацией пользователя.
+
+    Клиент не кэшируется: httpx.AsyncClient привязан к event loop, в котором он был создан.
+
+    :param user: объект AuthenticationUserSchema, содержащий email и password пользователя
+    :return: экземпляр httpx.AsyncClient, передающий токен в заголовке Authorization каждого запроса
+    """
+    token = await get_async_user_token(user)
+
+    return AsyncClient(
+        base_url=settings.http_client.client_url,
+        timeout=settings.http_client.client_timeout,
+        transport=build_async_transport(),  # пул соединений с http2 и limits из настроек или stand-in приложение
+        auth=BearerAuth(user, token),
+        event_hooks={
+            "request": [async_curl_event_hook, async_log_request_event_hook, async_metrics_request_event_hook],
+            "response": [async_metrics_response_event_hook, async_log_response_event_hook]
+        }
+    )
@@ -1,6 +1,9 @@
-from httpx import Client
+from httpx import Client, AsyncClient
 
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook, \
+    async_curl_event_hook, async_log_request_event_hook, async_log_response_event_hook, metrics_request_event_hook, \
+    metrics_response_event_hook, async_metrics_request_event_hook, async_metrics_response_event_hook
+from clients.http_transport import shared_transport, build_async_transport
 from config import settings
 
 
@@ -12,9 +15,27 @@ def get_public_http_client() -> Client:
     """
     return Client(
         base_url=settings.http_client.client_url,
-        timeout=settings.http_client.timeout,
+        timeout=settings.http_client.client_timeout,
+        transport=shared_transport,  # Публичные клиенты тоже используют общий пул соединений
         event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],
-            "response": [log_response_event_hook]
+            "request": [curl_event_hook, log_request_event_hook, metrics_request_event_hook],
+            "response": [metrics_response_event_hook, log_response_event_hook]
         }
-    )
\ No newline at end of file
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция создает экземпляр объекта httpx.AsyncClient с базовыми настройками.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        base_url=settings.http_client.client_url,
+        timeout=settings.http_client.client_timeout,
+        transport=build_async_transport(),  # пул соединений с http2 и limits из настроек или stand-in приложение
+        event_hooks={
+            "request": [async_curl_event_hook, async_log_request_event_hook, async_metrics_request_event_hook],
+            "response": [async_metrics_response_event_hook, async_log_response_event_hook]
+        }
+    )
@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from http import HTTPStatus
+from typing import Callable, NamedTuple
+
+from pydantic import BaseModel
+
+from clients.api_response import APIResponse
+from config import settings
+from tools.logger import get_logger
+
+
+
+logger = get_logger("RESOURCES_REGISTRY")
+
+
+class ResourceKind(str, Enum):
+    # Порядок объявления — порядок удаления (обратный порядку зависимостей: file -> course -> exercise, user владеет всеми)
+    EXERCISE = "exercise"
+    COURSE = "course"
+    FILE = "file"
+    USER = "user"
+
+    def __str__(self):
+        return self.value
+
+
+class ResourceScope(str, Enum):
+    SESSION = "session"
+    MODULE = "module"
+    FUNCTION = "function"
+
+    def __str__(self):
+        return self.value
+
+    @classmethod
+    def from_fixture_scope(cls, scope: str) -> "ResourceScope":
+        """
+        :param scope: скоуп фикстуры pytest (session, package, module, class, function)
+        :return: скоуп очистки: package очищается в конце сессии, class — в конце модуля
+        """
+        return {"package": cls.SESSION, "class": cls.MODULE}.get(scope) or cls(scope)
+
+
+class TrackedResource(NamedTuple):
+    kind: ResourceKind
+    id: str
+    delete: Callable[[str], APIResponse]  # функция удаления, принимает идентификатор ресурса
+
+
+class TeardownSummarySchema(BaseModel):
+    """
+    Итог удаления ресурсов: 404 при удалении считается "уже удален" (например, тест удалил ресурс сам).
+    """
+    deleted: int = 0
+    already_deleted: int = 0
+    failed: list[str] = []  # ресурсы, которые не удалось удалить (утечки)
+
+    def merge(self, other: "TeardownSummarySchema"):
+        self.deleted += other.deleted
+        self.already_deleted += other.already_deleted
+        self.failed.extend(other.failed)
+
+    def __str__(self) -> str:
+        return f"удалено: {self.deleted}, уже удалено: {self.already_deleted}, не удалось удалить: {len(self.failed)}"
+
+
+class ResourcesRegistry:
+    """
+    Реестр созданных в тестах ресурсов.
+
+    Клиенты записывают успешно созданные ресурсы в текущий скоуп (скоуп фикстуры, которая их создала, или function
+    для тела теста). В конце скоупа ресурсы удаляются параллельными пачками по типам в порядке ResourceKind.
+    Пока реестр выключен (вне pytest или RESOURCES.CLEANUP=false), ресурсы не записываются.
+    """
+
+    def __init__(self, workers: int):
+        """
+        :param workers: сколько запросов на удаление выполнять одновременно
+        """
+        self.workers = workers
+        self.enabled = False
+        self.current_scope = ResourceScope.FUNCTION
+        self.summary = TeardownSummarySchema()
+        self._resources: dict[ResourceScope, list[TrackedResource]] = {scope: [] for scope in ResourceScope}
+        self._lock = threading.Lock()
+
+    def track(self, kind: ResourceKind, response: APIResponse, key: str, delete: Callable[[str], APIResponse]):
+        """
+        Записывает ресурс из успешного ответа на создание.
+
+        :param kind: тип ресурса
+        :param response: ответ на запрос создания
+        :param key: ключ объекта в теле ответа, например "course" для {"course": {"id": ...}}
+        :param delete: функция удаления ресурса по идентификатору
+        """
+        if not self.enabled or not response.is_success:
+            return
+
+        resource = TrackedResource(kind=kind, id=response.json()[key]["id"], delete=delete)
+        with self._lock:
+            self._resources[self.current_scope].append(resource)
+
+    def delete(self, resource: TrackedResource) -> TeardownSummarySchema:
+        """
+        :param resource: ресурс для удаления
+        :return: итог удаления одного ресурса
+        """
+        summary = TeardownSummarySchema()
+        try:
+            response = resource.delete(resource.id)
+        except Exception as error:
+            summary.failed.append(f"{resource.kind} {resource.id}: {error!r}")
+            return summary
+
+        if response.is_success:
+            summary.deleted += 1
+        elif response.status_code == HTTPStatus.NOT_FOUND:
+            summary.already_deleted += 1
+        else:
+            summary.failed.append(f"{resource.kind} {resource.id}: {response.status_code} {response.text[:200]}")
+
+        return summary
+
+    def teardown(self, scope: ResourceScope) -> TeardownSummarySchema:
+        """
+        Удаляет ресурсы скоупа: сначала все задания, затем курсы, файлы и пользователей; внутри типа — параллельно.
+
+        :param scope: скоуп, ресурсы которого нужно удалить
+        :return: итог удаления
+        """
+        with self._lock:
+            resources, self._resources[scope] = self._resources[scope], []
+
+        summary = TeardownSummarySchema()
+        if not resources:
+            return summary
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="resources-teardown") as executor:
+            for kind in ResourceKind:
+                batch = [resource for resource in resources if resource.kind is kind]
+                for result in executor.map(self.delete, batch):
+                    summary.merge(result)
+
+        for failed in summary.failed:
+            logger.warning("Не удалось удалить ресурс (%s): %s", scope, failed)
+
+        logger.info("Очистка ресурсов (%s): %s", scope, summary)
+        with self._lock:
+            self.summary.merge(summary)
+
+        return summary
+
+
+resources_registry = ResourcesRegistry(workers=settings.resources.workers)
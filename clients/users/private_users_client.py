@@ -1,12 +1,12 @@
-from httpx import Response
+from clients.api_response import APIResponse
 
-from clients.api_client import APIClient
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.api_client import APIClient, AsyncAPIClient
+from clients.private_http_builder import get_private_http_client, get_async_private_http_client, AuthenticationUserSchema
 from clients.users.users_schema import GetUserResponseSchema, UpdateUserRequestSchema
-import allure
 
 from tools.routes import APIRoutes
-from clients.api_coverage import tracker
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from tools.allure.steps import step, async_step
 
 
 class PrivateUsersClient(APIClient):
@@ -14,51 +14,51 @@ class PrivateUsersClient(APIClient):
     Клиент для работы с /api/v1/users
     """
 
-    @allure.step("Получение текущего пользователя")
+    @step("Получение текущего пользователя")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/me")
-    def get_user_me_api(self) -> Response:
+    def get_user_me_api(self) -> APIResponse:
         """
         Метод получения текущего пользователя.
 
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.USERS}/me")
 
-    @allure.step("Получение пользователя по идентификатору {user_id}")
+    @step("Получение пользователя по идентификатору {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}") # /{{user_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def get_user_api(self, user_id: str) -> Response:
+    def get_user_api(self, user_id: str) -> APIResponse:
         """
         Метод получения пользователя по идентификатору.
 
         :param user_id: Идентификатор пользователя.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.USERS}/{user_id}")
 
-    @allure.step("Обновление пользователя по идентификатору {user_id}")
+    @step("Обновление пользователя по идентификатору {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")  # /{{user_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
+    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> APIResponse:
         """
         Метод обновления пользователя по идентификатору.
 
         :param user_id: Идентификатор пользователя.
         :param request: Словарь с email, lastName, firstName, middleName.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True)) # Отправляем PATCH-запрос на обновление пользователя с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса UpdateUserRequestShema
 
-    @allure.step("Удаление пользователя по идентификатору {user_id}")
+    @step("Удаление пользователя по идентификатору {user_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.USERS}/{{user_id}}")  # /{{user_id}} экранируем фигурные скобки, чтобы избежать ошибки в декораторе tracker
-    def delete_user_api(self, user_id: str) -> Response:
+    def delete_user_api(self, user_id: str) -> APIResponse:
         """
         Метод удаления пользователя по идентификатору.
 
         :param user_id: Идентификатор пользователя.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.USERS}/{user_id}")
 
-    @allure.step("Получение текущего пользователя с помощью метода get_user_me")
+    @step("Получение текущего пользователя с помощью метода get_user_me")
     def get_user(self, user_id: str) -> GetUserResponseSchema:
         """
         Метод получения текущего пользователя.
@@ -66,13 +66,81 @@ class PrivateUsersClient(APIClient):
         :return: Словарь с данными пользователя.
         """
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text) # Преобразуем ответ в словарь с данными пользователя с помощью метода model_validate_json класса GetUserResponseShema
+        return response.model(GetUserResponseSchema)  # Тело ответа разбирается один раз и кэшируется в APIResponse
 
-@allure.step("Создание экземпляра PrivateUsersClient")
+@step("Создание экземпляра PrivateUsersClient")
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
     """
     Функция создает экземпляр PrivateUsersClient с уже настроенным HTTP-клиентом.
 
     :return: Готовый к использованию PrivateUsersClient.
     """
-    return PrivateUsersClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
\ No newline at end of file
+    return PrivateUsersClient(client=get_private_http_client(user))  # Настройка клиента с базовым URL и таймаутом
+
+
+class AsyncPrivateUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    @async_step("Получение текущего пользователя")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/me")
+    async def get_user_me_api(self) -> APIResponse:
+        """
+        Метод получения текущего пользователя.
+
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(f"{APIRoutes.USERS}/me")
+
+    @async_step("Получение пользователя по идентификатору {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def get_user_api(self, user_id: str) -> APIResponse:
+        """
+        Метод получения пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.get(f"{APIRoutes.USERS}/{user_id}")
+
+    @async_step("Обновление пользователя по идентификатору {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> APIResponse:
+        """
+        Метод обновления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :param request: Словарь с email, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+
+    @async_step("Удаление пользователя по идентификатору {user_id}")
+    @track_coverage_httpx_async(f"{APIRoutes.USERS}/{{user_id}}")
+    async def delete_user_api(self, user_id: str) -> APIResponse:
+        """
+        Метод удаления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        return await self.delete(f"{APIRoutes.USERS}/{user_id}")
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        """
+        Метод получения пользователя по идентификатору.
+
+        :return: Словарь с данными пользователя.
+        """
+        response = await self.get_user_api(user_id)
+        return response.model(GetUserResponseSchema)
+
+
+async def get_async_private_users_client(user: AuthenticationUserSchema) -> AsyncPrivateUsersClient:
+    """
+    Функция создает экземпляр AsyncPrivateUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
@@ -1,11 +1,13 @@
-from httpx import Response  # импортируем класс Response из библиотеки httpx для работы с ответами на HTTP-запросы
+from clients.api_response import APIResponse  # импортируем обертку над httpx.Response, которая разбирает тело ответа один раз
 
-from clients.api_coverage import tracker
-from clients.public_http_builder import get_public_http_client # импортируем функцию get_public_http_client для создания HTTP-клиента с настройками для публичных запросов
-from clients.api_client import APIClient  # импортируем базовый класс ApiClient для выполнения HTTP-запросов
+from clients.api_coverage import tracker, track_coverage_httpx_async
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client # импортируем функцию get_public_http_client для создания HTTP-клиента с настройками для публичных запросов
+from clients.api_client import APIClient, AsyncAPIClient  # импортируем базовый класс ApiClient для выполнения HTTP-запросов
+from clients.resources_registry import resources_registry, ResourceKind
+from clients.users.private_users_client import AuthenticationUserSchema, get_private_users_client
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema # импортируем схемы CreateUserRequestSchema и CreateUserResponseSchema для создания и получения данных пользователя
-import allure
 
+from tools.allure.steps import step, async_step
 from tools.routes import APIRoutes
 
 
@@ -15,21 +17,25 @@ class PublicUsersClient(APIClient):  # создаем класс PublicUsersClie
     Клиент для работы с /api/v1/users для создания пользователя
     """
 
-    @allure.step("Создание пользователя")
+    @step("Создание пользователя")
     @tracker.track_coverage_httpx(APIRoutes.USERS)
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:  # создаем метод для отправки запроса на создание пользователя в системе и получение ответа от сервера
+    def create_user_api(self, request: CreateUserRequestSchema) -> APIResponse:  # создаем метод для отправки запроса на создание пользователя в системе и получение ответа от сервера
         """
         Метод выполняет создание нового пользователя в системе с помощью POST-запроса.
 
         :param request: Словарь с данными запроса, содержащим следующие поля: email, password, lastName, firstName, middleName.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
-        return self.post(APIRoutes.USERS,json=request.model_dump(by_alias=True))  # отправляем POST-запрос на создание пользователя с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса CreateUserRequestSchema
+        response = self.post(APIRoutes.USERS,json=request.model_dump(by_alias=True))  # отправляем POST-запрос на создание пользователя с данными из словаря request, преобразованного в JSON с помощью метода model_dump класса CreateUserRequestSchema
+        # запоминаем пользователя, чтобы удалить его (от его же имени) в конце скоупа фикстуры или теста
+        user = AuthenticationUserSchema(email=request.email, password=request.password)
+        resources_registry.track(ResourceKind.USER, response, "user", lambda user_id: get_private_users_client(user).delete_user_api(user_id))
+        return response
 
 
     def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema: # создаем метод для отправки запроса на создание пользователя в системе и получения ответа от сервера и преобразования ответа в словарь с данными пользователя
         response = self.create_user_api(request)  # вызываем метод create_user_api для отправки запроса на создание пользователя и получения ответа от сервера
-        return CreateUserResponseSchema.model_validate_json(response.text) # преобразуем ответ в словарь с данными пользователя с помощью метода model_value_json класса CreateUserResponseShema
+        return response.model(CreateUserResponseSchema)  # Тело ответа разбирается один раз и кэшируется в APIResponse
 
 
 # Добавляем builder для PublicUsersClient
@@ -40,3 +46,39 @@ def get_public_users_client() -> PublicUsersClient:
     return: Готовый к использованию PublicUsersClient.
     """
     return PublicUsersClient(client = get_public_http_client())
+
+
+class AsyncPublicUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users для создания пользователя
+    """
+
+    @async_step("Создание пользователя")
+    @track_coverage_httpx_async(APIRoutes.USERS)
+    async def create_user_api(self, request: CreateUserRequestSchema) -> APIResponse:
+        """
+        Метод выполняет создание нового пользователя в системе с помощью POST-запроса.
+
+        :param request: Словарь с данными запроса, содержащим следующие поля: email, password, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта APIResponse
+        """
+        response = await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+        # удаление в конце скоупа выполняет синхронный клиент от имени созданного пользователя: teardown реестра синхронный
+        user = AuthenticationUserSchema(email=request.email, password=request.password)
+        resources_registry.track(ResourceKind.USER, response, "user", lambda user_id: get_private_users_client(user).delete_user_api(user_id))
+        return response
+
+
+    async def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
+        response = await self.create_user_api(request)
+        return response.model(CreateUserResponseSchema)
+
+
+# Добавляем builder для AsyncPublicUsersClient
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создает экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    return: Готовый к использованию AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
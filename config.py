@@ -1,20 +1,117 @@
-from typing import Self
+from pathlib import Path
+from typing import Literal, Self
 
+from httpx import Limits, Timeout
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
 
 
 class HTTPClientConfig(BaseModel):  # настройки http клиента
     url: HttpUrl  # урл
-    timeout: float  # таймаут
+    timeout: float  # таймаут по умолчанию для всех фаз запроса
+    connect_timeout: float | None = None  # таймаут установки соединения (None — используется timeout)
+    read_timeout: float | None = None  # таймаут чтения ответа (None — используется timeout)
+    write_timeout: float | None = None  # таймаут отправки запроса (None — используется timeout)
+    pool_timeout: float | None = None  # таймаут ожидания свободного соединения в пуле (None — используется timeout)
+    http2: bool = False  # мультиплексирование запросов по HTTP/2 (нужен пакет h2: pip install httpx[http2])
+    max_connections: int | None = 100  # максимальное количество соединений в пуле (None — без ограничений)
+    max_keepalive_connections: int | None = 20  # максимальное количество простаивающих keep-alive соединений
+    keepalive_expiry: float | None = 5.0  # через сколько секунд простоя keep-alive соединение закрывается
+    private_clients_max_size: int = 32  # максимальное количество приватных клиентов в реестре (LRU)
 
     @property
     def client_url(self) -> str:  # перевод урла в строку
         return str(self.url)
 
+    @property
+    def client_timeout(self) -> Timeout:  # таймауты по фазам запроса, незаданные берутся из timeout
+        return Timeout(
+            self.timeout,
+            connect=self.connect_timeout if self.connect_timeout is not None else self.timeout,
+            read=self.read_timeout if self.read_timeout is not None else self.timeout,
+            write=self.write_timeout if self.write_timeout is not None else self.timeout,
+            pool=self.pool_timeout if self.pool_timeout is not None else self.timeout
+        )
+
+    @property
+    def client_limits(self) -> Limits:  # ограничения пула соединений
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+
+class TokensStorageConfig(BaseModel):  # настройки хранилища токенов, общего для воркеров xdist и повторных запусков
+    enabled: bool = True  # если False, каждый приватный клиент выполняет логин
+    file: Path = Path("./.cache/tokens.sqlite3")  # путь к файлу SQLite с токенами
+    access_token_ttl: float = 1800  # время жизни access токена, если его не удалось прочитать из JWT
+    refresh_token_ttl: float = 5184000  # время жизни refresh токена, если его не удалось прочитать из JWT
+    refresh_ahead: float = 60  # за сколько секунд до истечения access токена приватные клиенты обновляют его через refresh
+
+
+class CurlConfig(BaseModel):  # настройки cURL команд, прикрепляемых к отчету при падении теста
+    buffer_size: int = 20  # сколько последних запросов теста хранить в кольцевом буфере
+    max_body_size: int = 4096  # сколько байт тела запроса выводить в команде, остальное усекается
+
+
+class LoggingConfig(BaseModel):  # настройки логирования
+    level: str = "DEBUG"  # уровень логгеров по умолчанию
+    levels: dict[str, str] = {}  # уровни отдельных логгеров, например {"HTTP_LOGGER": "WARNING"}
+    sample_rates: dict[str, float] = {}  # доля выводимых INFO записей, например {"HTTP_LOGGER": 0.1}
+    jsonl_file: Path | None = None  # путь к структурированному логу в формате JSONL (None — не писать)
+
+
+class FakersConfig(BaseModel):  # настройки генерации тестовых данных (tools/fakers.py)
+    seed: int | None = None  # базовый сид Faker; сид воркера выводится из него и PYTEST_XDIST_WORKER (None — новый сид на каждый запуск)
+    pool_size: int = 1024  # сколько значений генерировать за раз в пулы fake/fake_ru (0 — генерировать по одному значению через Faker)
+
+
+class UsersPoolConfig(BaseModel):  # настройки пула пользователей воркера (маркер users_pool)
+    shared_size: int = 2  # сколько общих пользователей создать заранее
+    exclusive_size: int = 4  # сколько пользователей для эксклюзивной аренды создать заранее
+    workers: int = 8  # сколько пользователей создавать параллельно
+
+
+class ResourcesConfig(BaseModel):  # настройки удаления созданных в тестах ресурсов (clients/resources_registry.py)
+    cleanup: bool = True  # удалять пользователей, файлы, курсы и задания в конце скоупа фикстуры, которая их создала
+    workers: int = 8  # сколько запросов на удаление выполнять одновременно
+
+
+class UploadCacheConfig(BaseModel):  # настройки кэша содержимого загружаемых файлов (tools/http/upload_cache.py)
+    max_file_size: int = 1024 * 1024  # файлы не больше этого размера (в байтах) читаются один раз и хранятся в памяти воркера (0 — не кэшировать)
+
+
+class StandInConfig(BaseModel):  # локальная замена сервиса LMS (tools/stand_in)
+    mode: Literal["off", "asgi", "server"] = "off"  # off — настоящий сервис, asgi — в процессе без сети, server — локальный HTTP сервер
+    host: str = "127.0.0.1"  # адрес локального сервера в режиме server
+    port: int = 0  # порт локального сервера в режиме server (0 — любой свободный)
+
+
+class CassettesConfig(BaseModel):  # запись и воспроизведение HTTP обменов (tools/http/cassettes.py)
+    mode: Literal["passthrough", "record", "replay"] = "passthrough"  # record — записывать кассеты тестов, replay — отвечать из них без сети
+    file: Path = Path("./.cache/cassettes.sqlite3")  # путь к файлу SQLite с кассетами
+
+
+class MetricsConfig(BaseModel):  # гистограммы задержек запросов по маршрутам (tools/http/latency.py)
+    enabled: bool = True  # замерять задержки запросов в event hooks клиентов
+    report_file: Path = Path("./latency-report.json")  # куда сохранить отчет о задержках в конце сессии
+
+
+class CoverageConfig(BaseModel):  # сбор покрытия эндпоинтов (clients/api_coverage.py)
+    enabled: bool = True  # сохранять покрытие каждого запроса (отключают нагрузка и бенчмарки)
+
+
+class SLAConfig(BaseModel):  # допустимое время ответа маршрутов, проверяется для каждого запроса (tools/assertions/performance.py)
+    enabled: bool = True  # проверять время ответа в event hooks клиентов
+    routes: dict[str, float] = {}  # "METHOD /route" или "/route" -> миллисекунды, например {"GET /api/v1/courses/{course_id}": 300}
+    default: float | None = None  # миллисекунды для маршрутов без записи в routes (None — не проверять)
+
 
 class TestDataConfig(BaseModel):  # настройки тестовых данных
     image_png_file: FilePath  # путь к файлу с изображением
+    generated_files_dir: Path = Path("./.cache/generated-files")  # куда складывать сгенерированные файлы (tools/generated_files.py)
+    generated_files_seed: int = 0  # сид содержимого сгенерированных файлов
 
 
 class Settings(BaseSettings):  # настройки
@@ -27,7 +124,20 @@ class Settings(BaseSettings):  # настройки
 
     test_data: TestDataConfig  # настройки тестовых данных
     http_client: HTTPClientConfig # настройки http клиента
+    tokens_storage: TokensStorageConfig = TokensStorageConfig()  # настройки хранилища токенов
+    curl: CurlConfig = CurlConfig()  # настройки cURL команд в отчете
+    logging: LoggingConfig = LoggingConfig()  # настройки логирования
+    fakers: FakersConfig = FakersConfig()  # настройки генерации тестовых данных
+    users_pool: UsersPoolConfig = UsersPoolConfig()  # настройки пула пользователей
+    resources: ResourcesConfig = ResourcesConfig()  # настройки удаления созданных ресурсов
+    upload_cache: UploadCacheConfig = UploadCacheConfig()  # настройки кэша загружаемых файлов
+    stand_in: StandInConfig = StandInConfig()  # локальная замена сервиса
+    cassettes: CassettesConfig = CassettesConfig()  # настройки кассет
+    metrics: MetricsConfig = MetricsConfig()  # настройки метрик задержек
+    sla: SLAConfig = SLAConfig()  # допустимое время ответа маршрутов
+    coverage: CoverageConfig = CoverageConfig()  # настройки сбора покрытия
     allure_results_dir: DirectoryPath
+    allure_fast_mode: bool | None = None  # True — отключить шаги и вложения Allure, False — всегда формировать, None — автоматически (по --alluredir)
 
     @classmethod
     def initialize(cls) -> Self: # Возвращает экземпляр класса Settings
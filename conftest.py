@@ -4,6 +4,10 @@ pytest_plugins = (
     "fixtures.courses",
     "fixtures.exercises",
     "fixtures.authentication",
+    "fixtures.http_clients",
+    "fixtures.cassettes",
+    "fixtures.metrics",
+    "fixtures.resources",
 
     "fixtures.allure"
 )
\ No newline at end of file
@@ -1,9 +1,34 @@
 import pytest
 
 from tools.allure.environment import create_allure_environment_file
+from tools.allure.steps import configure_allure_mode, attach, is_allure_enabled
+from tools.http.requests_buffer import requests_buffer
 
 
 @pytest.fixture(scope='session', autouse=True)
 def save_allure_environment_file():
     yield
-    create_allure_environment_file()
\ No newline at end of file
+    create_allure_environment_file()
+
+
+# trylast: режим определяем после того, как allure-pytest зарегистрирует свои обработчики (при запуске с --alluredir)
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config):
+    configure_allure_mode()
+
+
+# Каждый тест начинает с пустого буфера запросов
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    requests_buffer.clear()
+
+
+# При падении теста (на любом этапе) прикрепляем к отчету cURL команды последних запросов
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+
+    if report.failed and len(requests_buffer) and is_allure_enabled():
+        attach(requests_buffer.render_curl(), name="cURL commands")
+        requests_buffer.clear()  # чтобы при падении и в call, и в teardown команды не прикреплялись дважды
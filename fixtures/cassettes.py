@@ -0,0 +1,40 @@
+import zlib
+
+import pytest
+
+from config import settings
+from tools.fakers import get_worker_id, reseed_fakers, reseeded_fakers
+from tools.http.cassettes import cassette_recorder
+
+
+def get_cassette_seed(name: str) -> int:
+    """
+    :return: сид кассеты: зависит только от ее имени и FAKERS.SEED, но не от порядка запуска тестов
+    """
+    return zlib.crc32(name.encode()) ^ (settings.fakers.seed or 0)
+
+
+# При записи и воспроизведении каждый тест (вместе с setup и teardown фикстур) работает со своей кассетой,
+# а fake и fake_ru засеваются сидом теста, чтобы данные запросов совпадали с записанными ответами
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None):
+    if settings.cassettes.mode == "passthrough":
+        yield
+        return
+
+    reseed_fakers(get_cassette_seed(item.nodeid))
+    with cassette_recorder.use(item.nodeid):
+        yield
+
+
+# Фикстуры шире function подготавливаются в первом использующем их тесте, который зависит от выбора и порядка тестов.
+# Поэтому их запросы пишутся в отдельную кассету воркера, а данные генерируются ее сидом
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest):
+    if settings.cassettes.mode == "passthrough" or fixturedef.scope == "function":
+        yield
+        return
+
+    name = f"{fixturedef.argname}@{request.node.nodeid or 'session'}:{get_worker_id()}"
+    with reseeded_fakers(get_cassette_seed(name), scope=get_worker_id()), cassette_recorder.use(name):
+        yield
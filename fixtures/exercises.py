@@ -18,10 +18,14 @@ def exercises_client(function_user: UserFixture) -> ExercisesClient:
     return get_exercises_client(function_user.authentication_user)
 
 
-@pytest.fixture
-def function_exercise(
-    exercises_client: ExercisesClient, function_user: UserFixture, function_course: CourseFixture) -> ExerciseFixture:
+def create_exercise(exercises_client: ExercisesClient, function_course: CourseFixture) -> ExerciseFixture:
     request = CreateExerciseRequestSchema(course_id = function_course.response.course.id)
     response = exercises_client.create_exercise(request)
 
-    return ExerciseFixture(request=request, response=response)
\ No newline at end of file
+    return ExerciseFixture(request=request, response=response)
+
+
+@pytest.fixture
+def function_exercise(
+    exercises_client: ExercisesClient, function_user: UserFixture, function_course: CourseFixture) -> ExerciseFixture:
+    return create_exercise(exercises_client, function_course)
\ No newline at end of file
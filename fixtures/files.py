@@ -1,8 +1,11 @@
+from pathlib import Path
+
 import pytest
 from pydantic import BaseModel
 from fixtures.users import UserFixture
 from clients.files.files_client import FilesClient, get_files_client
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from tools.generated_files import FileSizeClass, GeneratedFileKind, get_generated_file
 
 
 class FileFixture(BaseModel):
@@ -15,9 +18,21 @@ class FileFixture(BaseModel):
 def files_client(function_user: UserFixture) -> FilesClient: # В аргумент передается function_user — пользователь, полученный через фикстуру UserFixture. Используется метод get_files_client, который создает клиент, уже настроенный для работы от имени данного пользователя.
     return get_files_client(function_user.authentication_user) #Фикстура возвращает объект FilesClient, который можно использовать в тестах.
 
-# Фикстура автоматически создает тестовый файл перед каждым тестом и возвращает информацию о нем
-@pytest.fixture
-def function_file(files_client: FilesClient) -> FileFixture:
+def create_file(files_client: FilesClient) -> FileFixture:
     request = CreateFileRequestSchema(upload_file="./testdata/files/image.png") # Создается объект request типа CreateFileRequestSchema, в котором указывается путь к тестовому файлу (./testdata/files/image.png).
     response = files_client.create_file(request) # Затем files_client.create_file(request) отправляет запрос в API, загружая файл.
     return FileFixture(request=request, response=response) # После успешного создания файла возвращается объект FileFixture, содержащий данные запроса и ответа API.
+
+
+# Фикстура автоматически создает тестовый файл перед каждым тестом и возвращает информацию о нем
+@pytest.fixture
+def function_file(files_client: FilesClient) -> FileFixture:
+    return create_file(files_client)
+
+
+# Фикстура возвращает сгенерированный файл нужного размера; параметр передается через indirect-параметризацию:
+# @pytest.mark.parametrize("generated_file", [FileSizeClass.SMALL, (FileSizeClass.LARGE, GeneratedFileKind.RANDOM)], indirect=True)
+@pytest.fixture
+def generated_file(request: pytest.FixtureRequest) -> Path:
+    size, kind = request.param if isinstance(request.param, tuple) else (request.param, GeneratedFileKind.PNG)
+    return get_generated_file(size, kind)  # файл создается на диске при первом запросе и переиспользуется
@@ -0,0 +1,22 @@
+import pytest
+
+from clients.private_http_builder import private_http_clients
+from tools.logger import get_logger
+from tools.stand_in import start_stand_in
+
+
+logger = get_logger("HTTP_CLIENTS")
+
+
+def pytest_configure(config: pytest.Config):
+    # В режиме STAND_IN.MODE=server адрес сервиса подменяется до создания первых клиентов
+    start_stand_in()
+
+
+# Фикстура закрывает все приватные клиенты и общий пул соединений в конце сессии (в каждом воркере xdist)
+@pytest.fixture(scope='session', autouse=True)
+def close_private_http_clients():
+    yield
+    stats = private_http_clients.stats
+    logger.info(f"Закрываем приватные клиенты: клиентов {stats.live_clients}, открытых соединений {stats.open_sockets}")
+    private_http_clients.close()
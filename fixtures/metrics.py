@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+from allure_commons.types import AttachmentType
+
+from config import settings
+from tools.allure.features import AllureFeature
+from tools.allure.results import write_allure_result
+from tools.assertions.performance import sla_violations
+from tools.http.latency import latency_collector
+from tools.logger import get_logger
+
+
+logger = get_logger("METRICS")
+
+
+# Нарушения SLA считаются для запросов теста и его фикстур, начиная с setup
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    sla_violations.clear()
+
+
+# Тест, прошедший проверки, падает, если какой-либо запрос (в setup или в самом тесте) был медленнее SLA маршрута
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    outcome = yield
+    violations = sla_violations.pop_all()
+    if violations and outcome.excinfo is None:
+        outcome.force_exception(pytest.fail.Exception("Превышено время ответа по SLA:\n" + "\n".join(violations), pytrace=False))
+
+
+# Гистограммы воркера xdist передаются контроллеру вместе с результатами воркера
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if histograms := getattr(node, "workeroutput", {}).get("latency_histograms"):
+        latency_collector.merge(histograms)
+
+
+# Отчет строит процесс, который видит все гистограммы: контроллер xdist (после завершения воркеров) или единственный процесс
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
+    if not settings.metrics.enabled:
+        return
+
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["latency_histograms"] = latency_collector.dump()
+        return
+
+    report = latency_collector.build_report()
+    if not report.requests:
+        return
+
+    report_json = report.model_dump_json(indent=2)
+    settings.metrics.report_file.parent.mkdir(parents=True, exist_ok=True)
+    settings.metrics.report_file.write_text(report_json, encoding="utf-8")
+    logger.info(
+        "Задержки запросов: %s запросов за %.1f с (%.1f запросов/с), отчет сохранен в %s\n%s",
+        report.requests, report.duration, report.throughput, settings.metrics.report_file,
+        "\n".join(str(route) for route in report.routes)
+    )
+
+    if alluredir := session.config.getoption("allure_report_dir", None):
+        write_allure_result(
+            name="Задержки запросов по маршрутам",
+            attachments={"latency-report.json": (report_json, AttachmentType.JSON)},
+            feature=AllureFeature.PERFORMANCE,
+            parameters={"workers": str(report.workers), "requests": str(report.requests)},
+            results_dir=Path(alluredir)
+        )
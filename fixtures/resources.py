@@ -0,0 +1,45 @@
+import pytest
+
+from clients.resources_registry import resources_registry, ResourceScope
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger("RESOURCES_REGISTRY")
+
+
+def pytest_configure(config: pytest.Config):
+    resources_registry.enabled = settings.resources.cleanup
+
+
+# Ресурсы, созданные при подготовке фикстуры, относятся к ее скоупу: пользователи пула (session) живут до конца сессии
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest):
+    previous_scope = resources_registry.current_scope
+    resources_registry.current_scope = ResourceScope.from_fixture_scope(fixturedef.scope)
+    yield
+    resources_registry.current_scope = previous_scope
+
+
+# Фикстуры очистки объявлены после fixtures.http_clients в pytest_plugins, поэтому выполняются раньше закрытия клиентов
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_session_resources():
+    yield
+    resources_registry.teardown(ResourceScope.SESSION)
+
+    summary = resources_registry.summary
+    logger.info("Итог очистки ресурсов за сессию: %s", summary)
+    for failed in summary.failed:
+        logger.warning("Утечка ресурса: %s", failed)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cleanup_module_resources():
+    yield
+    resources_registry.teardown(ResourceScope.MODULE)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_function_resources():
+    yield
+    resources_registry.teardown(ResourceScope.FUNCTION)
@@ -1,11 +1,19 @@
+from typing import Iterator
+
 import pytest
 from pydantic import BaseModel, EmailStr
 
-from clients.private_http_builder import AuthenticationUserSchema
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
 from clients.users.private_users_client import PrivateUsersClient, get_private_users_client
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
 # Импортируем API клиент
 from clients.users.public_users_client import get_public_users_client, PublicUsersClient
+from config import settings
+from tools.logger import get_logger
+from tools.users_pool import UsersPool
+
+
+logger = get_logger("USERS_POOL")
 
 
 
@@ -37,11 +45,46 @@ def private_users_client(function_user: UserFixture) -> PrivateUsersClient: # А
     return get_private_users_client(function_user.authentication_user) # Создаем новый API клиент для работы с приватным API пользователей, передавая данные аутентификации пользователя из фикстуры function_user
 
 
+def create_pool_user() -> UserFixture:
+    """
+    Создает пользователя для пула и сразу выполняет логин: приватный клиент попадает в реестр,
+    поэтому тесту с арендованным пользователем не нужно ни одного дополнительного запроса.
+    """
+    request = CreateUserRequestSchema()
+    response = get_public_users_client().create_user(request)
+    user = UserFixture(request=request, response=response)
+    get_private_http_client(user.authentication_user)
+    return user
+
+
+# Пул пользователей воркера (в xdist у каждого воркера своя сессия). Создается только если тест с маркером users_pool его запросил
+@pytest.fixture(scope="session")
+def users_pool() -> Iterator[UsersPool[UserFixture]]:
+    pool = UsersPool(
+        create_user=create_pool_user,
+        shared_size=settings.users_pool.shared_size,
+        exclusive_size=settings.users_pool.exclusive_size,
+        # с кассетами пользователи создаются по очереди: данные fake из параллельных потоков не воспроизводимы
+        workers=settings.users_pool.workers if settings.cassettes.mode == "passthrough" else 1
+    )
+    pool.fill()
+    yield pool
+    logger.info("Пул пользователей: %s", pool.stats())
+
+
 # Фикстура для создания пользователя
 @pytest.fixture
-def function_user(public_users_client: PublicUsersClient) -> UserFixture: # Используем фикстуру public_users_client, которая создает нужный API клиент
+def function_user(request: pytest.FixtureRequest, public_users_client: PublicUsersClient) -> Iterator[UserFixture]: # Используем фикстуру public_users_client, которая создает нужный API клиент
+    # тест с маркером users_pool получает готового пользователя из пула воркера: без создания пользователя и логина
+    if marker := request.node.get_closest_marker("users_pool"):
+        # с кассетами общий пользователь выбирается по nodeid: ответы в кассете теста записаны для него
+        key = request.node.nodeid if settings.cassettes.mode != "passthrough" else None
+        with request.getfixturevalue("users_pool").lease(*marker.args, key=key, **marker.kwargs) as user:
+            yield user
+        return
+
     # подготовка и отправка запроса на создание пользователя
-    request = CreateUserRequestSchema()
+    create_request = CreateUserRequestSchema()
     # отправка запроса на создание пользователя с помощью метода create_user и данных запроса create_user_request
-    response = public_users_client.create_user(request)
-    return UserFixture(request = request, response = response) # возвращает экземпляр UserFixture, содержащий запрос и ответ на создание пользователя
\ No newline at end of file
+    response = public_users_client.create_user(create_request)
+    yield UserFixture(request = create_request, response = response) # возвращает экземпляр UserFixture, содержащий запрос и ответ на создание пользователя
\ No newline at end of file
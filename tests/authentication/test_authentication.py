@@ -18,6 +18,7 @@ import allure
 
 
 @pytest.mark.regression
+@pytest.mark.users_pool("shared")  # тесты класса не зависят от состояния пользователя: берем общего пользователя из пула воркера
 @pytest.mark.authentication
 @allure.tag(AllureTag.AUTHENTICATION, AllureTag.REGRESSION)
 @allure.epic(AllureEpic.LMS)  # статическая аннотация для allure, которая задает эпик для класса. Берутся из Enam AllureEpic
@@ -36,9 +37,9 @@ class TestAuthentication:
         response = authentication_client.login_api(request)
 
         # десериализация JSON-ответа в LoginResponseSchema
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        response_data = response.model(LoginResponseSchema)
 
         # проверки ответа на аутентификацию
         assert_status_code(response.status_code, HTTPStatus.OK)  # проверка, что статус-код ответа соответствует ожидаемому (200 OK)
         assert_login_response(response_data)  # проверка, что ответ соответствует ожидаемому формату
-        validate_json_schema(response.json(), response_data.model_json_schema())  # проверка, что ответ соответствует схеме LoginResponseSchema
\ No newline at end of file
+        validate_json_schema(response.json(), LoginResponseSchema)  # проверка, что ответ соответствует схеме LoginResponseSchema
\ No newline at end of file
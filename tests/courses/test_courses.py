@@ -22,6 +22,7 @@ import allure
 
 @pytest.mark.courses
 @pytest.mark.regression
+@pytest.mark.users_pool("shared")  # тесты класса не зависят от состояния пользователя: берем общего пользователя из пула воркера
 @allure.tag(AllureTag.COURSES, AllureTag.REGRESSION)
 @allure.epic(AllureEpic.LMS)  # статическая аннотация для allure, которая задает эпик для класса. Берутся из Enam AllureEpic
 @allure.feature(AllureFeature.COURSES)  # статическая аннотация для allure, которая задает фичу для класса. Берутся из Enam AllureFeature
@@ -45,15 +46,16 @@ class TestCourses:
         response = courses_client.create_course_api(request)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = CreateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(CreateCourseResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем соответствие данных запроса и ответа (например, поля title, description и т.д.)
         assert_create_course_response(request, response_data)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateCourseResponseSchema)
 
 
+    @pytest.mark.users_pool("exclusive", retire=True)  # список курсов пользователя должен содержать только курс этого теста
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
     @allure.title("Получение курсов по пользователю")
@@ -71,13 +73,13 @@ class TestCourses:
         response = courses_client.get_courses_api(query)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetCoursesResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что список курсов соответствует ранее созданным курсам
         assert_get_courses_response(response_data, [function_course.response])
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetCoursesResponseSchema)
 
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
@@ -92,10 +94,10 @@ class TestCourses:
         response = courses_client.update_course_api(function_course.response.course.id, request) # # Используем ID курса из фикстуры, request-  Передаем данные запроса
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = UpdateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(UpdateCourseResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем соответствие данных запроса и ответа (например, поля title, description и т.д.)
         assert_update_course_response(request, response_data)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(response.json(), UpdateCourseResponseSchema)
\ No newline at end of file
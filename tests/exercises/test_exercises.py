@@ -22,6 +22,7 @@ import allure
 
 @pytest.mark.exercises
 @pytest.mark.regression
+@pytest.mark.users_pool("shared")  # тесты класса не зависят от состояния пользователя: берем общего пользователя из пула воркера
 @allure.tag(AllureTag.EXERCISES, AllureTag.REGRESSION)
 @allure.epic(AllureEpic.LMS)  # статическая аннотация для allure, которая задает эпик для класса. Берутся из Enam AllureEpic
 @allure.feature(AllureFeature.EXERCISES)  # статическая аннотация для allure, которая задает фичу для класса. Берутся из Enam AllureFeature
@@ -44,13 +45,13 @@ class TestExercises:
         response = exercises_client.create_exercise_api(request)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ExerciseResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверьте, что тело ответа соответствует запросу на создание задания
         assert_create_exercise_response(request, response_data)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
@@ -66,13 +67,13 @@ class TestExercises:
         response = exercises_client.get_exercise_api(exercise_id=function_exercise.response.exercise.id)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ExerciseResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что ответ c данными задания соответствует запросу на создание задания
         assert_get_exercise_response(response_data, function_exercise.response)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
@@ -91,13 +92,13 @@ class TestExercises:
         response = exercises_client.update_exercise_api(exercise_id=function_exercise.response.exercise.id, request=request)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = ExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ExerciseResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что тело ответа соответствует запросу на обновление задания
         assert_update_exercise_response(request, response_data)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ExerciseResponseSchema)
 
 
     @allure.tag(AllureTag.DELETE_ENTITY)
@@ -119,14 +120,14 @@ class TestExercises:
         # Проверяем, что задание удалено
         get_exercise_response = exercises_client.get_exercise_api(exercise_id=function_exercise.response.exercise.id)
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        get_exercise_response_data = InternalErrorResponseSchema.model_validate_json(get_exercise_response.text)
+        get_exercise_response_data = get_exercise_response.model(InternalErrorResponseSchema)
         # Проверяем, что статус ответа равен HTTPStatus.NOT_FOUND (404)
         assert_status_code(get_exercise_response.status_code, HTTPStatus.NOT_FOUND)
 
         # Проверяем, что тело ответа на запрос на получение задания по его id равно 404 Exercise not found
         assert_exercise_not_found_response(get_exercise_response_data)
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(get_exercise_response.json(), get_exercise_response_data.model_json_schema())
+        validate_json_schema(get_exercise_response.json(), InternalErrorResponseSchema)
 
 
     @allure.tag(AllureTag.GET_ENTITIES)
@@ -146,7 +147,7 @@ class TestExercises:
         response = exercises_client.get_exercises_api(query)
 
         # Проверяем, что ответ от сервера соответствует ожидаемой структуре (Pydantic-схеме).
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetExercisesResponseSchema)
 
         # Проверяем, что статус ответа равен HTTPStatus.OK (200)
         assert_status_code(response.status_code, HTTPStatus.OK)
@@ -155,5 +156,5 @@ class TestExercises:
         assert_get_exercises_response(response_data, [function_exercise.response])
 
         # Проверяем, что JSON-структура ответа соответствует ожидаемой схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExercisesResponseSchema)
 
@@ -1,10 +1,13 @@
+import asyncio
 from http import HTTPStatus
+from pathlib import Path
 
 import pytest
 from allure_commons.types import Severity
 
+from clients.resources_registry import resources_registry, ResourceScope
 from clients.errors_schema import ValidationErrorResponseSchema, InternalErrorResponseSchema
-from clients.files.files_client import FilesClient
+from clients.files.files_client import FilesClient, get_async_files_client
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema
 from config import settings
 from fixtures.files import FileFixture
@@ -15,13 +18,15 @@ from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.files import assert_create_file_response, assert_get_file_response, \
     assert_create_file_with_empty_filename_response, assert_create_file_with_empty_directory_response, \
-    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response
+    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response, assert_downloaded_file
 from tools.assertions.schema import validate_json_schema
+from tools.generated_files import FileSizeClass
 import allure
 
 
 @pytest.mark.files
 @pytest.mark.regression
+@pytest.mark.users_pool("shared")  # тесты класса не зависят от состояния пользователя: берем общего пользователя из пула воркера
 @allure.tag(AllureTag.FILES, AllureTag.REGRESSION)
 @allure.epic(AllureEpic.LMS)  # статическая аннотация для allure, которая задает эпик для класса. Берутся из Enam AllureEpic
 @allure.feature(AllureFeature.FILES)  # статическая аннотация для allure, которая задает фичу для класса. Берутся из Enam AllureFeature
@@ -36,12 +41,12 @@ class TestFiles:
     def test_create_file(self, files_client: FilesClient):
         request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text) # преобразование ответа в словарь с данными пользователя с помощью метода model_value_json
+        response_data = response.model(CreateFileResponseSchema) # преобразование ответа в словарь с данными пользователя через APIResponse.model (тело разбирается один раз)
 
         assert_status_code(response.status_code, HTTPStatus.OK)  # проверка, что статус ответа равен 200 (успешное создание пользователя)
         assert_create_file_response(request, response_data)  # проверка, что ответ соответствует запросу на создание файла
 
-        validate_json_schema(response.json(), response_data.model_json_schema())  # проверка, что ответ соответствует схеме CreateFileResponseSchema
+        validate_json_schema(response.json(), CreateFileResponseSchema)  # проверка, что ответ соответствует схеме CreateFileResponseSchema
 
 
     @allure.tag(AllureTag.GET_ENTITY)
@@ -51,12 +56,41 @@ class TestFiles:
     @allure.sub_suite(AllureStory.GET_ENTITY)
     def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
         response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+        response_data = response.model(GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)  # проверка, что статус ответа равен 200 (успешное создание пользователя)
         assert_get_file_response(response_data, function_file.response)  # проверка, что ответ соответствует запросу на создание файла
 
-        validate_json_schema(response.json(), response_data.model_json_schema())  # проверка, что ответ соответствует схеме CreateFileResponseSchema
+        validate_json_schema(response.json(), GetFileResponseSchema)  # проверка, что ответ соответствует схеме CreateFileResponseSchema
+
+
+    @allure.tag(AllureTag.GET_ENTITY)
+    @allure.story(AllureStory.GET_ENTITY)
+    @allure.title("Скачивание загруженного файла")
+    @allure.severity(Severity.CRITICAL)
+    @allure.sub_suite(AllureStory.GET_ENTITY)
+    def test_download_file(self, files_client: FilesClient, function_file: FileFixture):
+        result = files_client.download_file(function_file.response.file.url)  # потоковое скачивание с подсчетом sha256 на лету
+
+        assert_downloaded_file(result, function_file.request.upload_file)  # содержимое совпадает с загруженным файлом
+
+
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.title("Загрузка и скачивание сгенерированного файла")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @pytest.mark.parametrize("generated_file", [FileSizeClass.SMALL, FileSizeClass.MEDIUM], indirect=True, ids=str)
+    def test_create_file_by_size(self, files_client: FilesClient, generated_file: Path):
+        request = CreateFileRequestSchema(upload_file=generated_file)
+        response = files_client.create_file_api(request)
+        response_data = response.model(CreateFileResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_create_file_response(request, response_data)
+
+        result = files_client.download_file(response_data.file.url)
+        assert_downloaded_file(result, generated_file)  # содержимое на сервере совпадает с загруженным
 
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -67,12 +101,12 @@ class TestFiles:
     def test_create_file_with_empty_filename(self, files_client: FilesClient):
         request = CreateFileRequestSchema(filename ="", upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)  # проверка, что статус ответа равен 422
         assert_create_file_with_empty_filename_response(response_data)  # проверка, что ответ соответствует запросу на создание файла
 
-        validate_json_schema(response.json(), response_data.model_json_schema()) # проверка, что ответ соответствует схеме CreateFileResponseSchema
+        validate_json_schema(response.json(), ValidationErrorResponseSchema) # проверка, что ответ соответствует схеме CreateFileResponseSchema
 
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -83,12 +117,12 @@ class TestFiles:
     def test_create_file_with_empty_directory(self, files_client: FilesClient):
         request = CreateFileRequestSchema(directory ="", upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.model(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)  # проверка, что статус ответа равен 422
         assert_create_file_with_empty_directory_response(response_data)  # проверка, что ответ соответствует запросу на создание файла
 
-        validate_json_schema(response.json(), response_data.model_json_schema()) #
+        validate_json_schema(response.json(), ValidationErrorResponseSchema) #
 
 
     @allure.tag(AllureTag.DELETE_ENTITY)
@@ -102,12 +136,34 @@ class TestFiles:
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         get_response = files_client.get_file_api(function_file.response.file.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response_data = get_response.model(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_file_not_found_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
+
+
+    @allure.tag(AllureTag.DELETE_ENTITY)
+    @allure.story(AllureStory.DELETE_ENTITY)
+    @allure.title("Удаление файла, созданного асинхронным клиентом, в конце теста")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.DELETE_ENTITY)
+    def test_async_created_file_deleted_at_teardown(self, files_client: FilesClient):
+        async def create_file() -> CreateFileResponseSchema:
+            async_files_client = await get_async_files_client(files_client.user)
+            async with async_files_client.client:
+                return await async_files_client.create_file(CreateFileRequestSchema(upload_file=settings.test_data.image_png_file))
+
+        file_id = asyncio.run(create_file()).file.id
+
+        summary = resources_registry.teardown(ResourceScope.FUNCTION)  # то же, что делает cleanup_function_resources после теста
+
+        assert summary.deleted == 1 and not summary.failed, f"Ожидалось удаление одного файла, получено: {summary}"
+
+        get_response = files_client.get_file_api(file_id)
+        assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
+        assert_file_not_found_response(get_response.model(InternalErrorResponseSchema))
 
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
@@ -119,13 +175,13 @@ class TestFiles:
         # отправляем запрос на получение файла с некорректным file_id
         get_response = files_client.get_file_api(file_id="incorrect-file-id")
         # проверка, что ответ соответствует схеме ValidationErrorResponseSchema
-        response_data = ValidationErrorResponseSchema.model_validate_json(get_response.text)
+        response_data = get_response.model(ValidationErrorResponseSchema)
         # Проверка, что код ответа соответствует ожиданиям (422 - Unprocessable Entity)
         assert_status_code(get_response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)  # проверка, что статус ответа равен 422
         # Проверка, что ответ API соответствует ожидаемой валидационной ошибке
         assert_get_file_with_incorrect_file_id_response(response_data) #
         # Дополнительная проверка структуры JSON, чтобы убедиться, что схема валидационного ответа не изменилась
-        validate_json_schema(get_response.json(), response_data.model_json_schema())
+        validate_json_schema(get_response.json(), ValidationErrorResponseSchema)
 
 
 
@@ -0,0 +1,34 @@
+import pytest
+
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.allure.tags import AllureTag
+from tools.seeding import SeedSpecSchema
+import allure
+from allure_commons.types import Severity
+
+
+@pytest.mark.seeding
+@pytest.mark.regression
+@allure.tag(AllureTag.REGRESSION)
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.SEEDING)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.SEEDING)
+class TestSeeding:
+    @pytest.mark.parametrize(
+        "spec, users, courses, exercises",
+        [
+            ("50", 50, 1, 0),  # курсы и задания не указаны: по умолчанию полей SeedSpecSchema
+            ("50x20", 50, 20, 0),
+            ("50x20x30", 50, 20, 30),
+        ]
+    )
+    @allure.title("Разбор объема данных из строки")
+    @allure.severity(Severity.NORMAL)
+    def test_seed_spec_from_string(self, spec: str, users: int, courses: int, exercises: int):
+        allure.dynamic.title(f"Разбор объема данных {spec}")
+
+        seed_spec = SeedSpecSchema.from_string(spec)
+
+        assert (seed_spec.users, seed_spec.courses, seed_spec.exercises) == (users, courses, exercises)
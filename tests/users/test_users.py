@@ -37,14 +37,15 @@ class TestUser:
 
         request = CreateUserRequestSchema(email=fake.email(domain=email))  # создание запроса на создание пользователя с помощью класса CreateUserRequestSchema, который наследуется от BaseModel для создания моделей данных с помощью Pydantic. Параметр email будет передан в качестве аргумента в метод email класса fake, который генерирует случайный email с указанным доменом из параметрайза.
         response = public_users_client.create_user_api(request)  # отправка запроса на создание пользователя c помощью метода create_user_api (для анализа Response)
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)  # преобразование ответа в словарь с данными пользователя с помощью метода model_value_json класса CreateUserResponseSchema
+        response_data = response.model(CreateUserResponseSchema)  # преобразование ответа в словарь с данными пользователя через APIResponse.model (тело разбирается один раз)
 
         assert_status_code(response.status_code, HTTPStatus.OK)  # проверка, что статус ответа равен 200 (успешное создание пользователя)
         assert_create_user_response(request, response_data)  # проверка, что ответ соответствует запросу на создание пользователя
 
-        validate_json_schema(response.json(), response_data.model_json_schema())  # проверка, что ответ соответствует схеме CreateUserResponseSchema
+        validate_json_schema(response.json(), CreateUserResponseSchema)  # проверка, что ответ соответствует схеме CreateUserResponseSchema
 
 
+    @pytest.mark.users_pool("shared")  # тест только читает данные пользователя: берем общего пользователя из пула воркера
     @allure.tag(AllureTag.GET_ENTITY)  # статическая аннотация для allure, которая задает теги для теста. Берутся из Enam AllureTag
     @allure.story(AllureStory.GET_ENTITY)
     @allure.title("Получение текущего пользователя")
@@ -52,10 +53,10 @@ class TestUser:
     @allure.sub_suite(AllureStory.GET_ENTITY)
     def test_get_user_me(self, function_user: UserFixture, private_users_client: PrivateUsersClient):  # Инициализация клиента private_users_client с помощью фикстуры, которая возвращает экземпляр PrivateUsersClient
         response = private_users_client.get_user_me_api()  # отправка запроса на получение текущего пользователя c помощью метода get_user_me_api (для анализа Response)
-        response_data = GetUserResponseSchema.model_validate_json(response.text)  # преобразование ответа в словарь с данными пользователя с помощью метода model_value_json класса CreateUserResponseSchema
+        response_data = response.model(GetUserResponseSchema)  # преобразование ответа в словарь с данными пользователя через APIResponse.model (тело разбирается один раз)
 
         assert_status_code(response.status_code, HTTPStatus.OK)  # проверка, что статус ответа равен 200 (успешное создание пользователя)
         assert_get_user_response(response_data, function_user.response)  # проверка, что ответ соответствует запросу на создание пользователя. response_data - это ответ на получение пользователя, а function_user.response - это ответ на создание пользователя
 
-        validate_json_schema(response.json(), response_data.model_json_schema())  # проверка, что ответ соответствует схеме GetUserResponseSchema
+        validate_json_schema(response.json(), GetUserResponseSchema)  # проверка, что ответ соответствует схеме GetUserResponseSchema
 
@@ -5,4 +5,6 @@ class AllureFeature(str, Enum):
     FILES = "Files"
     COURSES = "Courses"
     EXERCISES = "Exercises"
-    AUTHENTICATION = "Authentication"
\ No newline at end of file
+    AUTHENTICATION = "Authentication"
+    PERFORMANCE = "Performance"
+    SEEDING = "Seeding"
\ No newline at end of file
@@ -0,0 +1,55 @@
+import time
+import uuid
+from pathlib import Path
+
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult, Attachment, Label, Parameter, Status
+from allure_commons.types import AttachmentType
+
+from config import settings
+from tools.allure.epics import AllureEpic
+
+
+def write_allure_result(
+        name: str,
+        attachments: dict[str, tuple[str | bytes, AttachmentType]],
+        feature: str,
+        parameters: dict[str, str] | None = None,
+        status: str = Status.PASSED,
+        started_at: float | None = None,
+        results_dir: Path | None = None
+):
+    """
+    Записывает в settings.allure_results_dir отдельный результат с вложениями.
+
+    Нужен для запусков вне pytest (бенчмарки) и итогов сессии, где нет текущего теста, к которому можно прикрепить allure.attach.
+
+    :param name: Название результата в отчете.
+    :param attachments: Вложения: название -> (содержимое, тип вложения).
+    :param feature: Фича Allure, в которую попадет результат.
+    :param parameters: Параметры запуска, отображаемые в отчете.
+    :param status: Статус результата (allure_commons.model2.Status).
+    :param started_at: Время начала запуска (time.time()), по умолчанию — текущее.
+    :param results_dir: Папка результатов, по умолчанию — settings.allure_results_dir.
+    """
+    stop = int(time.time() * 1000)
+    result = TestResult(
+        uuid=str(uuid.uuid4()),
+        name=name,
+        fullName=name,
+        historyId=name,
+        status=status,
+        start=int(started_at * 1000) if started_at else stop,
+        stop=stop,
+        labels=[Label(name="epic", value=AllureEpic.LMS), Label(name="feature", value=feature)],
+        parameters=[Parameter(name=key, value=value) for key, value in (parameters or {}).items()]
+    )
+
+    logger = AllureFileLogger(results_dir or settings.allure_results_dir)
+    for attachment_name, (body, attachment_type) in attachments.items():
+        source = f"{uuid.uuid4()}-attachment.{attachment_type.extension}"
+        logger.report_attached_data(body=body, file_name=source)
+        result.attachments.append(Attachment(name=attachment_name, source=source, type=attachment_type.mime_type))
+
+    logger.report_result(result)
+
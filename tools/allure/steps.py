@@ -0,0 +1,146 @@
+import threading
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+
+import allure
+import allure_commons
+from allure_commons._allure import StepContext
+from allure_commons.utils import func_parameters, represent
+
+from config import settings
+
+
+T = TypeVar("T")
+
+_allure_enabled: bool | None = None  # кэш решения, сбрасывается через configure_allure_mode
+_lock = threading.Lock()  # первое обращение из нескольких потоков: менеджер плагинов allure_commons создается лениво
+
+
+def detect_allure_enabled() -> bool:
+    """
+    Определяет, нужно ли формировать шаги и вложения Allure.
+
+    Если settings.allure_fast_mode не задан, режим выбирается автоматически: шаги нужны, только если
+    зарегистрирован хотя бы один обработчик результатов Allure (он появляется при запуске с --alluredir).
+
+    :return: True, если шаги и вложения нужно формировать.
+    """
+    if settings.allure_fast_mode is not None:
+        return not settings.allure_fast_mode
+
+    return bool(allure_commons.plugin_manager.hook.report_result.get_hookimpls())
+
+
+def configure_allure_mode() -> bool:
+    """
+    Пересчитывает режим работы шагов. Вызывается после того, как allure-pytest зарегистрировал свои плагины.
+
+    :return: True, если шаги и вложения Allure включены.
+    """
+    global _allure_enabled
+    with _lock:
+        _allure_enabled = detect_allure_enabled()
+        return _allure_enabled
+
+
+def is_allure_enabled() -> bool:
+    """
+    :return: True, если шаги и вложения Allure включены (решение кэшируется).
+    """
+    if _allure_enabled is None:
+        return configure_allure_mode()
+
+    return _allure_enabled
+
+
+class Step:
+    """
+    Аналог allure.step, который в быстром режиме (без Allure) вызывает функцию напрямую.
+
+    В быстром режиме не форматируется заголовок, не разбираются аргументы функции и не вызываются хуки Allure.
+    Как и allure.step, работает и как декоратор, и как контекстный менеджер.
+    """
+
+    def __init__(self, title: str):
+        """
+        :param title: Заголовок шага, поддерживает подстановку аргументов функции (например, {url}).
+        """
+        self.title = title
+        self._context: StepContext | None = None
+
+    def __enter__(self):
+        if is_allure_enabled():
+            self._context = StepContext(self.title, {})
+            self._context.__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._context is not None:
+            self._context.__exit__(exc_type, exc_val, exc_tb)
+            self._context = None
+
+    def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
+        title = self.title
+
+        @wraps(func)
+        def impl(*args: Any, **kwargs: Any) -> T:
+            __tracebackhide__ = True
+            if not is_allure_enabled():
+                return func(*args, **kwargs)
+
+            params = func_parameters(func, *args, **kwargs)
+            args_repr = list(map(represent, args))
+            with StepContext(title.format(*args_repr, **params), params):
+                return func(*args, **kwargs)
+
+        return impl
+
+
+def step(title: str) -> Step:
+    """
+    Создает шаг Allure, который отключается в быстром режиме.
+
+    :param title: Заголовок шага.
+    :return: Экземпляр Step (декоратор или контекстный менеджер).
+    """
+    return Step(title)
+
+
+def attach(body: Any, name: str, attachment_type: Any = allure.attachment_type.TEXT):
+    """
+    Аналог allure.attach, который в быстром режиме ничего не делает.
+
+    :param body: Содержимое вложения.
+    :param name: Название вложения.
+    :param attachment_type: Тип вложения.
+    """
+    if is_allure_enabled():
+        allure.attach(body, name=name, attachment_type=attachment_type)
+
+
+def async_step(title: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Аналог allure.step для корутин.
+
+    allure.step оборачивает функцию синхронно и закрывает шаг сразу после создания корутины,
+    поэтому для async-методов шаг открывается внутри корутины и закрывается только после await.
+    В быстром режиме корутина вызывается напрямую.
+
+    :param title: Заголовок шага, поддерживает подстановку аргументов функции (например, {url}).
+    :return: Декоратор для асинхронной функции.
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def impl(*args: Any, **kwargs: Any) -> T:
+            __tracebackhide__ = True
+            if not is_allure_enabled():
+                return await func(*args, **kwargs)
+
+            params = func_parameters(func, *args, **kwargs)
+            args_repr = list(map(represent, args))
+            with StepContext(title.format(*args_repr, **params), params):
+                return await func(*args, **kwargs)
+
+        return impl
+
+    return decorator
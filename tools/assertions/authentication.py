@@ -1,6 +1,6 @@
 from clients.authentication.authentication_schema import LoginResponseSchema
 from tools.assertions.base import assert_equal, assert_is_true
-import allure
+from tools.allure.steps import step
 from tools.logger import get_logger
 
 
@@ -9,7 +9,7 @@ logger = get_logger("AUTHENTICATION_ASSERTIONS")
 
 
 
-@allure.step("Проверка ответа при аутиентификации")
+@step("Проверка ответа при аутиентификации")
 def assert_login_response(response: LoginResponseSchema):
     """
     Проверяет корректность ответа при успешной авторизации.
@@ -1,5 +1,5 @@
 from typing import Any, Sized
-import allure
+from tools.allure.steps import step
 from tools.logger import get_logger
 
 
@@ -8,7 +8,7 @@ logger = get_logger("BASE_ASSERTIONS")
 
 
 
-@allure.step("Проверяем что статус-код ответа соответствует {expected}")
+@step("Проверяем что статус-код ответа соответствует {expected}")
 def assert_status_code(actual: int, expected: int):
     """
     Проверяет, что фактический статус-код ответа соответствует ожидаемому.
@@ -25,7 +25,7 @@ def assert_status_code(actual: int, expected: int):
     )
 
 
-@allure.step("Проверяем что {name} соответствует {actual}")
+@step("Проверяем что {name} соответствует {actual}")
 def assert_equal(actual: Any, expected: Any, name: str):
     """
     Проверяет, что фактическое значение соответствует ожидаемому значению.
@@ -43,7 +43,7 @@ def assert_equal(actual: Any, expected: Any, name: str):
     )
 
 
-@allure.step("Проверяем что {name} истинно")
+@step("Проверяем что {name} истинно")
 def assert_is_true(actual: Any, name: str):
     """
     Проверяет, что фактическое значение является истинным.
@@ -69,7 +69,7 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :param name: Название проверяемого объекта.
     :raises AssertionError: Если длины не совпадают.
     """
-    with allure.step(f"Проверяем что длина {name} соответствует {len(expected)}"):
+    with step(f"Проверяем что длина {name} соответствует {len(expected)}"):
         logger.info(f"Проверяем что длина '{name}' соответствует {len(expected)}")
 
         assert len(actual) == len(expected), (f"Некорректная длина обекта {name}. Ожидалось {len(expected)}, получено {len(actual)}")
\ No newline at end of file
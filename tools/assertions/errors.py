@@ -1,6 +1,6 @@
 from clients.errors_schema import ValidationErrorSchema, ValidationErrorResponseSchema, InternalErrorResponseSchema
 from tools.assertions.base import assert_equal, assert_length
-import allure
+from tools.allure.steps import step
 from tools.logger import get_logger
 
 
@@ -9,7 +9,7 @@ logger = get_logger("ERRORS_ASSERTIONS")
 
 
 
-@allure.step("Проверка ошибки валидации")
+@step("Проверка ошибки валидации")
 def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationErrorSchema):
     """
     Проверяет, что объект ошибки валидации соответствует ожидаемому значению.
@@ -27,7 +27,7 @@ def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationE
     assert_equal(actual.location, expected.location, name="location")
 
 
-@allure.step("Проверка ошибки из ответа")
+@step("Проверка ошибки из ответа")
 def assert_validation_error_response(actual: ValidationErrorResponseSchema, expected: ValidationErrorResponseSchema):
     """
     Проверяет, что объект ответа API с ошибками валидации (ValidationErrorResponseSchema) соответствует ожидаемому значению.
@@ -44,7 +44,7 @@ def assert_validation_error_response(actual: ValidationErrorResponseSchema, expe
         assert_validation_error(actual.details[index], detail)
 
 
-@allure.step("Проверка внутренней ошибки из ответа")
+@step("Проверка внутренней ошибки из ответа")
 def assert_internal_error_response(actual: InternalErrorResponseSchema, expected: InternalErrorResponseSchema):
     """
     Функция для проверки внутренней ошибки. Например 404 File not found
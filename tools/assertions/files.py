@@ -1,8 +1,12 @@
 from clients.errors_schema import ValidationErrorResponseSchema, ValidationErrorSchema, InternalErrorResponseSchema
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, FileSchema, GetFileResponseSchema
+from pathlib import Path
+
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, FileSchema, GetFileResponseSchema, \
+    DownloadFileResultSchema
 from tools.assertions.base import assert_equal
 from tools.assertions.errors import assert_validation_error_response, assert_internal_error_response
-import allure
+from tools.allure.steps import step
+from tools.http.upload_cache import upload_files_cache
 from config import settings
 from tools.logger import get_logger
 
@@ -12,7 +16,7 @@ logger = get_logger("FILES_ASSERTIONS")
 
 
 
-@allure.step("Проверка ответа на создание файла")
+@step("Проверка ответа на создание файла")
 def assert_create_file_response(request: CreateFileRequestSchema, response: CreateFileResponseSchema):
     """
     Проверяет, что ответ на создание файла соответсвует запросу
@@ -30,7 +34,7 @@ def assert_create_file_response(request: CreateFileRequestSchema, response: Crea
     assert_equal(response.file.directory, request.directory, name="directory")
 
 
-@allure.step("Проверка данных файла")
+@step("Проверка данных файла")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Проверяет, что фактические данные файла соответствуют ожиданиям.
@@ -47,7 +51,7 @@ def assert_file(actual: FileSchema, expected: FileSchema):
     assert_equal(actual.directory, expected.directory, name="directory")
 
 
-@allure.step("Проверка ответа на получение файла")
+@step("Проверка ответа на получение файла")
 def assert_get_file_response(get_file_response: GetFileResponseSchema, create_file_response: CreateFileResponseSchema):
     """
     Проверяет, что ответ на получение файла соответсвует ответу на создание файла.
@@ -61,7 +65,22 @@ def assert_get_file_response(get_file_response: GetFileResponseSchema, create_fi
     assert_file(get_file_response.file, create_file_response.file)
 
 
-@allure.step("Проверка ответа на создание файла с пустым именем файла")
+@step("Проверка содержимого скачанного файла")
+def assert_downloaded_file(actual: DownloadFileResultSchema, expected_file: Path):
+    """
+    Проверяет, что скачанный файл совпадает с загруженным: размер и sha256 содержимого.
+
+    :param actual: Результат потокового скачивания файла.
+    :param expected_file: Путь к загруженному файлу.
+    :raises AssertionError: Если размер или хэш не совпадает.
+    """
+    logger.info("Проверка содержимого скачанного файла")
+
+    assert_equal(actual.size, expected_file.stat().st_size, name="size")
+    assert_equal(actual.sha256, upload_files_cache.sha256(expected_file), name="sha256")
+
+
+@step("Проверка ответа на создание файла с пустым именем файла")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым именем файла соответствует ожидаемой валидационной ошибке.
@@ -85,7 +104,7 @@ def assert_create_file_with_empty_filename_response(actual: ValidationErrorRespo
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Проверка ответа на создание файла с пустым значением директории")
+@step("Проверка ответа на создание файла с пустым значением директории")
 def assert_create_file_with_empty_directory_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым значением директории соответствует ожидаемой валидационной ошибке.
@@ -109,7 +128,7 @@ def assert_create_file_with_empty_directory_response(actual: ValidationErrorResp
     assert_validation_error_response(actual, expected)
 
 
-@allure.step("Проверка ответа на получение несуществующего файла")
+@step("Проверка ответа на получение несуществующего файла")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Функция для проверки ошибки, если файл не найден на сервере.
@@ -123,7 +142,7 @@ def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     assert_internal_error_response(actual, expected)
 
 
-@allure.step("Проверка ответа на получение файла с некорректным идентификатором файла")
+@step("Проверка ответа на получение файла с некорректным идентификатором файла")
 def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на получение файла с некорректным идентификатором файла соответствует ожидаемой валидационной ошибке.
@@ -0,0 +1,112 @@
+import threading
+
+from httpx import Response
+
+from config import settings
+from tools.allure.steps import step
+from tools.http.timings import get_request_timings
+from tools.logger import get_logger
+
+
+
+logger = get_logger("PERFORMANCE_ASSERTIONS")
+
+
+
+def get_response_time(response: Response) -> float:
+    """
+    Время ответа в миллисекундах: до получения заголовков ответа (как в гистограммах задержек),
+    а если замер в event hooks выключен — response.elapsed (до прочтения тела).
+
+    :param response: HTTP-ответ (httpx.Response или APIResponse).
+    :return: время ответа в миллисекундах.
+    """
+    if (timings := get_request_timings(response.request)) is not None:
+        return timings.elapsed
+
+    return response.elapsed.total_seconds() * 1000
+
+
+def describe_response_time(response: Response) -> str:
+    """
+    :param response: HTTP-ответ.
+    :return: время ответа с разбивкой по этапам (пул, TCP, TLS, отправка, сервер), если она доступна.
+    """
+    if (timings := get_request_timings(response.request)) is not None:
+        return str(timings)
+
+    return f"{get_response_time(response):.1f} мс"
+
+
+def get_route_sla(method: str, route: str) -> float | None:
+    """
+    Ищет допустимое время ответа в settings.sla.routes: сначала "METHOD /route", затем "/route", затем settings.sla.default.
+
+    :param method: HTTP метод.
+    :param route: шаблон маршрута, например /api/v1/courses/{course_id}.
+    :return: допустимое время ответа в миллисекундах или None, если маршрут не проверяется.
+    """
+    routes = settings.sla.routes
+    if (max_ms := routes.get(f"{method} {route}")) is not None:
+        return max_ms
+
+    return routes.get(route, settings.sla.default)
+
+
+@step("Проверяем что время ответа не больше {max_ms} мс")
+def assert_response_time(response: Response, max_ms: float):
+    """
+    Проверяет, что время ответа не превышает допустимое.
+
+    :param response: HTTP-ответ.
+    :param max_ms: Допустимое время ответа в миллисекундах.
+    :raises AssertionError: Если время ответа больше допустимого.
+    """
+    logger.info(f"Проверяем что время ответа не больше {max_ms} мс")
+
+    assert get_response_time(response) <= max_ms, (
+        f"Превышено время ответа {response.request.method} {response.request.url.path}."
+        f" Ожидалось не больше {max_ms} мс, получено {describe_response_time(response)}."
+    )
+
+
+class SLAViolations:
+    """
+    Нарушения SLA маршрутов за текущий тест. Пополняется из event hooks клиентов (в том числе из пула потоков),
+    проверяется после выполнения теста (см. fixtures/metrics.py).
+    """
+
+    def __init__(self):
+        self._violations: list[str] = []
+        self._lock = threading.Lock()
+
+    def check(self, response: Response, route: str):
+        """
+        Сравнивает время ответа с SLA маршрута и запоминает нарушение.
+
+        :param response: HTTP-ответ (заголовки получены, тело может быть еще не прочитано).
+        :param route: шаблон маршрута запроса.
+        """
+        method = response.request.method
+        if (max_ms := get_route_sla(method, route)) is None or get_response_time(response) <= max_ms:
+            return
+
+        violation = f"{method} {route}: допустимо {max_ms} мс, получено {describe_response_time(response)}"
+        logger.warning("Нарушение SLA %s", violation)
+        with self._lock:
+            self._violations.append(violation)
+
+    def clear(self):
+        with self._lock:
+            self._violations.clear()
+
+    def pop_all(self) -> list[str]:
+        """
+        :return: накопленные нарушения (буфер очищается).
+        """
+        with self._lock:
+            violations, self._violations = self._violations, []
+            return violations
+
+
+sla_violations = SLAViolations()  # Нарушения SLA текущего теста
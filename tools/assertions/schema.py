@@ -1,27 +1,114 @@
-from typing import Any
-from jsonschema import validate
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Iterable
+
+from jsonschema.exceptions import best_match
 from jsonschema.validators import Draft202012Validator
-import allure
+from pydantic import BaseModel
+
+from tools.allure.steps import step
 from tools.logger import get_logger
 
 
 
 logger = get_logger("SCHEMA_ASSERTIONS")
 
+_schema_validators: dict[str, Draft202012Validator] = {}  # скомпилированные валидаторы для схем, переданных словарем
+
+
+
 
+@lru_cache(maxsize=None)
+def get_model_json_schema(model: type[BaseModel]) -> dict:
+    """
+    Возвращает JSON схему Pydantic модели. Схема генерируется один раз на класс.
+
+    :param model: Класс Pydantic модели.
+    :return: JSON схема модели.
+    """
+    return model.model_json_schema()
 
 
-@allure.step("Валидация JSON схемы")
-def validate_json_schema(instance: Any, schema: dict):
+def compile_validator(schema: dict) -> Draft202012Validator:
+    """
+    Проверяет схему и создает валидатор с проверкой форматов (format_checker).
+
+    :param schema: JSON схема.
+    :return: Готовый к использованию Draft202012Validator.
+    """
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+
+@lru_cache(maxsize=None)
+def get_model_validator(model: type[BaseModel]) -> Draft202012Validator:
+    """
+    Возвращает скомпилированный валидатор для Pydantic модели (кэшируется по классу модели).
+
+    :param model: Класс Pydantic модели.
+    :return: Draft202012Validator.
+    """
+    return compile_validator(get_model_json_schema(model))
+
+
+def get_schema_validator(schema: dict | type[BaseModel]) -> Draft202012Validator:
+    """
+    Возвращает скомпилированный валидатор: для модели — по классу, для словаря — по хэшу схемы.
+
+    :param schema: JSON схема или класс Pydantic модели.
+    :return: Draft202012Validator.
+    """
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return get_model_validator(schema)
+
+    key = hashlib.sha1(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()
+    if (validator := _schema_validators.get(key)) is None:
+        validator = _schema_validators.setdefault(key, compile_validator(schema))
+
+    return validator
+
+
+def raise_for_errors(validator: Draft202012Validator, instance: Any):
+    """
+    Выбрасывает наиболее релевантную ошибку валидации, как это делает jsonschema.validate.
+
+    :param validator: Скомпилированный валидатор.
+    :param instance: Проверяемый JSON объект.
+    :raises ValidationError: Если объект не соответствует схеме.
+    """
+    if error := best_match(validator.iter_errors(instance)):
+        raise error
+
+
+@step("Валидация JSON схемы")
+def validate_json_schema(instance: Any, schema: dict | type[BaseModel]):
     """
     Функция для валидации JSON схемы с использованием jsonschema.
 
+    Валидатор (с проверкой форматов) компилируется один раз на схему и переиспользуется.
+
     :param instance: JSON объект, который нужно проверить
-    :param schema: JSON схема, против которой нужно проверить объект
-    :param format_checker: Проверка формата данных
+    :param schema: JSON схема или класс Pydantic модели, против которой нужно проверить объект
 
     :return: None, если валидация прошла успешно
     """
     logger.info("Валидация JSON схемы")
 
-    validate(instance=instance, schema=schema, format_checker=Draft202012Validator.FORMAT_CHECKER) # проверяем, что валидация схемы прошла успешно format_checker=Draft202012Validator.FORMAT_CHECKER - проверка формата данных
\ No newline at end of file
+    raise_for_errors(get_schema_validator(schema), instance)
+
+
+@step("Валидация JSON схемы для набора объектов")
+def validate_json_schema_many(instances: Iterable[Any], schema: dict | type[BaseModel]):
+    """
+    Проверяет набор JSON объектов одним скомпилированным валидатором и одним шагом отчета.
+
+    :param instances: JSON объекты, которые нужно проверить
+    :param schema: JSON схема или класс Pydantic модели
+    :raises ValidationError: На первом объекте, не соответствующем схеме.
+    """
+    logger.info("Валидация JSON схемы для набора объектов")
+
+    validator = get_schema_validator(schema)
+    for instance in instances:
+        raise_for_errors(validator, instance)
@@ -1,16 +1,232 @@
+import itertools
+import os
+import secrets
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Callable, Iterator
+from uuid import UUID
+
 from faker import Faker
 
+from config import settings
+
+
+SENTENCE_WORDS = (3, 8)  # сколько слов в предложении (как в Faker.sentence с nb_words=6)
+TEXT_MAX_CHARS = 200  # максимальная длина текста (как в Faker.text по умолчанию)
+
+_unique_counter = itertools.count()  # общий счетчик уникальных значений для всех экземпляров Fake в процессе
+
+
+def get_worker_id() -> str:
+    """
+    :return: Идентификатор воркера pytest-xdist (gw0, gw1, ...) или "master" без xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def get_base_seed() -> int:
+    """
+    :return: Базовый сид из настроек или случайный сид, если он не задан.
+    """
+    return settings.fakers.seed if settings.fakers.seed is not None else secrets.randbits(32)
+
+
+class LazyFaker:
+    """
+    Откладывает создание Faker до первого обращения и засевает его детерминированным сидом воркера.
+
+    Сид воркера строится из базового сида, идентификатора воркера и локали, поэтому последовательность данных
+    воспроизводима при одинаковом FAKERS.SEED, а разные воркеры получают разные последовательности.
+    """
+
+    def __init__(self, locale: str | None = None, seed: int | None = None):
+        """
+        :param locale: Локаль Faker (например, "ru-RU"). None — локаль по умолчанию.
+        :param seed: Базовый сид. None — get_base_seed().
+        """
+        self.locale = locale
+        self.seed = get_base_seed() if seed is None else seed
+        self.scope = get_worker_id()  # часть сида и суффикса email, разделяющая последовательности данных
+
+    @cached_property
+    def faker(self) -> Faker:
+        faker = Faker(self.locale)
+        faker.seed_instance(f"{self.seed}:{self.scope}:{self.locale}")
+        return faker
+
+    def reseed(self, seed: int, scope: str):
+        """
+        Засевает генератор заново, не пересоздавая Faker.
+
+        :param seed: Новый базовый сид.
+        :param scope: Новая область последовательности данных вместо идентификатора воркера.
+        """
+        self.seed, self.scope = seed, scope
+        if "faker" in self.__dict__:
+            self.faker.seed_instance(f"{self.seed}:{self.scope}:{self.locale}")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.faker, name)
+
 
 class Fake:
     """
     Класс для генерации случайных данных с использованием библиотеки Faker.
+
+    При pool_size > 0 значения генерируются пачками в пулы: имена, предложения и UUID выбираются
+    одним вызовом random.choices/getrandbits на всю пачку вместо вызова провайдера Faker на каждое поле.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker | LazyFaker, pool_size: int = 0):
         """
-        :param faker: Экземпляр класса Faker для генерации случайных данных.
+        :param faker: Экземпляр класса Faker (или LazyFaker) для генерации случайных данных.
+        :param pool_size: Размер пачки, генерируемой в пул за раз. 0 — генерировать по одному значению.
         """
         self.faker = faker
+        self.pool_size = pool_size
+        self.pools: defaultdict[str, deque] = defaultdict(deque)
+        self.elements: dict[str, tuple[list[str], list[float] | None]] = {}
+
+    def take(self, name: str, generate: Callable[[int], list]) -> Any:
+        """
+        Берет значение из пула name, пополняя его пачкой generate(pool_size), если пул пуст.
+
+        :param name: Название пула.
+        :param generate: Функция, генерирующая список из заданного количества значений.
+        :return: Следующее значение из пула.
+        """
+        pool = self.pools[name]
+        while True:
+            try:
+                return pool.popleft()
+            except IndexError:
+                pool.extend(generate(self.pool_size))
+
+    def get_elements(self, attribute: str) -> tuple[list[str], list[float] | None]:
+        """
+        Возвращает набор значений провайдера Faker (например, first_names) и накопленные веса, если они заданы.
+
+        :param attribute: Название атрибута провайдера.
+        :return: Кортеж (значения, накопленные веса или None).
+        """
+        if attribute not in self.elements:
+            provider = next(p for p in self.faker.factories[0].get_providers() if hasattr(p, attribute))
+            elements = getattr(provider, attribute)
+            if isinstance(elements, dict):
+                self.elements[attribute] = list(elements), list(itertools.accumulate(elements.values()))
+            else:
+                self.elements[attribute] = list(elements), None
+
+        return self.elements[attribute]
+
+    def choices(self, attribute: str, count: int) -> list[str]:
+        """
+        :param attribute: Название атрибута провайдера Faker с набором значений.
+        :param count: Количество значений.
+        :return: Список случайных значений с учетом весов провайдера.
+        """
+        elements, cum_weights = self.get_elements(attribute)
+        return self.faker.random.choices(elements, cum_weights=cum_weights, k=count)
+
+    def generate_sentences(self, count: int) -> list[str]:
+        """
+        :param count: Количество предложений.
+        :return: Предложения из слов локали: все слова пачки выбираются одним вызовом random.choices.
+        """
+        random = self.faker.random
+        sizes = [random.randint(*SENTENCE_WORDS) for _ in range(count)]
+        words = iter(random.choices(self.faker.get_words_list(), k=sum(sizes)))
+
+        sentences = []
+        for size in sizes:
+            sentence = list(itertools.islice(words, size))
+            sentence[0] = sentence[0].title()
+            sentences.append(" ".join(sentence) + ".")
+
+        return sentences
+
+    def generate_texts(self, count: int) -> list[str]:
+        """
+        :param count: Количество текстов.
+        :return: Тексты из сгенерированных предложений длиной не более TEXT_MAX_CHARS символов.
+        """
+        sentences = deque(self.generate_sentences(count * (TEXT_MAX_CHARS // 40 + 1)))
+
+        texts = []
+        for _ in range(count):
+            text = self.take_sentence(sentences)
+            while len(text) + len(sentence := self.take_sentence(sentences)) + 1 <= TEXT_MAX_CHARS:
+                text = f"{text} {sentence}"
+            sentences.appendleft(sentence)  # не поместившееся предложение начнет следующий текст
+            texts.append(text)
+
+        return texts
+
+    def take_sentence(self, sentences: deque[str]) -> str:
+        """
+        :param sentences: Очередь сгенерированных предложений; пополняется, если закончилась.
+        :return: Следующее предложение.
+        """
+        if not sentences:
+            sentences.extend(self.generate_sentences(max(self.pool_size, 1)))
+
+        return sentences.popleft()
+
+    def generate_uuids(self, count: int) -> list[str]:
+        """
+        :param count: Количество UUID.
+        :return: UUID4 из засеянного генератора Faker (воспроизводимы при одинаковом сиде).
+        """
+        random = self.faker.random
+        return [str(UUID(int=random.getrandbits(128), version=4)) for _ in range(count)]
+
+    def generate_emails(self, count: int) -> list[str]:
+        """
+        :param count: Количество email.
+        :return: Email вида first.last.<воркер>.<сид>.<счетчик>@domain, уникальные между воркерами без проверки коллизий.
+        После reseed_fakers вместо воркера в email попадает область "test", а уникальность обеспечивает сид теста.
+        """
+        first_names = [name.lower() for name in self.get_elements("first_names")[0] if name.isascii() and name.isalpha()] or ["user"]
+        last_names = [name.lower() for name in self.get_elements("last_names")[0] if name.isascii() and name.isalpha()] or ["user"]
+        random = self.faker.random
+        domains = self.get_elements("free_email_domains")[0]
+        suffix = f"{self.faker.scope}.{self.faker.seed & 0xffffff:06x}" if isinstance(self.faker, LazyFaker) else get_worker_id()
+
+        return [
+            f"{first}.{last}.{suffix}.{next(_unique_counter)}@{domain}"
+            for first, last, domain in zip(random.choices(first_names, k=count), random.choices(last_names, k=count), random.choices(domains, k=count))
+        ]
+
+    def reseed(self, seed: int, scope: str):
+        """
+        Засевает генератор заново и сбрасывает пулы, сгенерированные со старым сидом.
+
+        :param seed: Новый базовый сид.
+        :param scope: Область последовательности данных (для LazyFaker).
+        """
+        self.pools.clear()
+        if isinstance(self.faker, LazyFaker):
+            self.faker.reseed(seed, scope)
+        else:
+            self.faker.seed_instance(seed)
+
+    def get_state(self) -> tuple:
+        """
+        :return: состояние генератора и пулов для set_state
+        """
+        scope = (self.faker.seed, self.faker.scope) if isinstance(self.faker, LazyFaker) else None
+        return self.faker.random.getstate(), {name: deque(pool) for name, pool in self.pools.items()}, scope
+
+    def set_state(self, state: tuple):
+        """
+        :param state: состояние, сохраненное get_state
+        """
+        random_state, pools, scope = state
+        self.faker.random.setstate(random_state)
+        self.pools = defaultdict(deque, pools)
+        if scope is not None:
+            self.faker.seed, self.faker.scope = scope
 
     def text(self) -> str:
         """
@@ -18,6 +234,9 @@ class Fake:
 
         :return: Случайный текст.
         """
+        if self.pool_size:
+            return self.take("text", self.generate_texts)
+
         return self.faker.text()
 
     def uuid4(self) -> str:
@@ -26,6 +245,9 @@ class Fake:
 
         :return: Случайный UUID4.
         """
+        if self.pool_size:
+            return self.take("uuid4", self.generate_uuids)
+
         return self.faker.uuid4()
 
     def email(self, domain: str | None = None) -> str:
@@ -36,6 +258,9 @@ class Fake:
         Если не указан, будет использован случайный домен.
         :return: Случайный email.
         """
+        if self.pool_size and domain is None:
+            return self.take("email", self.generate_emails)
+
         return self.faker.email(domain=domain)
 
     def sentence(self) -> str:
@@ -44,6 +269,9 @@ class Fake:
 
         :return: Случайное предложение.
         """
+        if self.pool_size:
+            return self.take("sentence", self.generate_sentences)
+
         return self.faker.sentence()
 
     def password(self) -> str:
@@ -60,6 +288,9 @@ class Fake:
 
         :return: Случайная фамилия.
         """
+        if self.pool_size:
+            return self.take("last_name", lambda count: self.choices("last_names", count))
+
         return self.faker.last_name()
 
     def first_name(self) -> str:
@@ -68,6 +299,9 @@ class Fake:
 
         :return: Случайное имя.
         """
+        if self.pool_size:
+            return self.take("first_name", lambda count: self.choices("first_names", count))
+
         return self.faker.first_name()
 
     def middle_name(self) -> str:
@@ -76,7 +310,7 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self.first_name()
 
     def estimated_time(self) -> str:
         """
@@ -117,7 +351,41 @@ class Fake:
         return self.integer(1, 49)
 
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker = Faker())  # Создание экземпляра класса `Fake` с использованием локали по умолчанию для генерации случайных данных на английском языке.
+# Создаем экземпляр класса Fake с использованием Faker. Faker создается при первом обращении (LazyFaker)
+fake = Fake(faker = LazyFaker(), pool_size=settings.fakers.pool_size)  # Создание экземпляра класса `Fake` с использованием локали по умолчанию для генерации случайных данных на английском языке.
+
+fake_ru = Fake(faker = LazyFaker('ru-RU'), pool_size=settings.fakers.pool_size)  # Cоздание экземпляра класса `Fake` с указанием локали 'ru-RU' для генерации случайных данных на русском языке.
+
+def reseed_fakers(seed: int, scope: str = "test"):
+    """
+    Засевает fake и fake_ru сидом теста: данные теста перестают зависеть от воркера xdist и порядка запуска тестов.
+    Используется при записи и воспроизведении кассет (tools/http/cassettes.py), где запросы и ответы теста должны совпадать
+    между прогонами.
+
+    :param seed: Сид теста.
+    :param scope: Область последовательности данных вместо идентификатора воркера.
+    """
+    global _unique_counter
+    _unique_counter = itertools.count()
+    for instance in (fake, fake_ru):
+        instance.reseed(seed, scope)
+
 
-fake_ru = Fake(faker = Faker('ru-RU'))  # Cоздание экземпляра класса `Fake` с указанием локали 'ru-RU' для генерации случайных данных на русском языке.
\ No newline at end of file
+@contextmanager
+def reseeded_fakers(seed: int, scope: str) -> Iterator[None]:
+    """
+    Временно засевает fake и fake_ru (например, на время подготовки фикстуры уровня сессии), а затем восстанавливает
+    их состояние: данные теста не зависят от того, подготавливалась ли такая фикстура внутри него.
+
+    :param seed: Сид на время блока.
+    :param scope: Область последовательности данных на время блока.
+    """
+    global _unique_counter
+    counter, states = _unique_counter, [instance.get_state() for instance in (fake, fake_ru)]
+    reseed_fakers(seed, scope)
+    try:
+        yield
+    finally:
+        _unique_counter = counter
+        for instance, state in zip((fake, fake_ru), states):
+            instance.set_state(state)
@@ -0,0 +1,172 @@
+"""
+Генерация тестовых файлов заданного размера без хранения больших бинарников в репозитории.
+
+Файлы детерминированы: содержимое однозначно определяется сидом, типом и размером, поэтому повторная генерация
+(на другой машине или в другом воркере) дает те же байты и тот же sha256. Файл создается на диске лениво,
+при первом запросе, и переиспользуется, пока лежит в settings.test_data.generated_files_dir.
+"""
+import os
+import random
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+
+from config import settings
+from tools.logger import get_logger
+
+
+
+logger = get_logger("GENERATED_FILES")
+
+WRITE_CHUNK_SIZE = 1024 * 1024  # размер куска содержимого, генерируемого и записываемого за раз
+MAX_PNG_CHUNK_LENGTH = 2 ** 31 - 1  # максимальная длина данных одного чанка PNG
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_PADDING_CHUNK = b"paDd"  # приватный вспомогательный чанк: декодеры PNG его пропускают
+ZEROS = bytes(WRITE_CHUNK_SIZE)
+
+
+class FileSizeClass(str, Enum):
+    SMALL = "small"  # 64 КБ
+    MEDIUM = "medium"  # 1 МБ
+    LARGE = "large"  # 32 МБ
+    HUGE = "huge"  # 512 МБ
+
+    def __str__(self):
+        return self.value
+
+    @property
+    def size(self) -> int:
+        """
+        :return: размер файла класса в байтах
+        """
+        return {
+            FileSizeClass.SMALL: 64 * 1024,
+            FileSizeClass.MEDIUM: 1024 * 1024,
+            FileSizeClass.LARGE: 32 * 1024 * 1024,
+            FileSizeClass.HUGE: 512 * 1024 * 1024
+        }[self]
+
+
+class GeneratedFileKind(str, Enum):
+    PNG = "png"  # корректный PNG 1x1, добитый до нужного размера чанком со случайными (несжимаемыми) данными
+    SPARSE_PNG = "sparse_png"  # корректный PNG, добитый чанком из нулей: нули записываются "дырой" (разреженный файл)
+    RANDOM = "random"  # случайные байты без какой-либо структуры
+
+    def __str__(self):
+        return self.value
+
+    @property
+    def suffix(self) -> str:
+        return ".bin" if self is GeneratedFileKind.RANDOM else ".png"
+
+
+def png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type)))
+
+
+# Минимальный корректный PNG: изображение 1x1 в оттенках серого. Чанки дополнения вставляются перед IEND
+PNG_HEAD = (
+    PNG_SIGNATURE
+    + png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+    + png_chunk(b"IDAT", zlib.compress(b"\x00\x00"))
+)
+PNG_TAIL = png_chunk(b"IEND", b"")
+PNG_CHUNK_OVERHEAD = 12  # длина (4), тип (4) и CRC (4) чанка
+
+
+class FileGenerator:
+    """
+    Пишет детерминированное содержимое файла кусками по WRITE_CHUNK_SIZE: память не зависит от размера файла.
+    """
+
+    def __init__(self, kind: GeneratedFileKind, size: int, seed: int):
+        """
+        :param kind: тип файла
+        :param size: размер файла в байтах
+        :param seed: сид содержимого
+        """
+        self.kind = kind
+        self.size = size
+        self.random = random.Random(f"{seed}:{kind}:{size}")
+
+        if kind is not GeneratedFileKind.RANDOM and size < len(PNG_HEAD) + len(PNG_TAIL):
+            raise ValueError(f"Размер PNG не может быть меньше {len(PNG_HEAD) + len(PNG_TAIL)} байт, запрошено {size}")
+
+    def write_payload(self, file, length: int, crc: int = 0) -> int:
+        """
+        Записывает length байт содержимого: случайных или, для SPARSE_PNG, "дыру" из нулей.
+
+        :return: CRC32 записанных данных, продолженный от crc
+        """
+        sparse = self.kind is GeneratedFileKind.SPARSE_PNG
+        while length > 0:
+            chunk_size = min(length, WRITE_CHUNK_SIZE)
+            if sparse:
+                crc = zlib.crc32(ZEROS[:chunk_size], crc)
+                file.seek(chunk_size, os.SEEK_CUR)  # нули не пишутся на диск, файловая система хранит их как пропуск
+            else:
+                chunk = self.random.randbytes(chunk_size)
+                crc = zlib.crc32(chunk, crc)
+                file.write(chunk)
+            length -= chunk_size
+
+        return crc
+
+    def write(self, file):
+        if self.kind is GeneratedFileKind.RANDOM:
+            self.write_payload(file, self.size)
+            return
+
+        file.write(PNG_HEAD)
+        padding = self.size - len(PNG_HEAD) - len(PNG_TAIL)
+        while padding > 0:
+            # Дополнение делится на чанки допустимой длины; если остаток меньше заголовка чанка, чанк укорачивается
+            length = min(padding - PNG_CHUNK_OVERHEAD, MAX_PNG_CHUNK_LENGTH)
+            if length < 0:
+                raise ValueError(f"Невозможно получить PNG размером ровно {self.size} байт")
+
+            file.write(struct.pack(">I", length) + PNG_PADDING_CHUNK)
+            crc = self.write_payload(file, length, zlib.crc32(PNG_PADDING_CHUNK))
+            file.write(struct.pack(">I", crc))
+            padding -= length + PNG_CHUNK_OVERHEAD
+
+        file.write(PNG_TAIL)
+
+
+def get_generated_file(
+        size: FileSizeClass | int,
+        kind: GeneratedFileKind = GeneratedFileKind.PNG,
+        seed: int | None = None
+) -> Path:
+    """
+    Возвращает путь к сгенерированному файлу, создавая его при первом обращении.
+
+    :param size: класс размера или размер в байтах
+    :param kind: тип содержимого файла
+    :param seed: сид содержимого (None — settings.test_data.generated_files_seed)
+    :return: путь к файлу
+    :raises ValueError: если PNG нужного размера построить нельзя
+    """
+    size = size.size if isinstance(size, FileSizeClass) else size
+    seed = settings.test_data.generated_files_seed if seed is None else seed
+
+    directory = settings.test_data.generated_files_dir
+    file = directory / f"{kind}-{size}-{seed}{kind.suffix}"
+    if file.exists() and file.stat().st_size == size:
+        return file
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Файл пишется во временный и атомарно переименовывается: воркеры xdist не видят недописанный файл
+    temporary_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+    generator = FileGenerator(kind=kind, size=size, seed=seed)
+    try:
+        with temporary_file.open("wb") as stream:
+            generator.write(stream)
+        os.replace(temporary_file, file)
+    finally:
+        temporary_file.unlink(missing_ok=True)
+
+    logger.info("Сгенерирован тестовый файл %s (%s байт)", file, size)
+    return file
@@ -0,0 +1,428 @@
+"""
+Запись и воспроизведение HTTP обменов (кассеты) для быстрых повторных запусков без сервиса.
+
+Режим выбирается настройкой CASSETTES.MODE:
+    passthrough — запросы уходят в сервис, кассеты не используются;
+    record      — запросы уходят в сервис, обмены каждого теста сохраняются в его кассету;
+    replay      — ответы берутся из кассет, сеть не используется.
+
+Все кассеты хранятся в одном файле SQLite (CASSETTES.FILE) с первичным ключом (кассета, ключ запроса, номер повтора),
+тела сжаты zlib. Кассета теста целиком загружается в словарь перед тестом, поэтому поиск ответа — O(1).
+
+У запроса два ключа. Точный — по методу, URL, пользователю токена и телу (без случайной границы multipart): при воспроизведении
+сервис-сгенерированные ID берутся из записанных ответов, а fake и fake_ru засеваются сидом теста
+(tools.fakers.reseed_fakers), поэтому запросы теста совпадают с записанными, даже если выполнялись параллельно.
+Нормализованный — UUID заменены на {uuid}, значения в JSON теле — на их тип: по нему (и номеру повтора внутри теста)
+ищется ответ, если точного совпадения нет, например когда данные фикстуры уровня сессии сгенерированы в другом тесте.
+
+Фикстуры шире function пишутся в отдельные кассеты воркера (fixtures/cassettes.py), поэтому воспроизводятся любой
+выбор и порядок тестов и перезапуски pytest-rerunfailures. Общее между тестами состояние (пул пользователей воркера)
+совпадает с записанным только при том же количестве воркеров xdist, что и при записи.
+"""
+import base64
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from httpx import BaseTransport, AsyncBaseTransport, Request, Response, TransportError
+
+from config import settings
+from tools.logger import get_logger
+
+
+logger = get_logger("CASSETTES")
+
+UUID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+UUID_BYTES_PATTERN = re.compile(UUID_PATTERN.pattern.encode(), re.IGNORECASE)
+BOUNDARY_PATTERN = re.compile(r"boundary=\"?([^\";]+)")
+
+SESSION_CASSETTE = "session"  # кассета для запросов вне тестов
+SKIPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}  # тело в кассете уже декодировано
+
+
+class CassetteMissError(TransportError):
+    """
+    В режиме replay для запроса нет записанного ответа.
+    """
+
+
+def normalize_json(value):
+    """
+    :param value: разобранное JSON тело запроса
+    :return: та же структура, в которой значения заменены на их тип (случайные данные fake не влияют на ключ)
+    """
+    if isinstance(value, dict):
+        return {key: normalize_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize_json(item) for item in value]
+    if value is None or isinstance(value, bool):
+        return value
+
+    return f"{{{type(value).__name__}}}"
+
+
+def normalize_body(request: Request) -> bytes:
+    """
+    :param request: запрос с прочитанным телом
+    :return: тело без случайных данных
+    """
+    content_type = request.headers.get("Content-Type", "")
+    if content_type.startswith("application/json"):
+        try:
+            return json.dumps(normalize_json(json.loads(request.content)), sort_keys=True).encode()
+        except ValueError:
+            pass
+
+    body = request.content
+    if boundary := BOUNDARY_PATTERN.search(content_type):
+        body = body.replace(boundary.group(1).encode(), b"{boundary}")
+
+    return UUID_BYTES_PATTERN.sub(b"{uuid}", body)
+
+
+def get_authorization_subject(authorization: str) -> str:
+    """
+    :param authorization: заголовок Authorization
+    :return: claim 'sub' JWT токена (пользователь не меняется при обновлении токена) или сам заголовок
+    """
+    try:
+        payload = authorization.removeprefix("Bearer ").split(".")[1]
+        return str(json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["sub"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return authorization
+
+
+class RequestKeys(NamedTuple):
+    key: str  # по нормализованному запросу
+    exact_key: str  # по методу, URL, пользователю токена и телу запроса
+
+
+def build_request_keys(request: Request) -> RequestKeys:
+    """
+    :param request: запрос с прочитанным телом
+    :return: ключи запроса в кассете
+    """
+    query = "&".join(sorted(f"{name}={UUID_PATTERN.sub('{uuid}', value)}" for name, value in request.url.params.multi_items()))
+    digest = hashlib.sha256(f"{request.method} {UUID_PATTERN.sub('{uuid}', request.url.path)}?{query}\n".encode())
+    digest.update(normalize_body(request))
+
+    body = request.content
+    if boundary := BOUNDARY_PATTERN.search(request.headers.get("Content-Type", "")):
+        body = body.replace(boundary.group(1).encode(), b"{boundary}")
+    # Пользователь токена различает одинаковые запросы разных пользователей (например, GET /api/v1/users/me)
+    authorization = get_authorization_subject(request.headers.get("Authorization", ""))
+    exact_digest = hashlib.sha256(f"{request.method} {request.url.raw_path.decode()}\n{authorization}\n".encode())
+    exact_digest.update(body)
+
+    return RequestKeys(digest.hexdigest(), exact_digest.hexdigest())
+
+
+class CassetteInteraction(NamedTuple):
+    """
+    Записанный ответ на запрос.
+    """
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CassetteInteraction":
+        """
+        :param response: ответ с прочитанным телом
+        """
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in SKIPPED_HEADERS]
+        return cls(response.status_code, headers, response.content)
+
+    def to_response(self, request: Request) -> Response:
+        return Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class Cassette:
+    """
+    Обмены одного теста: ключ запроса -> ответы в порядке повторов.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            interactions: dict[str, list[CassetteInteraction]] | None = None,
+            exact_interactions: dict[str, list[CassetteInteraction]] | None = None
+    ):
+        """
+        :param name: имя кассеты (nodeid теста)
+        :param interactions: записанные ответы по нормализованному ключу (для replay)
+        :param exact_interactions: записанные ответы по точному ключу (для replay)
+        """
+        self.name = name
+        self.interactions = interactions or {}
+        self.exact_interactions = exact_interactions or {}
+        self.occurrences: Counter[str] = Counter()
+        self.recorded: list[tuple[RequestKeys, int, CassetteInteraction]] = []
+        self._lock = threading.Lock()
+
+    def next_occurrence(self, key: str) -> int:
+        """
+        :return: номер повтора запроса с этим ключом в тесте (с нуля)
+        """
+        with self._lock:
+            occurrence = self.occurrences[key]
+            self.occurrences[key] += 1
+            return occurrence
+
+    def find(self, keys: RequestKeys) -> CassetteInteraction | None:
+        """
+        :return: ответ на очередной повтор запроса (сначала по точному ключу, затем по нормализованному);
+        если повторов записано меньше — последний записанный ответ
+        """
+        for key, interactions in ((keys.exact_key, self.exact_interactions), (keys.key, self.interactions)):
+            if responses := interactions.get(key):
+                return responses[min(self.next_occurrence(key), len(responses) - 1)]
+
+        return None
+
+    def record(self, keys: RequestKeys, interaction: CassetteInteraction):
+        with self._lock:
+            occurrence = self.occurrences[keys.key]
+            self.occurrences[keys.key] += 1
+            self.recorded.append((keys, occurrence, interaction))
+
+
+class CassettesLibrary:
+    """
+    Файл SQLite со всеми кассетами, общий для воркеров xdist.
+    """
+
+    def __init__(self, file: Path):
+        """
+        :param file: путь к файлу базы SQLite
+        """
+        self.file = file
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.file, timeout=30)
+
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")  # воркеры записывают свои кассеты параллельно
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS interactions ("
+                        "cassette TEXT NOT NULL, key TEXT NOT NULL, occurrence INTEGER NOT NULL, exact_key TEXT NOT NULL, "
+                        "status_code INTEGER NOT NULL, headers BLOB NOT NULL, content BLOB NOT NULL, "
+                        "PRIMARY KEY (cassette, key, occurrence)) WITHOUT ROWID"
+                    )
+                    connection.execute("CREATE INDEX IF NOT EXISTS interactions_key ON interactions (key)")
+                    connection.commit()
+                    self._initialized = True
+
+        return connection
+
+    @staticmethod
+    def to_interaction(status_code: int, headers: bytes, content: bytes) -> CassetteInteraction:
+        return CassetteInteraction(status_code, [tuple(header) for header in json.loads(headers)], zlib.decompress(content))
+
+    def load(self, name: str) -> Cassette:
+        """
+        :param name: имя кассеты
+        :return: кассета с записанными ответами (пустая, если кассеты нет)
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT key, exact_key, status_code, headers, content FROM interactions WHERE cassette = ? "
+                "ORDER BY key, occurrence",
+                (name,)
+            ).fetchall()
+        connection.close()
+
+        interactions: dict[str, list[CassetteInteraction]] = {}
+        exact_interactions: dict[str, list[CassetteInteraction]] = {}
+        for key, exact_key, status_code, headers, content in rows:
+            interaction = self.to_interaction(status_code, headers, content)
+            interactions.setdefault(key, []).append(interaction)
+            exact_interactions.setdefault(exact_key, []).append(interaction)
+
+        return Cassette(name, interactions, exact_interactions)
+
+    def find_any(self, key: str) -> CassetteInteraction | None:
+        """
+        :param key: ключ запроса
+        :return: ответ на такой же запрос из любой кассеты (например, для запросов фикстур уровня сессии,
+        которые при записи выполнялись в другом тесте) или None
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT status_code, headers, content FROM interactions WHERE key = ? LIMIT 1", (key,)
+            ).fetchone()
+        connection.close()
+
+        return self.to_interaction(*row) if row else None
+
+    def save(self, cassette: Cassette):
+        """
+        Заменяет кассету записанными обменами (при перезапуске теста остается последняя попытка).
+
+        :param cassette: кассета с записанными обменами
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM interactions WHERE cassette = ?", (cassette.name,))
+            connection.executemany(
+                "INSERT OR REPLACE INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        cassette.name,
+                        keys.key,
+                        occurrence,
+                        keys.exact_key,
+                        interaction.status_code,
+                        json.dumps(interaction.headers).encode(),
+                        zlib.compress(interaction.content)
+                    )
+                    for keys, occurrence, interaction in cassette.recorded
+                ]
+            )
+        connection.close()
+
+
+class CassetteRecorder:
+    """
+    Текущая кассета процесса (воркера): запросы из любых потоков записываются в кассету выполняемого теста.
+    """
+
+    def __init__(self, library: CassettesLibrary):
+        self.library = library
+        self.cassette = Cassette(SESSION_CASSETTE)
+
+    @property
+    def mode(self) -> str:
+        return settings.cassettes.mode
+
+    def start(self, name: str):
+        """
+        Делает кассету name текущей (в режиме replay — загружает ее).
+
+        :param name: имя кассеты (nodeid теста)
+        """
+        self.cassette = self.library.load(name) if self.mode == "replay" else Cassette(name)
+
+    def stop(self):
+        """
+        Сохраняет текущую кассету (в режиме record) и переключается на кассету запросов вне тестов.
+        """
+        if self.mode == "record":
+            self.library.save(self.cassette)
+
+        self.cassette = Cassette(SESSION_CASSETTE)
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Cassette]:
+        """
+        Делает кассету name текущей на время блока и затем возвращает предыдущую (кассеты фикстур внутри теста).
+
+        :param name: имя кассеты
+        """
+        previous = self.cassette
+        self.start(name)
+        try:
+            yield self.cassette
+        finally:
+            self.stop()
+            self.cassette = previous
+
+    def replay(self, request: Request) -> Response:
+        """
+        :param request: запрос с прочитанным телом
+        :return: записанный ответ
+        """
+        cassette = self.cassette
+        keys = build_request_keys(request)
+        interaction = cassette.find(keys)
+        if interaction is None and (interaction := self.library.find_any(keys.key)):
+            logger.debug(f"Ответ на {request.method} {request.url.path} взят из другой кассеты: в {cassette.name} его нет")
+
+        if interaction is None:
+            raise CassetteMissError(
+                f"В кассете {cassette.name} нет ответа на {request.method} {request.url}: перезапишите ее с CASSETTES.MODE=record",
+                request=request
+            )
+
+        return interaction.to_response(request)
+
+    def record(self, request: Request, response: Response) -> Response:
+        """
+        :param request: запрос с прочитанным телом
+        :param response: ответ сервиса с прочитанным телом
+        :return: ответ для клиента (тело уже декодировано)
+        """
+        interaction = CassetteInteraction.from_response(response)
+        self.cassette.record(build_request_keys(request), interaction)
+        return interaction.to_response(request)
+
+
+class CassetteTransport(BaseTransport):
+    """
+    Транспорт, записывающий обмены в кассеты или отвечающий из них (CASSETTES.MODE).
+    В режиме record тела запроса и ответа читаются целиком: потоковые загрузки и скачивания теряют свою экономию памяти.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        """
+        :param transport: транспорт, через который запросы уходят в сервис
+        """
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        request.read()
+        if cassette_recorder.mode == "replay":
+            return cassette_recorder.replay(request)
+
+        response = self.transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return cassette_recorder.record(request, response)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCassetteTransport(AsyncBaseTransport):
+    """
+    Асинхронный вариант CassetteTransport.
+    """
+
+    def __init__(self, transport: AsyncBaseTransport):
+        """
+        :param transport: транспорт, через который запросы уходят в сервис
+        """
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        await request.aread()
+        if cassette_recorder.mode == "replay":
+            return cassette_recorder.replay(request)
+
+        response = await self.transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return cassette_recorder.record(request, response)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+cassette_recorder = CassetteRecorder(CassettesLibrary(settings.cassettes.file))
@@ -1,8 +1,34 @@
-from httpx import Request, RequestNotRead, post, Client
+from httpx import Request, RequestNotRead
 
+from config import settings
 
 
 
+
+def make_curl_body(body: bytes, content_type: str | None = None) -> str:
+    """
+    Готовит тело запроса для cURL команды без декодирования больших и бинарных данных.
+
+    :param body: Тело запроса.
+    :param content_type: Значение заголовка Content-Type.
+    :return: Тело запроса строкой, усеченное до settings.curl.max_body_size, или краткое описание бинарных данных.
+    """
+    max_body_size = settings.curl.max_body_size
+    chunk = body[:max_body_size]
+
+    try:
+        text = chunk.decode('utf-8')
+    except UnicodeDecodeError as error:
+        if error.start < len(chunk) - 4:  # ошибка не на обрезанном многобайтовом символе в конце — данные бинарные
+            return f"<binary body: {len(body)} bytes, {content_type or 'unknown content type'}>"
+        text = chunk[:error.start].decode('utf-8')
+
+    if len(body) > max_body_size:
+        text += f"... <truncated: {len(body) - max_body_size} of {len(body)} bytes omitted>"
+
+    return text
+
+
 def make_curl_from_request(request: Request) -> str:
     """
     Генерирует команду cURL из HTTP-запроса httpx.
@@ -17,8 +43,9 @@ def make_curl_from_request(request: Request) -> str:
 
     try:
         if body := request.content:
-            result.append(f"-d '{body.decode('utf-8')}'")
-    except RequestNotRead:
-        pass
+            result.append(f"-d '{make_curl_body(body, request.headers.get('content-type'))}'")
+    except RequestNotRead:  # потоковое тело (например, загрузка файла) не читаем повторно, выводим только его размер
+        if length := request.headers.get('content-length'):
+            result.append(f"-d '<streamed body: {length} bytes, {request.headers.get('content-type', 'unknown content type')}>'")
 
-    return " \\\n ".join(result)
\ No newline at end of file
+    return " \\\n ".join(result)
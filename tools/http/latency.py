@@ -0,0 +1,219 @@
+"""
+Гистограммы задержек HTTP запросов по маршрутам и методам.
+
+Задержки хранятся в HDR-подобных гистограммах: значения в микросекундах раскладываются по логарифмически-линейным
+корзинам (SUB_BUCKETS корзин на каждую степень двойки), поэтому относительная ошибка перцентилей не больше
+1 / SUB_BUCKETS, а память не зависит от количества запросов. Гистограммы воркеров xdist складываются корзина к корзине.
+"""
+import math
+import threading
+import time
+
+from pydantic import BaseModel
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS  # 128 корзин на степень двойки: ошибка перцентилей < 0.8%
+
+
+def get_bucket_index(value: int) -> int:
+    """
+    :param value: значение (в микросекундах)
+    :return: номер корзины: значения меньше 2 * SUB_BUCKETS хранятся точно
+    """
+    shift = max(0, value.bit_length() - SUB_BUCKET_BITS - 1)
+    return (shift << SUB_BUCKET_BITS) + (value >> shift)
+
+
+def get_bucket_value(index: int) -> int:
+    """
+    :param index: номер корзины
+    :return: наибольшее значение, попадающее в корзину
+    """
+    shift = max(0, (index >> SUB_BUCKET_BITS) - 1)
+    return ((index - (shift << SUB_BUCKET_BITS)) << shift) + (1 << shift) - 1
+
+
+class RouteHistogramSchema(BaseModel):
+    """
+    Гистограмма задержек одного метода и маршрута. Сериализуется для передачи от воркеров xdist.
+    """
+    method: str
+    route: str  # шаблон маршрута, например /api/v1/courses/{course_id}
+    counts: dict[int, int] = {}  # номер корзины -> количество запросов
+    statuses: dict[int, int] = {}  # статус-код -> количество ответов
+    count: int = 0
+    total: int = 0  # сумма задержек в микросекундах
+    min: int | None = None
+    max: int = 0
+    window_start: float | None = None  # unix-время начала первого запроса
+    window_end: float | None = None  # unix-время получения последнего ответа
+
+    def record(self, latency: int, status_code: int, finished_at: float):
+        """
+        :param latency: задержка в микросекундах
+        :param status_code: статус-код ответа
+        :param finished_at: unix-время получения ответа
+        """
+        index = get_bucket_index(latency)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.statuses[status_code] = self.statuses.get(status_code, 0) + 1
+        self.count += 1
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = max(self.max, latency)
+
+        started_at = finished_at - latency / 1_000_000
+        self.window_start = started_at if self.window_start is None else min(self.window_start, started_at)
+        self.window_end = finished_at if self.window_end is None else max(self.window_end, finished_at)
+
+    def merge(self, other: "RouteHistogramSchema"):
+        """
+        Добавляет гистограмму того же маршрута (например, от другого воркера).
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        for status_code, count in other.statuses.items():
+            self.statuses[status_code] = self.statuses.get(status_code, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.window_start = other.window_start if self.window_start is None else min(self.window_start, other.window_start)
+            self.window_end = other.window_end if self.window_end is None else max(self.window_end, other.window_end)
+
+    def percentile(self, percent: float) -> int:
+        """
+        :param percent: перцентиль (например, 99)
+        :return: задержка в микросекундах, не меньше которой percent% запросов (с точностью корзины)
+        """
+        if not self.count:
+            return 0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(get_bucket_value(index), self.max)
+
+        return self.max
+
+
+class RouteLatencySchema(BaseModel):
+    """
+    Итоговые показатели метода и маршрута. Задержки — в миллисекундах.
+    """
+    method: str
+    route: str
+    count: int
+    statuses: dict[int, int]
+    min: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    throughput: float  # запросов в секунду за всю сессию (а не за окно маршрута): сравнимо между маршрутами
+
+    @classmethod
+    def from_histogram(cls, histogram: RouteHistogramSchema, duration: float) -> "RouteLatencySchema":
+        """
+        :param histogram: гистограмма маршрута
+        :param duration: секунд от первого запроса до последнего ответа за сессию (по всем маршрутам)
+        """
+        return cls(
+            method=histogram.method,
+            route=histogram.route,
+            count=histogram.count,
+            statuses=histogram.statuses,
+            min=(histogram.min or 0) / 1000,
+            mean=histogram.total / histogram.count / 1000 if histogram.count else 0.0,
+            p50=histogram.percentile(50) / 1000,
+            p90=histogram.percentile(90) / 1000,
+            p99=histogram.percentile(99) / 1000,
+            max=histogram.max / 1000,
+            throughput=histogram.count / duration if duration > 0 else 0.0
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.method:<6} {self.route:<40} {self.count:>6} запросов, p50 {self.p50:>8.1f} мс, "
+            f"p90 {self.p90:>8.1f} мс, p99 {self.p99:>8.1f} мс, max {self.max:>8.1f} мс, {self.throughput:>7.1f} запросов/с"
+        )
+
+
+class LatencyReportSchema(BaseModel):
+    """
+    Отчет о задержках запросов за сессию (по всем воркерам).
+    """
+    workers: int  # сколько процессов прислали гистограммы
+    requests: int
+    duration: float  # секунд от первого запроса до последнего ответа
+    throughput: float  # запросов в секунду за duration
+    routes: list[RouteLatencySchema] = []
+
+
+class LatencyCollector:
+    """
+    Гистограммы задержек процесса (воркера) по методу и маршруту. Запись потокобезопасна.
+    """
+
+    def __init__(self):
+        self.histograms: dict[tuple[str, str], RouteHistogramSchema] = {}
+        self.recorded = False  # были ли запросы в этом процессе
+        self.merged = 0  # сколько процессов прислали гистограммы
+        self._lock = threading.Lock()
+
+    def record(self, method: str, route: str, latency: float, status_code: int):
+        """
+        :param method: HTTP метод
+        :param route: шаблон маршрута
+        :param latency: задержка в секундах
+        :param status_code: статус-код ответа
+        """
+        finished_at = time.time()
+        with self._lock:
+            if (histogram := self.histograms.get((method, route))) is None:
+                histogram = self.histograms[(method, route)] = RouteHistogramSchema(method=method, route=route)
+            histogram.record(round(latency * 1_000_000), status_code, finished_at)
+            self.recorded = True
+
+    def dump(self) -> list[dict]:
+        """
+        :return: гистограммы в виде JSON-совместимых словарей (для передачи от воркера xdist)
+        """
+        with self._lock:
+            return [histogram.model_dump(mode="json") for histogram in self.histograms.values()]
+
+    def merge(self, histograms: list[dict]):
+        """
+        Добавляет гистограммы другого процесса (результат dump).
+        """
+        with self._lock:
+            self.merged += 1
+            for data in histograms:
+                histogram = RouteHistogramSchema.model_validate(data)
+                if (current := self.histograms.get((histogram.method, histogram.route))) is None:
+                    self.histograms[(histogram.method, histogram.route)] = histogram
+                else:
+                    current.merge(histogram)
+
+    def build_report(self) -> LatencyReportSchema:
+        with self._lock:
+            histograms = sorted(self.histograms.values(), key=lambda histogram: (histogram.route, histogram.method))
+
+        requests = sum(histogram.count for histogram in histograms)
+        window_start = min((histogram.window_start for histogram in histograms if histogram.window_start), default=0.0)
+        window_end = max((histogram.window_end for histogram in histograms if histogram.window_end), default=0.0)
+        duration = window_end - window_start
+        return LatencyReportSchema(
+            workers=self.merged + int(self.recorded),
+            requests=requests,
+            duration=duration,
+            throughput=requests / duration if duration > 0 else 0.0,
+            routes=[RouteLatencySchema.from_histogram(histogram, duration) for histogram in histograms]
+        )
+
+
+latency_collector = LatencyCollector()  # Гистограммы процесса (воркера xdist)
@@ -0,0 +1,123 @@
+import asyncio
+import mimetypes
+import os
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+from tools.http.upload_cache import upload_files_cache
+
+CHUNK_SIZE = 64 * 1024  # размер куска файла, читаемого с диска за раз
+
+
+def quote_form_value(value: str) -> str:
+    # Так же, как httpx экранирует имена полей и файлов в Content-Disposition
+    return value.replace("\\", "\\\\").replace('"', "%22")
+
+
+class MultipartFileBody:
+    """
+    Потоковое тело multipart/form-data из полей формы и одного файла.
+
+    Граница, части с полями формы и заголовки части файла вычисляются один раз при создании, а сам файл
+    читается с диска кусками по CHUNK_SIZE при каждой отправке. Память на загрузку не зависит от размера файла,
+    а повторная отправка (например, после обновления токена на 401) снова читает файл с начала.
+
+    Небольшие файлы (не больше settings.upload_cache.max_file_size) берутся из кэша воркера и с диска не читаются.
+    """
+
+    def __init__(self, file: Path, field: str, data: dict[str, str] | None = None, filename: str | None = None):
+        """
+        :param file: путь к загружаемому файлу
+        :param field: имя поля формы с файлом
+        :param data: остальные поля формы
+        :param filename: имя файла в части с файлом (по умолчанию — имя файла на диске)
+        """
+        self.file = file
+        self.cached = upload_files_cache.get(file)
+        self.file_size = self.cached.size if self.cached else file.stat().st_size
+        self.boundary = os.urandom(16).hex()
+
+        filename = filename or file.name
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        boundary = self.boundary.encode("ascii")
+
+        fields = b"".join(
+            b"--%s\r\nContent-Disposition: form-data; name=\"%s\"\r\n\r\n%s\r\n"
+            % (boundary, quote_form_value(name).encode(), str(value).encode())
+            for name, value in (data or {}).items()
+        )
+        self.preamble = fields + (
+            b"--%s\r\nContent-Disposition: form-data; name=\"%s\"; filename=\"%s\"\r\nContent-Type: %s\r\n\r\n"
+            % (boundary, quote_form_value(field).encode(), quote_form_value(filename).encode(), content_type.encode())
+        )
+        self.epilogue = b"\r\n--%s--\r\n" % boundary
+
+    @property
+    def content_length(self) -> int:
+        return len(self.preamble) + self.file_size + len(self.epilogue)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        :return: заголовки Content-Type (с границей) и Content-Length, вычисленные без чтения файла
+        """
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(self.content_length)
+        }
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        yield self.preamble
+        if self.cached:
+            yield self.cached.content
+            yield self.epilogue
+            return
+
+        with self.file.open("rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                yield chunk
+        yield self.epilogue
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        yield self.preamble
+        if self.cached:
+            yield self.cached.content
+            yield self.epilogue
+            return
+
+        # Чтение с диска выполняется в потоке, чтобы не блокировать event loop на больших файлах
+        file = await asyncio.to_thread(self.file.open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+                yield chunk
+        finally:
+            file.close()
+        yield self.epilogue
+
+    def stream(self) -> "MultipartFileStream":
+        """
+        :return: тело для content= у httpx.Client (можно отправить повторно)
+        """
+        return MultipartFileStream(self)
+
+    def async_stream(self) -> "AsyncMultipartFileStream":
+        """
+        :return: тело для content= у httpx.AsyncClient (можно отправить повторно)
+        """
+        return AsyncMultipartFileStream(self)
+
+
+class MultipartFileStream:
+    def __init__(self, body: MultipartFileBody):
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.body.iter_chunks()
+
+
+class AsyncMultipartFileStream:
+    def __init__(self, body: MultipartFileBody):
+        self.body = body
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.body.aiter_chunks()
@@ -0,0 +1,41 @@
+from collections import deque
+
+from httpx import Request
+
+from config import settings
+from tools.http.curl import make_curl_from_request
+
+
+class RequestsBuffer:
+    """
+    Кольцевой буфер последних HTTP-запросов текущего теста.
+
+    Хранит только ссылки на объекты httpx.Request: cURL команды строятся лишь при падении теста.
+    deque с maxlen потокобезопасен для append, поэтому буфер можно использовать из пула потоков.
+    """
+
+    def __init__(self, size: int):
+        """
+        :param size: Сколько последних запросов хранить.
+        """
+        self._requests: deque[Request] = deque(maxlen=size)
+
+    def append(self, request: Request):
+        self._requests.append(request)
+
+    def clear(self):
+        self._requests.clear()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def render_curl(self) -> str:
+        """
+        Строит cURL команды для всех запросов буфера, от старых к новым.
+
+        :return: cURL команды, разделенные пустой строкой.
+        """
+        return "\n\n".join(make_curl_from_request(request) for request in list(self._requests))
+
+
+requests_buffer = RequestsBuffer(size=settings.curl.buffer_size)
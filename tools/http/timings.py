@@ -0,0 +1,112 @@
+"""
+Разбивка времени HTTP запроса на этапы по событиям расширения "trace" httpcore.
+
+httpcore вызывает trace перед и после каждого этапа: connection.connect_tcp, connection.start_tls,
+http11.send_request_headers, http11.send_request_body, http11.receive_response_headers и т.д. (для HTTP/2 — префикс http2).
+Транспорты без сокетов (ASGI, MockTransport, кассеты) событий не присылают: тогда известно только общее время.
+"""
+import time
+
+from httpx import Request
+
+PROTOCOL_PREFIXES = ("http11.", "http2.")
+
+
+class RequestTimings:
+    """
+    Моменты этапов одного запроса (time.perf_counter). Экземпляр передается в httpcore как расширение "trace".
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()  # момент отправки запроса клиентом (после остальных event hooks)
+        self.finished_at: float | None = None  # момент получения заголовков ответа
+        self.events: dict[str, float] = {}  # этап без префикса протокола, например "connect_tcp.started" -> момент
+
+    def __call__(self, name: str, info: dict):
+        """
+        Вызывается httpcore в синхронных клиентах.
+
+        :param name: событие, например "connection.connect_tcp.complete" или "http11.send_request_body.started"
+        :param info: параметры события (не используются)
+        """
+        for prefix in ("connection.", *PROTOCOL_PREFIXES):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+                break
+        self.events.setdefault(name, time.perf_counter())  # при повторной попытке соединения учитываем первую
+
+    def finish(self):
+        self.finished_at = time.perf_counter()
+
+    def get_duration(self, stage: str, start: str = "started", end: str = "complete") -> float | None:
+        """
+        :param stage: этап, например "connect_tcp"
+        :param start: событие начала этапа
+        :param end: событие окончания этапа
+        :return: длительность этапа в миллисекундах или None, если события не было
+        """
+        started_at, finished_at = self.events.get(f"{stage}.{start}"), self.events.get(f"{stage}.{end}")
+        if started_at is None or finished_at is None:
+            return None
+        return (finished_at - started_at) * 1000
+
+    @property
+    def elapsed(self) -> float:
+        """
+        :return: время от отправки запроса до получения заголовков ответа в миллисекундах
+        """
+        return ((self.finished_at or time.perf_counter()) - self.started_at) * 1000
+
+    @property
+    def breakdown(self) -> dict[str, float]:
+        """
+        Этапы запроса в миллисекундах. Пустой словарь, если транспорт не присылает события trace.
+
+        pool    — ожидание свободного соединения в пуле;
+        connect — установка TCP соединения (0, если соединение переиспользовано из пула);
+        tls     — TLS рукопожатие (0 для http и переиспользованных соединений);
+        send    — отправка заголовков и тела запроса;
+        server  — от отправки тела до получения заголовков ответа: обработка на сервере плюс сеть в обе стороны.
+        """
+        sent_at = self.events.get("send_request_headers.started")
+        body_sent_at = self.events.get("send_request_body.complete")
+        headers_received_at = self.events.get("receive_response_headers.complete")
+        if sent_at is None or body_sent_at is None or headers_received_at is None:
+            return {}
+
+        connect = self.get_duration("connect_tcp") or 0.0
+        tls = self.get_duration("start_tls") or 0.0
+        acquired_at = self.events.get("connect_tcp.started", sent_at)
+        return {
+            "pool": max(0.0, (acquired_at - self.started_at) * 1000),
+            "connect": connect,
+            "tls": tls,
+            "send": (body_sent_at - sent_at) * 1000,
+            "server": (headers_received_at - body_sent_at) * 1000
+        }
+
+    def __str__(self) -> str:
+        if not (breakdown := self.breakdown):
+            return f"{self.elapsed:.1f} мс (транспорт не сообщает этапы запроса)"
+
+        return (
+            f"{self.elapsed:.1f} мс: ожидание пула {breakdown['pool']:.1f} мс, TCP соединение {breakdown['connect']:.1f} мс, "
+            f"TLS {breakdown['tls']:.1f} мс, отправка {breakdown['send']:.1f} мс, сервер {breakdown['server']:.1f} мс"
+        )
+
+
+class AsyncRequestTimings(RequestTimings):
+    """
+    Моменты этапов запроса асинхронного клиента: httpcore ожидает от trace корутину.
+    """
+
+    async def __call__(self, name: str, info: dict):
+        super().__call__(name, info)
+
+
+def get_request_timings(request: Request) -> RequestTimings | None:
+    """
+    :param request: HTTP-запрос, прошедший через event hooks клиента
+    :return: этапы запроса или None, если замер выключен
+    """
+    return request.extensions.get("timings")
@@ -0,0 +1,83 @@
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from config import settings
+from tools.logger import get_logger
+
+
+
+logger = get_logger("UPLOAD_CACHE")
+
+
+class CachedUploadFile(NamedTuple):
+    content: bytes  # содержимое файла
+    sha256: str  # хэш содержимого (hex)
+    mtime_ns: int  # время изменения файла на момент чтения
+    size: int  # размер файла на момент чтения
+
+
+class UploadFileCache:
+    """
+    Кэш содержимого небольших загружаемых файлов, общий для всех клиентов воркера.
+
+    Ключ — путь, время изменения и размер файла: если файл изменился на диске, он читается заново.
+    Для каждого пути хранится только последняя версия. Файлы больше max_file_size не кэшируются
+    и загружаются потоково с диска.
+    """
+
+    def __init__(self, max_file_size: int):
+        """
+        :param max_file_size: максимальный размер кэшируемого файла в байтах (0 — кэш выключен)
+        """
+        self.max_file_size = max_file_size
+        self.hits = 0
+        self.misses = 0
+        self._files: dict[str, CachedUploadFile] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file: Path) -> CachedUploadFile | None:
+        """
+        :param file: путь к загружаемому файлу
+        :return: содержимое файла из кэша (файл читается при первом обращении или после изменения)
+            или None, если файл слишком большой для кэша
+        """
+        stat = file.stat()
+        if stat.st_size > self.max_file_size:
+            return None
+
+        path = os.path.abspath(file)
+        with self._lock:
+            cached = self._files.get(path)
+            if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                self.hits += 1
+                return cached
+
+            content = file.read_bytes()
+            cached = CachedUploadFile(
+                content=content,
+                sha256=hashlib.sha256(content).hexdigest(),
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size
+            )
+            self._files[path] = cached
+            self.misses += 1
+
+        logger.debug("Файл %s прочитан в кэш загрузок (%s байт, sha256 %s)", path, cached.size, cached.sha256)
+        return cached
+
+    def sha256(self, file: Path) -> str:
+        """
+        :param file: путь к загружаемому файлу
+        :return: хэш содержимого файла (hex): из кэша для небольших файлов, для остальных — потоковым чтением с диска
+        """
+        if cached := self.get(file):
+            return cached.sha256
+
+        with file.open("rb") as stream:
+            return hashlib.file_digest(stream, "sha256").hexdigest()
+
+
+upload_files_cache = UploadFileCache(max_file_size=settings.upload_cache.max_file_size)
@@ -0,0 +1,14 @@
+"""
+Нагрузка на сервис LMS теми же доменными клиентами, что и в функциональных тестах.
+
+Сценарий (tools/load/scenario.py) задает взвешенную смесь операций (tools/load/operations.py), количество
+виртуальных пользователей, длительность и разгон. Пользователи работают в одном event loop (mode=asyncio)
+или каждый в своем потоке (mode=threads). Раз в report_interval в консоль и в файл результатов (JSON Lines)
+пишутся пропускная способность и перцентили задержек за интервал, в конце — итог по маршрутам.
+
+Запуск:
+    python -m tools.load --users 50 --duration 60 --ramp-up 10 --mix get_course=5,get_courses=3,create_course=1
+    python -m tools.load --scenario ./load-scenario.json --output ./load-results.jsonl
+"""
+from tools.load.runner import LoadReportSchema, LoadRunner, LoadSnapshotSchema
+from tools.load.scenario import LoadScenarioSchema
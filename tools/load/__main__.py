@@ -0,0 +1,67 @@
+import argparse
+from pathlib import Path
+
+from config import settings
+from tools.load.runner import LoadRunner
+from tools.load.scenario import LoadScenarioSchema
+from tools.stand_in import start_stand_in
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузка на сервис доменными клиентами по сценарию")
+    parser.add_argument("--scenario", type=Path, help="JSON файл сценария (аргументы ниже переопределяют его поля)")
+    parser.add_argument("--mix", help="Смесь операций с весами, например get_course=5,create_course=1")
+    parser.add_argument("--users", type=int, help="Количество виртуальных пользователей")
+    parser.add_argument("--duration", type=float, help="Длительность нагрузки в секундах, включая разгон")
+    parser.add_argument("--ramp-up", type=float, help="За сколько секунд запускаются все пользователи")
+    parser.add_argument("--think-time", type=float, help="Пауза пользователя между операциями в секундах")
+    parser.add_argument("--mode", choices=("asyncio", "threads"), help="Виртуальные пользователи в event loop или в потоках")
+    parser.add_argument("--report-interval", type=float, help="Как часто выводить показатели, в секундах")
+    parser.add_argument("--seed", type=int, help="Сид выбора операций")
+    parser.add_argument("--output", type=Path, default=Path("./load-results.jsonl"), help="Куда сохранить показатели и итог")
+    args = parser.parse_args()
+
+    overrides = {
+        name: value for name, value in {
+            "operations": LoadScenarioSchema.parse_operations(args.mix) if args.mix else None,
+            "users": args.users,
+            "duration": args.duration,
+            "ramp_up": args.ramp_up,
+            "think_time": args.think_time,
+            "mode": args.mode,
+            "report_interval": args.report_interval,
+            "seed": args.seed
+        }.items() if value is not None
+    }
+    scenario = LoadScenarioSchema.from_file(args.scenario, **overrides) if args.scenario else LoadScenarioSchema(**overrides)
+
+    start_stand_in()
+    target = settings.http_client.client_url
+    print(f"Подготовка {scenario.users} виртуальных пользователей для {target}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", encoding="utf-8") as output:
+        runner = LoadRunner(scenario, output)
+        runner.prepare()
+        print(f"Нагрузка: {scenario.mode}, {scenario.users} пользователей, {scenario.duration} с, разгон {scenario.ramp_up} с")
+        try:
+            runner.run()
+        except KeyboardInterrupt:
+            print("Нагрузка остановлена")
+
+        report = runner.build_report(target)
+        output.write(report.model_dump_json() + "\n")
+
+    print(
+        f"Итог: {report.latency.requests} запросов за {report.latency.duration:.1f} с "
+        f"({report.latency.throughput:.1f} запросов/с), ошибок: {sum(report.errors.values())}"
+    )
+    for route in report.latency.routes:
+        print(f"  {route}")
+    for error, count in report.errors.items():
+        print(f"  {error}: {count}")
+    print(f"Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
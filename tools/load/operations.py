@@ -0,0 +1,157 @@
+"""
+Виртуальные пользователи и операции нагрузки поверх доменных клиентов функциональных тестов.
+
+Данные пользователя (пользователь, файл, курс, задание) создаются теми же функциями, что и в фикстурах
+(fixtures/files.py, fixtures/courses.py, fixtures/exercises.py). Операция — один запрос доменного клиента:
+одна и та же функция работает и с синхронными клиентами (режим threads), и с асинхронными (режим asyncio),
+так как у клиентов совпадают имена методов; асинхронный вариант возвращает корутину.
+"""
+from typing import Awaitable, Callable, NamedTuple
+
+from httpx import AsyncClient, Client
+from pydantic import BaseModel
+
+from clients.api_response import APIResponse
+from clients.authentication.authentication_client import AuthenticationClient, AsyncAuthenticationClient, \
+    get_authentication_client, get_async_authentication_client
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.courses.courses_client import CoursesClient, AsyncCoursesClient
+from clients.courses.courses_schema import CreateCourseRequestSchema, GetCoursesQuerySchema, UpdateCourseRequestSchema
+from clients.exercises.exercises_client import ExercisesClient, AsyncExercisesClient
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, GetExercisesQuerySchema, \
+    UpdateExerciseRequestSchema
+from clients.files.files_client import FilesClient, AsyncFilesClient
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import build_private_http_client, get_async_private_http_client
+from clients.users.private_users_client import PrivateUsersClient, AsyncPrivateUsersClient
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from fixtures.courses import CourseFixture, create_course
+from fixtures.exercises import ExerciseFixture, create_exercise
+from fixtures.files import FileFixture, create_file
+from fixtures.users import UserFixture
+
+
+class VirtualUserDataSchema(BaseModel):
+    """
+    Данные виртуального пользователя, созданные до начала нагрузки.
+    """
+    user: UserFixture
+    file: FileFixture
+    course: CourseFixture
+    exercise: ExerciseFixture
+
+
+class VirtualUserClients(NamedTuple):
+    """
+    Доменные клиенты виртуального пользователя: все синхронные или все асинхронные.
+    """
+    http_clients: tuple[Client | AsyncClient, ...]  # закрываются по окончании нагрузки
+    authentication: AuthenticationClient | AsyncAuthenticationClient
+    users: PrivateUsersClient | AsyncPrivateUsersClient
+    files: FilesClient | AsyncFilesClient
+    courses: CoursesClient | AsyncCoursesClient
+    exercises: ExercisesClient | AsyncExercisesClient
+
+
+class VirtualUser(NamedTuple):
+    number: int
+    data: VirtualUserDataSchema
+    clients: VirtualUserClients
+
+
+def create_virtual_user_data() -> VirtualUserDataSchema:
+    """
+    Создает пользователя, файл, курс и задание синхронными клиентами (как фикстуры function_user, function_file, function_course и function_exercise).
+    Вне pytest созданные данные не удаляются.
+    """
+    request = CreateUserRequestSchema()
+    user = UserFixture(request=request, response=get_public_users_client().create_user(request))
+
+    http_client = build_private_http_client(user.authentication_user)
+    with http_client:
+        file = create_file(FilesClient(client=http_client))
+        course = create_course(CoursesClient(client=http_client), user, file)
+        exercise = create_exercise(ExercisesClient(client=http_client), course)
+
+    return VirtualUserDataSchema(user=user, file=file, course=course, exercise=exercise)
+
+
+def build_clients(data: VirtualUserDataSchema) -> VirtualUserClients:
+    """
+    :return: синхронные клиенты пользователя (для режима threads): свой httpx.Client поверх общего пула соединений
+    """
+    http_client = build_private_http_client(data.user.authentication_user)
+    authentication_client = get_authentication_client()
+    return VirtualUserClients(
+        http_clients=(http_client, authentication_client.client),
+        authentication=authentication_client,
+        users=PrivateUsersClient(client=http_client),
+        files=FilesClient(client=http_client),
+        courses=CoursesClient(client=http_client),
+        exercises=ExercisesClient(client=http_client)
+    )
+
+
+async def build_async_clients(data: VirtualUserDataSchema) -> VirtualUserClients:
+    """
+    :return: асинхронные клиенты пользователя (для режима asyncio), привязанные к текущему event loop
+    """
+    http_client = await get_async_private_http_client(data.user.authentication_user)
+    authentication_client = get_async_authentication_client()
+    return VirtualUserClients(
+        http_clients=(http_client, authentication_client.client),
+        authentication=authentication_client,
+        users=AsyncPrivateUsersClient(client=http_client),
+        files=AsyncFilesClient(client=http_client),
+        courses=AsyncCoursesClient(client=http_client),
+        exercises=AsyncExercisesClient(client=http_client)
+    )
+
+
+Operation = Callable[[VirtualUser], APIResponse | Awaitable[APIResponse]]
+
+# Операции нагрузки: имя -> один запрос доменного клиента от имени виртуального пользователя
+OPERATIONS: dict[str, Operation] = {
+    "login": lambda user: user.clients.authentication.login_api(
+        LoginRequestSchema(email=user.data.user.email, password=user.data.user.password)
+    ),
+    "get_user_me": lambda user: user.clients.users.get_user_me_api(),
+    "get_file": lambda user: user.clients.files.get_file_api(user.data.file.response.file.id),
+    "create_file": lambda user: user.clients.files.create_file_api(
+        CreateFileRequestSchema(upload_file=user.data.file.request.upload_file)
+    ),
+    "get_courses": lambda user: user.clients.courses.get_courses_api(
+        GetCoursesQuerySchema(user_id=user.data.user.response.user.id)
+    ),
+    "get_course": lambda user: user.clients.courses.get_course_api(user.data.course.response.course.id),
+    "create_course": lambda user: user.clients.courses.create_course_api(
+        CreateCourseRequestSchema(
+            preview_file_id=user.data.file.response.file.id,
+            created_by_user_id=user.data.user.response.user.id
+        )
+    ),
+    "update_course": lambda user: user.clients.courses.update_course_api(
+        user.data.course.response.course.id, UpdateCourseRequestSchema()
+    ),
+    "get_exercises": lambda user: user.clients.exercises.get_exercises_api(
+        GetExercisesQuerySchema(course_id=user.data.course.response.course.id)
+    ),
+    "get_exercise": lambda user: user.clients.exercises.get_exercise_api(user.data.exercise.response.exercise.id),
+    "create_exercise": lambda user: user.clients.exercises.create_exercise_api(
+        CreateExerciseRequestSchema(course_id=user.data.course.response.course.id)
+    ),
+    "update_exercise": lambda user: user.clients.exercises.update_exercise_api(
+        user.data.exercise.response.exercise.id, UpdateExerciseRequestSchema()
+    ),
+}
+
+
+def close_clients(clients: VirtualUserClients):
+    for http_client in clients.http_clients:
+        http_client.close()
+
+
+async def close_async_clients(clients: VirtualUserClients):
+    for http_client in clients.http_clients:
+        await http_client.aclose()
@@ -0,0 +1,329 @@
+import asyncio
+import itertools
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, TextIO
+
+from pydantic import BaseModel
+
+from clients.api_coverage import route_templates
+from clients.api_response import APIResponse
+from config import settings
+from tools.allure.steps import configure_allure_mode
+from tools.http.latency import LatencyCollector, LatencyReportSchema, RouteHistogramSchema
+from tools.load.operations import OPERATIONS, VirtualUser, VirtualUserDataSchema, build_async_clients, build_clients, \
+    close_async_clients, close_clients, create_virtual_user_data
+from tools.load.scenario import LoadScenarioSchema
+from tools.logger import raise_level
+
+SETUP_WORKERS = 16  # сколько виртуальных пользователей подготавливается одновременно
+LOG_LEVEL = "WARNING"  # лог каждого запроса перемешался бы с показателями нагрузки, предупреждения и ошибки остаются
+
+
+class LoadSnapshotSchema(BaseModel):
+    """
+    Показатели нагрузки за последний интервал (строка файла результатов).
+    """
+    type: Literal["snapshot"] = "snapshot"
+    elapsed: float  # секунд от начала нагрузки
+    users: int  # активных виртуальных пользователей
+    requests: int  # запросов за интервал
+    errors: int  # ошибок за интервал (исключения и ответы не 2xx)
+    throughput: float  # запросов в секунду за интервал
+    p50: float  # задержки за интервал в миллисекундах
+    p90: float
+    p99: float
+    max: float
+    total_requests: int  # запросов от начала нагрузки
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.elapsed:>7.1f} с] пользователей {self.users:>4}, {self.throughput:>8.1f} запросов/с, "
+            f"p50 {self.p50:>8.1f} мс, p90 {self.p90:>8.1f} мс, p99 {self.p99:>8.1f} мс, max {self.max:>8.1f} мс, "
+            f"ошибок {self.errors / self.requests if self.requests else 0:.1%}, всего {self.total_requests}"
+        )
+
+
+class LoadReportSchema(BaseModel):
+    """
+    Итог нагрузки (последняя строка файла результатов).
+    """
+    type: Literal["report"] = "report"
+    target: str  # URL сервиса
+    scenario: LoadScenarioSchema
+    operations: dict[str, int] = {}  # количество выполненных операций по именам
+    errors: dict[str, int] = {}  # количество ошибок по операции и статус-коду или типу исключения
+    latency: LatencyReportSchema  # задержки по маршрутам за всю нагрузку
+
+
+class LoadStats:
+    """
+    Показатели нагрузки: гистограммы по маршрутам за всю нагрузку и общая гистограмма текущего интервала.
+    Запись потокобезопасна: в режиме threads операции записывают показатели из потоков пользователей.
+    """
+
+    def __init__(self):
+        self.collector = LatencyCollector()
+        self.operations: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.window = RouteHistogramSchema(method="*", route="*")
+        self.window_errors = 0
+        self.total_requests = 0
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, response: APIResponse | None, latency: float, error: str | None):
+        """
+        :param operation: имя операции
+        :param response: ответ или None, если запрос завершился исключением
+        :param latency: время операции в секундах
+        :param error: статус-код или тип исключения, если операция неуспешна
+        """
+        if response is not None:
+            route = route_templates.match(response.request.url.path)
+            self.collector.record(response.request.method, route, latency, response.status_code)
+
+        with self._lock:
+            self.window.record(round(latency * 1_000_000), response.status_code if response is not None else 0, time.time())
+            self.operations[operation] += 1
+            self.total_requests += 1
+            if error:
+                self.errors[f"{operation}: {error}"] += 1
+                self.window_errors += 1
+
+    def snapshot(self, elapsed: float, interval: float, users: int) -> LoadSnapshotSchema:
+        """
+        Забирает показатели интервала и начинает новый интервал.
+
+        :param elapsed: секунд от начала нагрузки
+        :param interval: длительность интервала в секундах
+        :param users: активных виртуальных пользователей
+        """
+        with self._lock:
+            window, errors = self.window, self.window_errors
+            self.window, self.window_errors = RouteHistogramSchema(method="*", route="*"), 0
+            total_requests = self.total_requests
+
+        return LoadSnapshotSchema(
+            elapsed=elapsed,
+            users=users,
+            requests=window.count,
+            errors=errors,
+            throughput=window.count / interval if interval > 0 else 0.0,
+            p50=window.percentile(50) / 1000,
+            p90=window.percentile(90) / 1000,
+            p99=window.percentile(99) / 1000,
+            max=window.max / 1000,
+            total_requests=total_requests
+        )
+
+
+class LoadRunner:
+    """
+    Запускает виртуальных пользователей по сценарию и раз в report_interval выводит показатели в консоль
+    и дописывает их строкой JSON в файл результатов.
+    """
+
+    def __init__(self, scenario: LoadScenarioSchema, output: TextIO | None = None):
+        """
+        :param scenario: сценарий нагрузки
+        :param output: файл результатов (JSON Lines) или None
+        """
+        self.scenario = scenario
+        self.output = output
+        self.stats = LoadStats()
+        self.users: list[VirtualUserDataSchema] = []
+        self.active_users = 0
+        self.started_at = 0.0
+        self.stop = threading.Event()
+        self._names = list(scenario.operations)
+        self._cum_weights = list(itertools.accumulate(scenario.operations.values()))
+        self._lock = threading.Lock()
+
+    def configure(self):
+        """
+        Настраивает процесс под нагрузку до запуска потоков. Показатели собирает только LoadStats:
+        гистограммы latency_collector и нарушения SLA читают хуки pytest, вне тестов они копились бы без конца.
+        Покрытие эндпоинтов и шаги Allure на каждый запрос нагрузке не нужны.
+        """
+        settings.metrics.enabled = False
+        settings.sla.enabled = False
+        settings.coverage.enabled = False
+        settings.allure_fast_mode = True
+        configure_allure_mode()
+        raise_level(LOG_LEVEL)
+
+    def prepare(self):
+        """
+        Создает данные виртуальных пользователей до начала нагрузки: подготовка не попадает в показатели.
+        """
+        self.configure()
+        with ThreadPoolExecutor(max_workers=min(SETUP_WORKERS, self.scenario.users), thread_name_prefix="load-setup") as executor:
+            self.users = list(executor.map(lambda _: create_virtual_user_data(), range(self.scenario.users)))
+
+    def get_start_delay(self, number: int) -> float:
+        """
+        :return: через сколько секунд после начала нагрузки запускается пользователь number (равномерно в пределах ramp_up)
+        """
+        return self.scenario.ramp_up * number / self.scenario.users
+
+    def get_deadline(self) -> float:
+        return self.started_at + self.scenario.duration
+
+    def choose_operation(self, rng: random.Random) -> str:
+        return rng.choices(self._names, cum_weights=self._cum_weights)[0]
+
+    def change_active_users(self, delta: int):
+        with self._lock:
+            self.active_users += delta
+
+    def run_user(self, user: VirtualUser):
+        rng = random.Random(self.scenario.seed * 1_000_003 + user.number)
+        while not self.stop.is_set() and time.perf_counter() < self.get_deadline():
+            name = self.choose_operation(rng)
+            started_at = time.perf_counter()
+            try:
+                response, error = OPERATIONS[name](user), None
+                if not response.is_success:
+                    error = str(response.status_code)
+            except Exception as exception:
+                response, error = None, type(exception).__name__
+            self.stats.record(name, response, time.perf_counter() - started_at, error)
+
+            if self.scenario.think_time:
+                self.stop.wait(self.scenario.think_time)
+
+    async def arun_user(self, user: VirtualUser):
+        rng = random.Random(self.scenario.seed * 1_000_003 + user.number)
+        while not self.stop.is_set() and time.perf_counter() < self.get_deadline():
+            name = self.choose_operation(rng)
+            started_at = time.perf_counter()
+            try:
+                response, error = await OPERATIONS[name](user), None
+                if not response.is_success:
+                    error = str(response.status_code)
+            except Exception as exception:
+                response, error = None, type(exception).__name__
+            self.stats.record(name, response, time.perf_counter() - started_at, error)
+
+            # sleep(0) отдает управление другим пользователям, даже если транспорт ответил без ожидания (stand-in в режиме asgi)
+            await asyncio.sleep(self.scenario.think_time)
+
+    def run_user_thread(self, user: VirtualUser):
+        if self.stop.wait(self.get_start_delay(user.number)):
+            return
+
+        self.change_active_users(1)
+        try:
+            self.run_user(user)
+        finally:
+            self.change_active_users(-1)
+
+    async def run_user_task(self, user: VirtualUser):
+        await asyncio.sleep(self.get_start_delay(user.number))
+        if self.stop.is_set():
+            return
+
+        self.change_active_users(1)
+        try:
+            await self.arun_user(user)
+        finally:
+            self.change_active_users(-1)
+
+    def report(self):
+        """
+        Раз в report_interval выводит показатели интервала (в отдельном потоке в обоих режимах).
+        """
+        reported_at = self.started_at
+        while not self.stop.wait(max(0.0, reported_at + self.scenario.report_interval - time.perf_counter())):
+            now = time.perf_counter()
+            self.write_snapshot(self.stats.snapshot(now - self.started_at, now - reported_at, self.active_users))
+            reported_at = now
+
+        now = time.perf_counter()
+        if now - reported_at > 0.01:  # хвост последнего неполного интервала
+            self.write_snapshot(self.stats.snapshot(now - self.started_at, now - reported_at, self.active_users))
+
+    def write_snapshot(self, snapshot: LoadSnapshotSchema):
+        print(snapshot, flush=True)
+        if self.output:
+            self.output.write(snapshot.model_dump_json() + "\n")
+            self.output.flush()
+
+    def start_reporting(self) -> threading.Thread:
+        """
+        Начинает отсчет нагрузки и запускает вывод показателей.
+        """
+        self.started_at = time.perf_counter()
+        reporter = threading.Thread(target=self.report, name="load-reporter", daemon=True)
+        reporter.start()
+        return reporter
+
+    def run_threads(self):
+        with ThreadPoolExecutor(max_workers=min(SETUP_WORKERS, len(self.users)), thread_name_prefix="load-setup") as executor:
+            clients = list(executor.map(build_clients, self.users))
+        users = [VirtualUser(number=number, data=data, clients=clients[number]) for number, data in enumerate(self.users)]
+
+        reporter = self.start_reporting()
+        try:
+            threads = [
+                threading.Thread(target=self.run_user_thread, args=(user,), name=f"load-user-{user.number}", daemon=True)
+                for user in users
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.1)  # join с таймаутом, чтобы Ctrl+C прерывал ожидание
+        finally:
+            self.stop.set()
+            reporter.join()
+            for user in users:
+                close_clients(user.clients)
+
+    async def arun_users(self):
+        # Клиенты создаются до начала отсчета: создание httpx.AsyncClient блокирует event loop (SSL контекст, пул)
+        clients = await asyncio.gather(*(build_async_clients(data) for data in self.users))
+        users = [VirtualUser(number=number, data=data, clients=clients[number]) for number, data in enumerate(self.users)]
+
+        reporter = self.start_reporting()
+        try:
+            await asyncio.gather(*(self.run_user_task(user) for user in users))
+        finally:
+            self.stop.set()
+            await asyncio.to_thread(reporter.join)
+            for user in users:
+                await close_async_clients(user.clients)
+
+    def run(self):
+        """
+        Выполняет нагрузку: пользователи запускаются в течение ramp_up и работают до истечения duration.
+        Прерывание (Ctrl+C) останавливает пользователей, собранные показатели сохраняются.
+        """
+        self.configure()
+        if not self.users:
+            self.prepare()
+
+        try:
+            if self.scenario.mode == "asyncio":
+                asyncio.run(self.arun_users())
+            else:
+                self.run_threads()
+        finally:
+            self.stop.set()
+
+    def build_report(self, target: str) -> LoadReportSchema:
+        """
+        :param target: URL сервиса
+        :return: итог нагрузки
+        """
+        return LoadReportSchema(
+            target=target,
+            scenario=self.scenario,
+            operations=dict(self.stats.operations),
+            errors=dict(self.stats.errors),
+            latency=self.stats.collector.build_report()
+        )
+
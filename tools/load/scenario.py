@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Literal, Self
+
+from pydantic import BaseModel, Field, model_validator
+
+from tools.load.operations import OPERATIONS
+
+
+class LoadScenarioSchema(BaseModel):
+    """
+    Сценарий нагрузки: взвешенная смесь операций, количество виртуальных пользователей, длительность и разгон.
+    """
+    operations: dict[str, float] = {  # операция (см. tools/load/operations.py) -> вес в смеси
+        "get_course": 5,
+        "get_courses": 3,
+        "get_exercises": 3,
+        "get_user_me": 2,
+        "create_exercise": 1
+    }
+    users: int = Field(default=10, ge=1)  # количество виртуальных пользователей
+    duration: float = Field(default=60, gt=0)  # длительность нагрузки в секундах, включая разгон
+    ramp_up: float = Field(default=0, ge=0)  # за сколько секунд равномерно запускаются все виртуальные пользователи
+    think_time: float = Field(default=0, ge=0)  # пауза виртуального пользователя между операциями в секундах
+    mode: Literal["asyncio", "threads"] = "asyncio"  # asyncio — асинхронные клиенты в одном event loop, threads — поток на пользователя
+    report_interval: float = Field(default=1, gt=0)  # как часто выводить текущие показатели, в секундах
+    seed: int = 0  # сид выбора операций: при том же сиде каждый пользователь выполняет ту же последовательность операций
+
+    @model_validator(mode="after")
+    def check_operations(self) -> Self:
+        if unknown := set(self.operations) - set(OPERATIONS):
+            raise ValueError(f"Неизвестные операции {sorted(unknown)}, доступны: {sorted(OPERATIONS)}")
+        if not self.operations or any(weight < 0 for weight in self.operations.values()) or not sum(self.operations.values()):
+            raise ValueError("Веса операций должны быть неотрицательными, хотя бы один — больше нуля")
+        return self
+
+    @classmethod
+    def from_file(cls, path: Path, **kwargs) -> Self:
+        """
+        :param path: JSON файл сценария, например {"operations": {"get_course": 5, "create_course": 1}, "users": 50}
+        :param kwargs: поля, переопределяющие значения из файла
+        :return: LoadScenarioSchema
+        """
+        return cls.model_validate({**cls.model_validate_json(path.read_text(encoding="utf-8")).model_dump(), **kwargs})
+
+    @staticmethod
+    def parse_operations(mix: str) -> dict[str, float]:
+        """
+        :param mix: строка вида "get_course=5,create_course=1" (вес по умолчанию — 1)
+        :return: операция -> вес
+        """
+        operations = {}
+        for item in filter(None, (part.strip() for part in mix.split(","))):
+            name, _, weight = item.partition("=")
+            operations[name.strip()] = float(weight or 1)
+        return operations
@@ -1,27 +1,165 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
 
+from config import settings
 
 
+FORMAT = '%(asctime)s | %(name)s | %(levelname)s | %(message)s'  # формат строк логов в консоли
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler, который не форматирует запись в потоке теста.
+
+    Стандартный QueueHandler.prepare() форматирует сообщение до постановки в очередь. Очередь у нас
+    внутрипроцессная, поэтому запись можно передать как есть: форматирование и запись в stderr/файл
+    выполняет поток QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускает только долю записей уровня INFO и ниже. WARNING и выше проходят всегда.
+    """
+
+    def __init__(self, rate: float):
+        """
+        :param rate: Доля пропускаемых записей от 0 до 1.
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Форматирует запись в одну строку JSON для структурированного лога.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": record.created,
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "master")
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False)
+
+
+_queue_handler: QueueHandler | None = None
+_lock = threading.Lock()
+
+
+def get_jsonl_file_handler() -> logging.Handler | None:
+    """
+    Создает обработчик структурированного JSONL лога, если он включен в настройках.
+    Под xdist у каждого воркера свой файл, чтобы строки разных процессов не перемешивались.
+
+    :return: FileHandler или None.
+    """
+    if (file := settings.logging.jsonl_file) is None:
+        return None
+
+    if worker := os.environ.get("PYTEST_XDIST_WORKER"):
+        file = file.with_stem(f"{file.stem}-{worker}")
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(file, encoding="utf-8")
+    handler.setFormatter(JsonLinesFormatter())
+    return handler
+
+
+def get_queue_handler() -> QueueHandler:
+    """
+    Лениво создает общий для процесса QueueHandler и запускает QueueListener с реальными обработчиками.
+
+    :return: QueueHandler, который можно добавлять к логгерам.
+    """
+    global _queue_handler
+
+    with _lock:
+        if _queue_handler is None:
+            stream_handler = logging.StreamHandler()  # создание обработчика, который будет выводить сообщения в консоль
+            stream_handler.setFormatter(logging.Formatter(FORMAT))
+            handlers = [stream_handler]
+
+            if jsonl_handler := get_jsonl_file_handler():
+                handlers.append(jsonl_handler)
+
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)  # при завершении процесса дописываем оставшиеся в очереди записи
+
+            _queue_handler = DeferredQueueHandler(log_queue)
+
+    return _queue_handler
+
 
 def get_logger(name: str) -> logging.Logger:  # функция для создания логгера
+    """
+    Возвращает логгер с указанным именем. Повторный вызов возвращает тот же логгер без новых обработчиков.
+
+    Тест только кладет запись в очередь, а вывод в консоль (и в JSONL файл) выполняет отдельный поток.
+    Уровень берется из settings.logging.levels[name] или settings.logging.level,
+    доля выводимых INFO записей — из settings.logging.sample_rates[name].
+
+    :param name: Имя логгера.
+    :return: Настроенный логгер.
+    """
     logger = logging.getLogger(name)  # создание логгера c указанным именем
-    logger.setLevel(logging.DEBUG)  # установка минимального уровня логирования для логгера. logging.DEBUG — это самый низкий уровень (0), означающий, что будут выводиться все сообщения: DEBUG, INFO, WARNING, ERROR, CRITICAL.
+    if getattr(logger, "_queue_configured", False):
+        return logger
 
-    handler = logging.StreamHandler()  # создание обработчика, который будет выводить сообщения в консоль
-    handler.setLevel(logging.DEBUG)  # минимальный уровень логирования для обработчика
+    queue_handler = get_queue_handler()  # до блокировки: get_queue_handler сам берет _lock
 
-    formatter = logging.Formatter(
-        '%(asctime)s | %(name)s | %(levelname)s | %(message)s')  # создание форматтера, который определяет, как должны выглядеть строки логов.
-    handler.setFormatter(formatter)  # Применяет созданный форматтер к обработчику логов.
+    with _lock:
+        if getattr(logger, "_queue_configured", False):
+            return logger
 
-    logger.addHandler(handler)  # добавление обработчика к логгеру
+        logger.setLevel(settings.logging.levels.get(name, settings.logging.level).upper())
+
+        if (rate := settings.logging.sample_rates.get(name)) is not None and rate < 1:
+            logger.addFilter(SamplingFilter(rate))
+
+        logger.addHandler(queue_handler)  # добавление обработчика к логгеру
+        logger._queue_configured = True  # последним: другой поток не получит логгер без обработчика
 
     return logger  # возвращает созданный логгер
 
-"""
-Теперь, при вызове методов logger.debug(), logger.info() и т.д., 
-логи будут отправляться в указанный обработчик (в данном случае — в консоль) в заданном формате.
-"""
 
-# logger = get_logger("test")
-# logger.info("123")
\ No newline at end of file
+def raise_level(level: str):
+    """
+    Поднимает уровень созданных и будущих логгеров проекта не ниже level (например, WARNING на время нагрузки,
+    чтобы INFO запись о каждом запросе не перемешивалась с выводом). Предупреждения и ошибки остаются видны.
+
+    :param level: Минимальный уровень, например "WARNING".
+    """
+    minimum = logging.getLevelName(level.upper())
+    with _lock:
+        if logging.getLevelName(settings.logging.level.upper()) < minimum:
+            settings.logging.level = level
+        settings.logging.levels = {
+            name: value if logging.getLevelName(value.upper()) >= minimum else level
+            for name, value in settings.logging.levels.items()
+        }
+
+        for logger in list(logging.Logger.manager.loggerDict.values()):
+            if getattr(logger, "_queue_configured", False) and logger.level < minimum:
+                logger.setLevel(minimum)
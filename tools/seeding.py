@@ -0,0 +1,254 @@
+"""
+Массовое создание тестовых данных (пользователи → файлы → курсы → задания) перед нагрузочными и list-тестами.
+
+Все сущности создаются асинхронными клиентами с ограничением количества одновременных запросов.
+Зависимости соблюдаются: задания курса создаются после курса, курс — после загрузки его файла превью.
+Результат — компактный индекс созданных идентификаторов и отчет о скорости и ошибках.
+
+Запуск:
+    python -m tools.seeding --spec 50x20x30 --concurrency 32 --output ./seed-index.json
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Awaitable, Callable, Self, TypeVar
+
+from httpx import AsyncClient
+from pydantic import BaseModel, Field, FilePath
+
+from clients.api_response import APIResponse
+from clients.courses.courses_client import AsyncCoursesClient
+from clients.courses.courses_schema import CreateCourseRequestSchema, CreateCourseResponseSchema
+from clients.exercises.exercises_client import AsyncExercisesClient
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, ExerciseResponseSchema
+from clients.files.files_client import AsyncFilesClient
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.private_http_builder import AuthenticationUserSchema, get_async_private_http_client
+from clients.users.public_users_client import get_async_public_users_client, AsyncPublicUsersClient
+from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
+from tools.logger import get_logger
+from tools.stand_in import start_stand_in
+
+
+logger = get_logger("SEEDING")
+
+MAX_REPORTED_ERRORS = 20  # сколько текстов ошибок сохранять в отчете
+
+ResultT = TypeVar("ResultT")
+
+
+class SeedSpecSchema(BaseModel):
+    """
+    Описание объема данных: users пользователей, у каждого courses курсов, у каждого курса exercises заданий.
+    """
+    users: int = Field(default=1, ge=0)
+    courses: int = Field(default=1, ge=0)  # курсов на пользователя (у каждого курса свой файл превью)
+    exercises: int = Field(default=0, ge=0)  # заданий на курс
+    concurrency: int = Field(default=16, ge=1)  # максимальное количество одновременных запросов
+    upload_file: FilePath = Field(default_factory=lambda: settings.test_data.image_png_file)  # файл превью курсов
+
+    @classmethod
+    def from_string(cls, spec: str, **kwargs) -> Self:
+        """
+        :param spec: строка вида "50x20x30" (пользователи x курсы x задания), части справа можно опустить
+        :return: SeedSpecSchema
+        """
+        parts = map(int, spec.lower().replace("×", "x").split("x"))
+        return cls(**dict(zip(("users", "courses", "exercises"), parts)), **kwargs)  # недостающие части — по умолчанию полей
+
+    @property
+    def total(self) -> int:
+        """
+        :return: сколько сущностей (включая файлы) будет создано
+        """
+        return self.users + self.users * self.courses * (2 + self.exercises)
+
+
+class SeededCourseSchema(BaseModel):
+    id: str
+    preview_file_id: str
+    exercise_ids: list[str] = []
+
+
+class SeededUserSchema(BaseModel):
+    id: str
+    email: str
+    password: str
+    courses: list[SeededCourseSchema] = []
+
+
+class SeedIndexSchema(BaseModel):
+    """
+    Компактный индекс созданных данных: только идентификаторы и учетные данные пользователей.
+    """
+    users: list[SeededUserSchema] = []
+
+
+class SeedReportSchema(BaseModel):
+    created: dict[str, int] = {}  # количество созданных сущностей по типам
+    failed: dict[str, int] = {}  # количество ошибок по типам
+    errors: list[str] = []  # первые MAX_REPORTED_ERRORS ошибок
+    elapsed: float = 0  # время в секундах
+
+    @property
+    def throughput(self) -> float:
+        """
+        :return: успешных запросов (созданных сущностей и логинов) в секунду
+        """
+        return sum(self.created.values()) / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        created = ", ".join(f"{kind}: {count}" for kind, count in self.created.items()) or "-"
+        failed = ", ".join(f"{kind}: {count}" for kind, count in self.failed.items()) or "-"
+        return f"Создано: {created}. Ошибок: {failed}. Время: {self.elapsed:.1f} с, {self.throughput:.1f} запросов/с"
+
+
+class Seeder:
+    """
+    Создает данные по SeedSpecSchema. Ошибка при создании сущности не прерывает заполнение:
+    она учитывается в отчете, а зависящие от нее сущности пропускаются.
+    """
+
+    def __init__(self, spec: SeedSpecSchema):
+        self.spec = spec
+        self.semaphore = asyncio.Semaphore(spec.concurrency)
+        self.created: Counter[str] = Counter()
+        self.failed: Counter[str] = Counter()
+        self.errors: list[str] = []
+
+    async def call(self, kind: str, request: Callable[[], Awaitable[ResultT]]) -> ResultT | None:
+        """
+        Выполняет запрос под семафором и учитывает результат в отчете.
+
+        :param kind: тип сущности для отчета (user, login, file, course, exercise)
+        :param request: функция, возвращающая корутину запроса
+        :return: результат запроса или None при ошибке
+        """
+        async with self.semaphore:
+            try:
+                result = await request()
+            except Exception as error:
+                self.failed[kind] += 1
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append(f"{kind}: {error!r}")
+                logger.warning("Не удалось создать %s: %r", kind, error)
+                return None
+
+        self.created[kind] += 1
+        return result
+
+    @staticmethod
+    def parse(response: APIResponse, schema: type[ResultT]) -> ResultT:
+        """
+        :return: тело ответа в виде schema
+        :raises httpx.HTTPStatusError: если сервер вернул ошибку
+        """
+        response.raise_for_status()
+        return response.model(schema)
+
+    async def seed_course(self, http_client: AsyncClient, user: CreateUserResponseSchema) -> SeededCourseSchema | None:
+        files_client = AsyncFilesClient(client=http_client)
+        courses_client = AsyncCoursesClient(client=http_client)
+        exercises_client = AsyncExercisesClient(client=http_client)
+
+        async def create_file() -> str:
+            request = CreateFileRequestSchema(upload_file=self.spec.upload_file)
+            return self.parse(await files_client.create_file_api(request), CreateFileResponseSchema).file.id
+
+        if (file_id := await self.call("file", create_file)) is None:
+            return None
+
+        async def create_course() -> str:
+            request = CreateCourseRequestSchema(preview_file_id=file_id, created_by_user_id=user.user.id)
+            return self.parse(await courses_client.create_course_api(request), CreateCourseResponseSchema).course.id
+
+        if (course_id := await self.call("course", create_course)) is None:
+            return None
+
+        async def create_exercise() -> str:
+            request = CreateExerciseRequestSchema(course_id=course_id)
+            return self.parse(await exercises_client.create_exercise_api(request), ExerciseResponseSchema).exercise.id
+
+        exercise_ids = await asyncio.gather(*(self.call("exercise", create_exercise) for _ in range(self.spec.exercises)))
+        return SeededCourseSchema(
+            id=course_id,
+            preview_file_id=file_id,
+            exercise_ids=[exercise_id for exercise_id in exercise_ids if exercise_id]
+        )
+
+    async def seed_user(self, public_users_client: AsyncPublicUsersClient) -> SeededUserSchema | None:
+        request = CreateUserRequestSchema()
+
+        async def create_user() -> CreateUserResponseSchema:
+            return self.parse(await public_users_client.create_user_api(request), CreateUserResponseSchema)
+
+        user = await self.call("user", create_user)
+        if user is None:
+            return None
+
+        authentication_user = AuthenticationUserSchema(email=request.email, password=request.password)
+        http_client = await self.call("login", lambda: get_async_private_http_client(authentication_user))
+        seeded_user = SeededUserSchema(id=user.user.id, email=request.email, password=request.password)
+        if http_client is None:
+            return seeded_user
+
+        async with http_client:
+            courses = await asyncio.gather(*(self.seed_course(http_client, user) for _ in range(self.spec.courses)))
+
+        seeded_user.courses = [course for course in courses if course]
+        return seeded_user
+
+    async def run(self) -> tuple[SeedIndexSchema, SeedReportSchema]:
+        """
+        :return: индекс созданных данных и отчет
+        """
+        logger.info("Создаем данные: %s (всего сущностей: %s)", self.spec, self.spec.total)
+        started_at = time.perf_counter()
+
+        public_users_client = get_async_public_users_client()
+        async with public_users_client.client:
+            users = await asyncio.gather(*(self.seed_user(public_users_client) for _ in range(self.spec.users)))
+
+        index = SeedIndexSchema(users=[user for user in users if user])
+        report = SeedReportSchema(
+            created=dict(self.created),
+            failed=dict(self.failed),
+            errors=self.errors,
+            elapsed=time.perf_counter() - started_at
+        )
+        return index, report
+
+
+def seed(spec: SeedSpecSchema) -> tuple[SeedIndexSchema, SeedReportSchema]:
+    """
+    Синхронная точка входа: создает данные по спецификации в отдельном event loop.
+
+    :param spec: спецификация объема данных
+    :return: индекс созданных данных и отчет
+    """
+    return asyncio.run(Seeder(spec).run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Массовое создание пользователей, файлов, курсов и заданий")
+    parser.add_argument("--spec", default="1x1x0", help="Пользователи x курсы на пользователя x задания на курс, например 50x20x30")
+    parser.add_argument("--concurrency", type=int, default=16, help="Максимальное количество одновременных запросов")
+    parser.add_argument("--output", type=Path, default=Path("./seed-index.json"), help="Куда сохранить индекс созданных данных")
+    args = parser.parse_args()
+
+    start_stand_in()
+    index, report = seed(SeedSpecSchema.from_string(args.spec, concurrency=args.concurrency))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(index.model_dump_json(indent=2), encoding="utf-8")
+
+    print(report)
+    for error in report.errors:
+        print(f"  {error}")
+    print(f"Индекс сохранен в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Локальная замена сервиса LMS для запусков без сети и без настоящего бэкенда.
+
+Режим выбирается настройкой STAND_IN.MODE:
+    off    — запросы уходят в настоящий сервис по HTTP_CLIENT.URL;
+    asgi   — запросы обрабатываются в процессе без сокетов: асинхронные клиенты работают через httpx.ASGITransport,
+             синхронные — через httpx.MockTransport поверх того же приложения (синхронного ASGI транспорта в httpx нет);
+    server — приложение запускается за локальным HTTP сервером, HTTP_CLIENT.URL переключается на его адрес.
+
+Данные хранятся в памяти процесса: у каждого воркера xdist своя копия сервиса.
+"""
+import threading
+
+from pydantic import HttpUrl
+
+from config import settings
+from tools.logger import get_logger
+from tools.stand_in.app import StandInApp
+from tools.stand_in.server import StandInHTTPServer
+
+
+
+logger = get_logger("STAND_IN")
+
+_app: StandInApp | None = None
+_server: StandInHTTPServer | None = None
+_lock = threading.Lock()
+
+
+def get_stand_in_app() -> StandInApp:
+    """
+    :return: приложение процесса (создается при первом обращении)
+    """
+    global _app
+    with _lock:
+        if _app is None:
+            _app = StandInApp()
+
+        return _app
+
+
+def start_stand_in():
+    """
+    В режиме server запускает локальный сервер (один раз на процесс) и направляет на него settings.http_client.url.
+    Вызывается до создания клиентов: при старте pytest, бенчмарков и заполнения данных. В остальных режимах ничего не делает.
+    """
+    global _server
+    if settings.stand_in.mode != "server" or _server is not None:
+        return
+
+    app = get_stand_in_app()
+    with _lock:
+        if _server is None:
+            _server = StandInHTTPServer(app, host=settings.stand_in.host, port=settings.stand_in.port).start()
+            settings.http_client.url = HttpUrl(_server.url)
+            logger.info("Stand-in сервер LMS запущен на %s", _server.url)
@@ -0,0 +1,508 @@
+import base64
+import hashlib
+import hmac
+import json
+import mimetypes
+import os
+import re
+import threading
+import time
+import uuid
+from email.message import Message
+from http import HTTPStatus
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from httpx import Request, Response, MockTransport, QueryParams
+from pydantic import BaseModel, ValidationError
+
+from clients.courses.courses_schema import CourseSchema
+from clients.exercises.exercises_schema import ExerciseSchema
+from clients.files.files_schema import FileSchema
+from clients.users.users_schema import UserSchema
+from tools.routes import APIRoutes
+from tools.stand_in.schema import CreateUserSchema, UpdateUserSchema, LoginSchema, RefreshSchema, CreateFileSchema, \
+    CreateCourseSchema, UpdateCourseSchema, CreateExerciseSchema, UpdateExerciseSchema, GetCoursesQuerySchema, \
+    GetExercisesQuerySchema, UserPathSchema, FilePathSchema, CoursePathSchema, ExercisePathSchema
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+ACCESS_TOKEN_TTL = 30 * 60  # время жизни access токена в секундах
+REFRESH_TOKEN_TTL = 60 * 24 * 60 * 60  # время жизни refresh токена в секундах
+
+
+class StandInError(Exception):
+    """
+    Ошибка обработки запроса: превращается в ответ {"detail": ...} с указанным статус-кодом.
+    """
+
+    def __init__(self, status: HTTPStatus, detail: Any):
+        self.status = status
+        self.detail = detail
+
+
+class StandInRequest(NamedTuple):
+    request: Request
+    path: dict[str, str]  # параметры пути, например {"course_id": "..."}
+    user: UserSchema | None  # пользователь из access токена (None для публичных маршрутов)
+
+    @property
+    def query(self) -> QueryParams:
+        return self.request.url.params
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.request.url.scheme}://{self.request.url.netloc.decode('ascii')}/"
+
+
+class StandInRoute(NamedTuple):
+    method: str
+    pattern: re.Pattern
+    handler: Callable[[StandInRequest], Response]
+    private: bool  # маршрут требует access токен
+
+
+class StoredFile(NamedTuple):
+    file: FileSchema
+    content: bytes | None  # None, если приложение не хранит содержимое файлов
+
+
+def validation_error(error: ValidationError, location: str) -> StandInError:
+    """
+    :param error: ошибка валидации pydantic
+    :param location: часть запроса (body, query, path), как в loc ошибок FastAPI
+    :return: ошибка 422 в формате FastAPI
+    """
+    details = json.loads(error.json(include_url=False))
+    for detail in details:
+        detail["loc"] = [location, *detail["loc"]]
+
+    return StandInError(HTTPStatus.UNPROCESSABLE_ENTITY, details)
+
+
+def validate(schema: type[ModelT], data: Any, location: str) -> ModelT:
+    try:
+        return schema.model_validate(data)
+    except ValidationError as error:
+        raise validation_error(error, location)
+
+
+def encode_segment(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_segment(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def parse_multipart(request: Request) -> tuple[dict[str, str], dict[str, tuple[str, bytes]]]:
+    """
+    :return: поля формы и файлы (имя поля -> (имя файла, содержимое)) из тела multipart/form-data
+    :raises StandInError: если тело не multipart/form-data
+    """
+    message = Message()
+    message["content-type"] = request.headers.get("content-type", "")
+    boundary = message.get_param("boundary")
+    if message.get_content_type() != "multipart/form-data" or not boundary:
+        raise StandInError(HTTPStatus.UNPROCESSABLE_ENTITY, [
+            {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+        ])
+
+    fields: dict[str, str] = {}
+    files: dict[str, tuple[str, bytes]] = {}
+    for part in request.content.split(b"--" + boundary.encode("latin-1"))[1:-1]:
+        head, _, content = part[2:-2].partition(b"\r\n\r\n")  # часть обрамлена \r\n после границы и перед следующей
+        headers = Message()
+        for line in head.decode("utf-8").split("\r\n"):
+            name, _, value = line.partition(":")
+            headers[name.strip()] = value.strip()
+
+        name = headers.get_param("name", header="content-disposition")
+        filename = headers.get_param("filename", header="content-disposition")
+        if filename is None:
+            fields[name] = content.decode("utf-8")
+        else:
+            files[name] = (filename, content)
+
+    return fields, files
+
+
+class StandInApp:
+    """
+    Локальная замена сервиса LMS: маршруты APIRoutes с хранением данных в памяти процесса.
+
+    Запросы и ответы повторяют схемы clients/*/..._schema.py, ошибки — формат FastAPI ({"detail": ...}).
+    Ядро работает с httpx.Request/httpx.Response, поэтому подключается без сети через httpx.MockTransport
+    (transport), как ASGI приложение (asgi) или за локальным HTTP сервером (tools/stand_in/server.py).
+    Все обработчики выполняются под одной блокировкой: приложение можно вызывать из нескольких потоков.
+    """
+
+    def __init__(self, keep_file_content: bool = True):
+        """
+        :param keep_file_content: хранить содержимое загруженных файлов (False — только метаданные, например
+            для бенчмарков загрузки больших файлов; скачивание такого файла вернет 404)
+        """
+        self.keep_file_content = keep_file_content
+        self.secret = os.urandom(32)  # токены прошлых запусков не проходят проверку подписи
+        self.users: dict[str, UserSchema] = {}
+        self.passwords: dict[str, str] = {}  # user_id -> пароль
+        self.emails: dict[str, str] = {}  # email -> user_id
+        self.files: dict[str, StoredFile] = {}
+        self.static: dict[str, str] = {}  # "directory/filename" -> file_id
+        self.courses: dict[str, CourseSchema] = {}
+        self.exercises: dict[str, ExerciseSchema] = {}
+        self._lock = threading.RLock()
+        self.routes: list[StandInRoute] = []
+
+        self.route("POST", APIRoutes.USERS, self.create_user, private=False)
+        self.route("GET", f"{APIRoutes.USERS}/me", self.get_user_me)
+        self.route("GET", f"{APIRoutes.USERS}/{{user_id}}", self.get_user)
+        self.route("PATCH", f"{APIRoutes.USERS}/{{user_id}}", self.update_user)
+        self.route("DELETE", f"{APIRoutes.USERS}/{{user_id}}", self.delete_user)
+        self.route("POST", f"{APIRoutes.AUTHENTICATION}/login", self.login, private=False)
+        self.route("POST", f"{APIRoutes.AUTHENTICATION}/refresh", self.refresh, private=False)
+        self.route("POST", APIRoutes.FILES, self.create_file)
+        self.route("GET", f"{APIRoutes.FILES}/{{file_id}}", self.get_file)
+        self.route("DELETE", f"{APIRoutes.FILES}/{{file_id}}", self.delete_file)
+        self.route("GET", "/static/{path:path}", self.get_static_file, private=False)
+        self.route("GET", APIRoutes.COURSES, self.get_courses)
+        self.route("POST", APIRoutes.COURSES, self.create_course)
+        self.route("GET", f"{APIRoutes.COURSES}/{{course_id}}", self.get_course)
+        self.route("PATCH", f"{APIRoutes.COURSES}/{{course_id}}", self.update_course)
+        self.route("DELETE", f"{APIRoutes.COURSES}/{{course_id}}", self.delete_course)
+        self.route("GET", APIRoutes.EXERCISES, self.get_exercises)
+        self.route("POST", APIRoutes.EXERCISES, self.create_exercise)
+        self.route("GET", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.get_exercise)
+        self.route("PATCH", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.update_exercise)
+        self.route("DELETE", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.delete_exercise)
+
+    def route(self, method: str, path: str, handler: Callable[[StandInRequest], Response], private: bool = True):
+        """
+        Регистрирует маршрут. Параметры пути записываются как {name} (один сегмент) или {name:path} (остаток пути).
+        """
+        pattern = re.sub(r"\{(\w+):path}", r"(?P<\1>.+)", path)
+        pattern = re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", pattern)
+        self.routes.append(StandInRoute(method=method, pattern=re.compile(f"^{pattern}$"), handler=handler, private=private))
+
+    # ----- транспорт -----
+
+    def handle_request(self, request: Request) -> Response:
+        """
+        Обрабатывает запрос. Сигнатура совместима с httpx.MockTransport.
+
+        :param request: прочитанный запрос (тело доступно через request.content)
+        :return: ответ
+        """
+        try:
+            route, path = self.match(request)
+            with self._lock:
+                user = self.authenticate(request) if route.private else None
+                return route.handler(StandInRequest(request=request, path=path, user=user))
+        except StandInError as error:
+            return Response(error.status, json={"detail": error.detail})
+
+    def match(self, request: Request) -> tuple[StandInRoute, dict[str, str]]:
+        path = request.url.path.rstrip("/") or "/"
+        allowed = False
+        for route in self.routes:
+            if match := route.pattern.match(path):
+                if route.method == request.method:
+                    return route, match.groupdict()
+                allowed = True
+
+        if allowed:
+            raise StandInError(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+        raise StandInError(HTTPStatus.NOT_FOUND, "Not Found")
+
+    @property
+    def transport(self) -> MockTransport:
+        """
+        :return: транспорт для httpx.Client и httpx.AsyncClient, обрабатывающий запросы без сети
+        """
+        return MockTransport(self.handle_request)
+
+    async def asgi(self, scope: dict, receive: Callable, send: Callable):
+        """
+        ASGI приложение поверх handle_request (например, для httpx.ASGITransport или uvicorn).
+        """
+        if scope["type"] == "lifespan":
+            while (message := await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+        body, more_body = b"", True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]]
+        host = next((value for name, value in headers if name.lower() == "host"), None)
+        if host is None:
+            server_host, server_port = scope.get("server") or ("localhost", 80)
+            host = f"{server_host}:{server_port}"
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        url = f"{scope.get('scheme', 'http')}://{host}{scope['path']}" + (f"?{query}" if query else "")
+        response = self.handle_request(Request(scope["method"], url, headers=headers, content=body))
+
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(name, value) for name, value in response.headers.raw]
+        })
+        await send({"type": "http.response.body", "body": response.content})
+
+    # ----- аутентификация -----
+
+    def issue_token(self, user_id: str, token_type: str, ttl: float) -> str:
+        header = encode_segment(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload = encode_segment(json.dumps({
+            "sub": user_id,
+            "type": token_type,
+            "exp": int(time.time() + ttl),
+            "jti": uuid.uuid4().hex
+        }).encode())
+        signature = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        return f"{header}.{payload}.{encode_segment(signature)}"
+
+    def verify_token(self, token: str, token_type: str) -> UserSchema | None:
+        """
+        :return: пользователь токена или None, если токен поддельный, истек, другого типа или пользователь удален
+        """
+        try:
+            header, payload, signature = token.split(".")
+            expected = hmac.new(self.secret, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+            if not hmac.compare_digest(decode_segment(signature), expected):
+                return None
+            claims = json.loads(decode_segment(payload))
+        except ValueError:
+            return None
+
+        if claims.get("type") != token_type or claims.get("exp", 0) <= time.time():
+            return None
+
+        return self.users.get(claims.get("sub"))
+
+    def issue_tokens(self, user: UserSchema) -> Response:
+        return Response(HTTPStatus.OK, json={"token": {
+            "tokenType": "bearer",
+            "accessToken": self.issue_token(user.id, "access", ACCESS_TOKEN_TTL),
+            "refreshToken": self.issue_token(user.id, "refresh", REFRESH_TOKEN_TTL)
+        }})
+
+    def authenticate(self, request: Request) -> UserSchema:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise StandInError(HTTPStatus.FORBIDDEN, "Not authenticated")
+
+        if (user := self.verify_token(token, "access")) is None:
+            raise StandInError(HTTPStatus.UNAUTHORIZED, "Could not validate credentials")
+
+        return user
+
+    # ----- вспомогательные методы -----
+
+    @staticmethod
+    def json_body(request: StandInRequest) -> Any:
+        try:
+            return json.loads(request.request.content)
+        except ValueError as error:
+            raise StandInError(HTTPStatus.UNPROCESSABLE_ENTITY, [
+                {"type": "json_invalid", "loc": ["body", 0], "msg": "JSON decode error", "input": {}, "ctx": {"error": str(error)}}
+            ])
+
+    @staticmethod
+    def reply(key: str, model: BaseModel | list[BaseModel]) -> Response:
+        if isinstance(model, list):
+            return Response(HTTPStatus.OK, json={key: [item.model_dump(mode="json", by_alias=True) for item in model]})
+
+        return Response(HTTPStatus.OK, json={key: model.model_dump(mode="json", by_alias=True)})
+
+    @staticmethod
+    def reply_null() -> Response:
+        # Удаление отвечает телом null, как FastAPI (httpx.Response(json=None) дал бы пустое тело)
+        return Response(HTTPStatus.OK, content=b"null", headers={"Content-Type": "application/json"})
+
+    @staticmethod
+    def get_or_404(storage: dict[str, ModelT], key: str, name: str) -> ModelT:
+        if (item := storage.get(key)) is None:
+            raise StandInError(HTTPStatus.NOT_FOUND, f"{name} not found")
+
+        return item
+
+    @staticmethod
+    def updated(model: ModelT, request: BaseModel) -> ModelT:
+        return model.model_copy(update=request.model_dump(exclude_none=True))
+
+    def build_course(self, course: CourseSchema) -> CourseSchema:
+        # Вложенные файл и пользователь отдаются в актуальном состоянии, как при JOIN в базе
+        preview_file = self.files.get(course.preview_file.id)
+        return course.model_copy(update={
+            "preview_file": preview_file.file if preview_file else course.preview_file,
+            "created_by_user": self.users.get(course.created_by_user.id, course.created_by_user)
+        })
+
+    # ----- пользователи и аутентификация -----
+
+    def create_user(self, request: StandInRequest) -> Response:
+        body = validate(CreateUserSchema, self.json_body(request), "body")
+        if body.email in self.emails:
+            raise StandInError(HTTPStatus.CONFLICT, "User with this email already exists")
+
+        user = UserSchema(id=str(uuid.uuid4()), **body.model_dump(exclude={"password"}))
+        self.users[user.id] = user
+        self.passwords[user.id] = body.password
+        self.emails[user.email] = user.id
+        return self.reply("user", user)
+
+    def get_user_me(self, request: StandInRequest) -> Response:
+        return self.reply("user", request.user)
+
+    def get_user(self, request: StandInRequest) -> Response:
+        path = validate(UserPathSchema, request.path, "path")
+        return self.reply("user", self.get_or_404(self.users, str(path.user_id), "User"))
+
+    def update_user(self, request: StandInRequest) -> Response:
+        path = validate(UserPathSchema, request.path, "path")
+        body = validate(UpdateUserSchema, self.json_body(request), "body")
+        current = self.get_or_404(self.users, str(path.user_id), "User")
+        if body.email and body.email != current.email and body.email in self.emails:
+            raise StandInError(HTTPStatus.CONFLICT, "User with this email already exists")
+
+        user = self.updated(current, body)
+        self.emails.pop(current.email, None)
+        self.emails[user.email] = user.id
+        self.users[user.id] = user
+        return self.reply("user", user)
+
+    def delete_user(self, request: StandInRequest) -> Response:
+        path = validate(UserPathSchema, request.path, "path")
+        user = self.get_or_404(self.users, str(path.user_id), "User")
+        del self.users[user.id], self.passwords[user.id], self.emails[user.email]
+        return self.reply_null()
+
+    def login(self, request: StandInRequest) -> Response:
+        body = validate(LoginSchema, self.json_body(request), "body")
+        user = self.users.get(self.emails.get(body.email, ""))
+        if user is None or not hmac.compare_digest(self.passwords[user.id], body.password):
+            raise StandInError(HTTPStatus.UNAUTHORIZED, "Wrong email or password")
+
+        return self.issue_tokens(user)
+
+    def refresh(self, request: StandInRequest) -> Response:
+        body = validate(RefreshSchema, self.json_body(request), "body")
+        if (user := self.verify_token(body.refresh_token, "refresh")) is None:
+            raise StandInError(HTTPStatus.UNAUTHORIZED, "Invalid refresh token")
+
+        return self.issue_tokens(user)
+
+    # ----- файлы -----
+
+    def create_file(self, request: StandInRequest) -> Response:
+        fields, files = parse_multipart(request.request)
+        body = validate(CreateFileSchema, fields, "body")
+        if "upload_file" not in files:
+            raise StandInError(HTTPStatus.UNPROCESSABLE_ENTITY, [
+                {"type": "missing", "loc": ["body", "upload_file"], "msg": "Field required", "input": None}
+            ])
+
+        _, content = files["upload_file"]
+        file = FileSchema(
+            id=str(uuid.uuid4()),
+            url=f"{request.base_url}static/{body.directory}/{body.filename}",
+            filename=body.filename,
+            directory=body.directory
+        )
+        self.files[file.id] = StoredFile(file=file, content=content if self.keep_file_content else None)
+        self.static[f"{body.directory}/{body.filename}"] = file.id
+        return self.reply("file", file)
+
+    def get_file(self, request: StandInRequest) -> Response:
+        path = validate(FilePathSchema, request.path, "path")
+        return self.reply("file", self.get_or_404(self.files, str(path.file_id), "File").file)
+
+    def delete_file(self, request: StandInRequest) -> Response:
+        path = validate(FilePathSchema, request.path, "path")
+        stored = self.get_or_404(self.files, str(path.file_id), "File")
+        del self.files[stored.file.id]
+        self.static.pop(f"{stored.file.directory}/{stored.file.filename}", None)
+        return self.reply_null()
+
+    def get_static_file(self, request: StandInRequest) -> Response:
+        stored = self.files.get(self.static.get(request.path["path"], ""))
+        if stored is None or stored.content is None:
+            raise StandInError(HTTPStatus.NOT_FOUND, "Not Found")
+
+        content_type = mimetypes.guess_type(stored.file.filename)[0] or "application/octet-stream"
+        return Response(HTTPStatus.OK, content=stored.content, headers={"Content-Type": content_type})
+
+    # ----- курсы -----
+
+    def get_courses(self, request: StandInRequest) -> Response:
+        query = validate(GetCoursesQuerySchema, dict(request.query), "query")
+        user_id = str(query.user_id)
+        courses = [self.build_course(course) for course in self.courses.values() if course.created_by_user.id == user_id]
+        return self.reply("courses", courses)
+
+    def create_course(self, request: StandInRequest) -> Response:
+        body = validate(CreateCourseSchema, self.json_body(request), "body")
+        preview_file = self.get_or_404(self.files, str(body.preview_file_id), "File").file
+        created_by_user = self.get_or_404(self.users, str(body.created_by_user_id), "User")
+
+        course = CourseSchema(
+            id=str(uuid.uuid4()),
+            preview_file=preview_file,
+            created_by_user=created_by_user,
+            **body.model_dump(exclude={"preview_file_id", "created_by_user_id"})
+        )
+        self.courses[course.id] = course
+        return self.reply("course", course)
+
+    def get_course(self, request: StandInRequest) -> Response:
+        path = validate(CoursePathSchema, request.path, "path")
+        return self.reply("course", self.build_course(self.get_or_404(self.courses, str(path.course_id), "Course")))
+
+    def update_course(self, request: StandInRequest) -> Response:
+        path = validate(CoursePathSchema, request.path, "path")
+        body = validate(UpdateCourseSchema, self.json_body(request), "body")
+        course = self.updated(self.get_or_404(self.courses, str(path.course_id), "Course"), body)
+        self.courses[course.id] = course
+        return self.reply("course", self.build_course(course))
+
+    def delete_course(self, request: StandInRequest) -> Response:
+        path = validate(CoursePathSchema, request.path, "path")
+        del self.courses[self.get_or_404(self.courses, str(path.course_id), "Course").id]
+        return self.reply_null()
+
+    # ----- задания -----
+
+    def get_exercises(self, request: StandInRequest) -> Response:
+        query = validate(GetExercisesQuerySchema, dict(request.query), "query")
+        course_id = str(query.course_id)
+        return self.reply("exercises", [exercise for exercise in self.exercises.values() if exercise.course_id == course_id])
+
+    def create_exercise(self, request: StandInRequest) -> Response:
+        body = validate(CreateExerciseSchema, self.json_body(request), "body")
+        self.get_or_404(self.courses, str(body.course_id), "Course")
+
+        exercise = ExerciseSchema(id=str(uuid.uuid4()), **body.model_dump(mode="json"))
+        self.exercises[exercise.id] = exercise
+        return self.reply("exercise", exercise)
+
+    def get_exercise(self, request: StandInRequest) -> Response:
+        path = validate(ExercisePathSchema, request.path, "path")
+        return self.reply("exercise", self.get_or_404(self.exercises, str(path.exercise_id), "Exercise"))
+
+    def update_exercise(self, request: StandInRequest) -> Response:
+        path = validate(ExercisePathSchema, request.path, "path")
+        body = validate(UpdateExerciseSchema, self.json_body(request), "body")
+        exercise = self.updated(self.get_or_404(self.exercises, str(path.exercise_id), "Exercise"), body)
+        self.exercises[exercise.id] = exercise
+        return self.reply("exercise", exercise)
+
+    def delete_exercise(self, request: StandInRequest) -> Response:
+        path = validate(ExercisePathSchema, request.path, "path")
+        del self.exercises[self.get_or_404(self.exercises, str(path.exercise_id), "Exercise").id]
+        return self.reply_null()
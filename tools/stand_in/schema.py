@@ -0,0 +1,103 @@
+"""
+Схемы запросов, которые проверяет stand-in сервер.
+
+В отличие от схем клиентов (clients/*/..._schema.py), здесь нет значений по умолчанию из fake: сервер не дополняет
+запрос случайными данными, а отвечает 422 с ошибками в формате FastAPI.
+"""
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+
+class StandInRequestSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CreateUserSchema(StandInRequestSchema):
+    email: EmailStr
+    password: str = Field(min_length=1)
+    last_name: str = Field(alias="lastName", min_length=1)
+    first_name: str = Field(alias="firstName", min_length=1)
+    middle_name: str = Field(alias="middleName", min_length=1)
+
+
+class UpdateUserSchema(StandInRequestSchema):
+    email: EmailStr | None = None
+    last_name: str | None = Field(default=None, alias="lastName", min_length=1)
+    first_name: str | None = Field(default=None, alias="firstName", min_length=1)
+    middle_name: str | None = Field(default=None, alias="middleName", min_length=1)
+
+
+class LoginSchema(StandInRequestSchema):
+    email: str
+    password: str
+
+
+class RefreshSchema(StandInRequestSchema):
+    refresh_token: str = Field(alias="refreshToken")
+
+
+class CreateFileSchema(StandInRequestSchema):
+    filename: str = Field(min_length=1)
+    directory: str = Field(min_length=1)
+
+
+class CreateCourseSchema(StandInRequestSchema):
+    title: str = Field(min_length=1)
+    max_score: int = Field(alias="maxScore")
+    min_score: int = Field(alias="minScore")
+    description: str
+    estimated_time: str = Field(alias="estimatedTime")
+    preview_file_id: UUID = Field(alias="previewFileId")
+    created_by_user_id: UUID = Field(alias="createdByUserId")
+
+
+class UpdateCourseSchema(StandInRequestSchema):
+    title: str | None = Field(default=None, min_length=1)
+    max_score: int | None = Field(default=None, alias="maxScore")
+    min_score: int | None = Field(default=None, alias="minScore")
+    description: str | None = None
+    estimated_time: str | None = Field(default=None, alias="estimatedTime")
+
+
+class CreateExerciseSchema(StandInRequestSchema):
+    title: str = Field(min_length=1)
+    course_id: UUID = Field(alias="courseId")
+    max_score: int = Field(alias="maxScore")
+    min_score: int = Field(alias="minScore")
+    order_index: int = Field(alias="orderIndex")
+    description: str
+    estimated_time: str = Field(alias="estimatedTime")
+
+
+class UpdateExerciseSchema(StandInRequestSchema):
+    title: str | None = Field(default=None, min_length=1)
+    max_score: int | None = Field(default=None, alias="maxScore")
+    min_score: int | None = Field(default=None, alias="minScore")
+    order_index: int | None = Field(default=None, alias="orderIndex")
+    description: str | None = None
+    estimated_time: str | None = Field(default=None, alias="estimatedTime")
+
+
+class GetCoursesQuerySchema(StandInRequestSchema):
+    user_id: UUID = Field(alias="userId")
+
+
+class GetExercisesQuerySchema(StandInRequestSchema):
+    course_id: UUID = Field(alias="courseId")
+
+
+class UserPathSchema(StandInRequestSchema):
+    user_id: UUID
+
+
+class FilePathSchema(StandInRequestSchema):
+    file_id: UUID
+
+
+class CoursePathSchema(StandInRequestSchema):
+    course_id: UUID
+
+
+class ExercisePathSchema(StandInRequestSchema):
+    exercise_id: UUID
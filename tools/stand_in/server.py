@@ -0,0 +1,81 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from httpx import Request
+
+from tools.stand_in.app import StandInApp
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    """
+    Переводит HTTP запрос из сокета в httpx.Request, передает его в StandInApp и пишет ответ обратно.
+    """
+    server: "StandInHTTPServer"
+    protocol_version = "HTTP/1.1"  # keep-alive, как у настоящего сервиса
+    disable_nagle_algorithm = True  # иначе заголовки и тело ответа ждут delayed ACK клиента (~40 мс на запрос)
+
+    def read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()  # \r\n после куска
+            self.rfile.readline()  # \r\n после последнего куска
+            return b"".join(chunks)
+
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def handle_request(self):
+        body = self.read_body()
+        host = self.headers.get("Host") or f"{self.server.server_address[0]}:{self.server.server_port}"
+        headers = [(name, value) for name, value in self.headers.items() if name.lower() != "transfer-encoding"]
+        response = self.server.app.handle_request(
+            Request(self.command, f"http://{host}{self.path}", headers=headers, content=body)
+        )
+
+        self.send_response(response.status_code)
+        for name, value in response.headers.multi_items():
+            if name.lower() not in ("content-length", "transfer-encoding"):
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.content)))  # без длины клиент ждал бы закрытия соединения
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = handle_request
+
+    def log_message(self, format, *args):
+        pass  # stand-in сервер не пишет лог на каждый запрос
+
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    """
+    Локальный HTTP сервер с StandInApp: каждый запрос обрабатывается в отдельном потоке.
+    """
+    daemon_threads = True
+    request_queue_size = 128  # при очереди по умолчанию (5) одновременные подключения ждут повтора SYN около секунды
+
+    def __init__(self, app: StandInApp, host: str = "127.0.0.1", port: int = 0):
+        """
+        :param app: приложение, обрабатывающее запросы
+        :param host: адрес, на котором слушает сервер
+        :param port: порт (0 — любой свободный)
+        """
+        super().__init__((host, port), StandInRequestHandler)
+        self.app = app
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_port}"
+
+    def start(self) -> "StandInHTTPServer":
+        """
+        Запускает обработку запросов в фоновом потоке.
+
+        :return: сервер (для цепочки вызовов)
+        """
+        threading.Thread(target=self.serve_forever, name="stand-in-server", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,140 @@
+import itertools
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Generic, Iterator, TypeVar
+
+from tools.logger import get_logger
+
+
+
+logger = get_logger("USERS_POOL")
+
+UserT = TypeVar("UserT")
+
+
+class UserLeaseMode(str, Enum):
+    SHARED = "shared"  # пользователь общий для всех тестов воркера: тест не меняет его состояние
+    EXCLUSIVE = "exclusive"  # пользователь выдается одному тесту и возвращается в пул (или выводится из него) после теста
+
+    def __str__(self):
+        return self.value
+
+
+class UsersPool(Generic[UserT]):
+    """
+    Пул заранее созданных и залогиненных пользователей одного воркера.
+
+    Общие (shared) пользователи выдаются по кругу и никогда не выдаются эксклюзивно, поэтому тест
+    с эксклюзивной арендой получает пользователя, которого не трогали тесты с общей арендой.
+    """
+
+    def __init__(self, create_user: Callable[[], UserT], shared_size: int, exclusive_size: int, workers: int):
+        """
+        :param create_user: функция, создающая пользователя (и выполняющая логин)
+        :param shared_size: сколько общих пользователей создать заранее
+        :param exclusive_size: сколько пользователей для эксклюзивной аренды создать заранее
+        :param workers: сколько пользователей создавать параллельно
+        """
+        self.create_user = create_user
+        self.shared_size = shared_size
+        self.exclusive_size = exclusive_size
+        self.workers = workers
+
+        self.lock = threading.Lock()
+        self.shared: list[UserT] = []
+        self.free: deque[UserT] = deque()
+        self.shared_counter = itertools.count()
+        self.created = 0
+        self.retired = 0
+
+    def fill(self):
+        """
+        Параллельно создает всех пользователей пула.
+        """
+        size = self.shared_size + self.exclusive_size
+        if size <= 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, size)), thread_name_prefix="users-pool") as executor:
+            users = list(executor.map(lambda _: self.create_user(), range(size)))
+
+        with self.lock:
+            self.created += size
+            self.shared.extend(users[:self.shared_size])
+            self.free.extend(users[self.shared_size:])
+
+        logger.info("Создано пользователей в пуле: %s общих, %s для эксклюзивной аренды", self.shared_size, self.exclusive_size)
+
+    def new_user(self) -> UserT:
+        """
+        :return: новый пользователь, созданный вне заранее заполненного пула
+        """
+        user = self.create_user()
+        with self.lock:
+            self.created += 1
+
+        return user
+
+    def get_shared(self, key: str | None = None) -> UserT:
+        """
+        :param key: ключ выбора (например, nodeid теста): пользователь выбирается по нему, а не по кругу,
+        и не зависит от порядка тестов (нужно для кассет)
+        :return: общий пользователь; если общих пользователей нет, он создается
+        """
+        with self.lock:
+            shared = list(self.shared)
+
+        if not shared:
+            user = self.new_user()
+            with self.lock:
+                self.shared.append(user)
+            return user
+
+        index = zlib.crc32(key.encode()) if key is not None else next(self.shared_counter)
+        return shared[index % len(shared)]
+
+    @contextmanager
+    def lease(
+            self,
+            mode: UserLeaseMode | str = UserLeaseMode.SHARED,
+            retire: bool = False,
+            key: str | None = None
+    ) -> Iterator[UserT]:
+        """
+        Выдает пользователя из пула на время теста.
+
+        :param mode: shared — общий пользователь, exclusive — пользователь только для этого теста
+        :param retire: для exclusive: не возвращать пользователя в пул после теста (тест изменил его состояние)
+        :param key: для shared: ключ выбора пользователя (см. get_shared)
+        """
+        mode = UserLeaseMode(mode)
+        if mode is UserLeaseMode.SHARED:
+            yield self.get_shared(key)
+            return
+
+        with self.lock:
+            user = self.free.popleft() if self.free else None
+
+        if user is None:
+            logger.info("Свободных пользователей в пуле нет, создаем нового")
+            user = self.new_user()
+
+        try:
+            yield user
+        finally:
+            with self.lock:
+                if retire:
+                    self.retired += 1
+                else:
+                    self.free.append(user)
+
+    def stats(self) -> str:
+        """
+        :return: строка со статистикой пула для лога
+        """
+        with self.lock:
+            return f"создано: {self.created}, общих: {len(self.shared)}, свободных: {len(self.free)}, выведено: {self.retired}"